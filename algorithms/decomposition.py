@@ -0,0 +1,59 @@
+import functools
+from concurrent.futures import ProcessPoolExecutor
+from typing import Callable, Dict, Optional
+
+# componentele mai mici se rezolvă direct, un proces nou costă mai mult decât căutarea lor
+PARALLEL_MIN_NODES = 2000
+
+
+def solve_by_components(problem, func: Callable, *args, max_workers: Optional[int] = None,
+                        **kwargs) -> Optional[Dict[int, int]]:
+    """
+    Run `func` separately on every connected component of a GraphColoringProblem and merge
+    the colorings. Components never constrain each other, so this replaces a search over
+    the product of their state spaces by one search per component. Isolated nodes keep
+    their prefilled color or get color 0. When at least two components have
+    PARALLEL_MIN_NODES nodes or more, those are solved in a process pool.
+    Returns None as soon as one component has no solution.
+    """
+    comps = problem.components()
+    if len(comps) <= 1:
+        return func(problem, *args, **kwargs)
+
+    prefilled = problem.prefilled if isinstance(problem.prefilled, dict) else {}
+    merged: Dict[int, int] = {}
+    subs = []
+    for comp in comps:
+        if len(comp) == 1:
+            merged[comp[0]] = prefilled.get(comp[0], 0)
+        else:
+            subs.append(problem.subproblem(comp))
+
+    big = [sub for sub in subs if len(sub.nodes) >= PARALLEL_MIN_NODES]
+    pool = ProcessPoolExecutor(max_workers) if len(big) > 1 else None
+    try:
+        futures = [pool.submit(func, sub, *args, **kwargs) for sub in big] if pool else []
+        for sub in subs:
+            if pool is not None and len(sub.nodes) >= PARALLEL_MIN_NODES:
+                continue
+            res = func(sub, *args, **kwargs)
+            if res is None:
+                return None
+            merged.update(res)
+        for future in futures:
+            res = future.result()
+            if res is None:
+                return None
+            merged.update(res)
+    finally:
+        if pool is not None:
+            pool.shutdown(wait=False, cancel_futures=True)
+    return merged
+
+
+def by_components(func: Callable) -> Callable:
+    """Wrap a search algorithm so that it runs per connected component (same signature)."""
+    @functools.wraps(func)
+    def run(problem, *args, **kwargs):
+        return solve_by_components(problem, func, *args, **kwargs)
+    return run
@@ -1,15 +1,18 @@
 import heapq
+import itertools
 import random
 import math
 from typing import Any
 
 def greedy(problem, max_nodes=100000):
     start = problem.initial_state()
-    pq = [(problem.heuristic(start), start)]
+    # contorul departajează egalitățile fără a compara stările (dict-urile nu sunt ordonabile)
+    tie = itertools.count()
+    pq = [(problem.cost_to_go(start), next(tie), start)]
     visited = set()
     nodes_explored = 0
     while pq and nodes_explored < max_nodes:
-        h, state = heapq.heappop(pq)
+        h, _, state = heapq.heappop(pq)
         if repr(state) in visited:
             continue
         visited.add(repr(state))
@@ -18,7 +21,7 @@ def greedy(problem, max_nodes=100000):
             return state
         for neigh, _ in problem.successors(state):
             if repr(neigh) not in visited:
-                heapq.heappush(pq, (problem.heuristic(neigh), neigh))
+                heapq.heappush(pq, (problem.cost_to_go(neigh), next(tie), neigh))
     return None
 
 def hill_climbing(problem, max_steps=10000):
@@ -90,11 +93,13 @@ def a_star(problem, max_nodes=100000):
     start = problem.initial_state()
     came_from = {}
     d = {repr(start): 0.0}
-    f = {repr(start): problem.heuristic(start)}
-    pq = [(f[repr(start)], start)]
+    f = {repr(start): problem.cost_to_go(start)}
+    tie = itertools.count()
+    # la f egal preferăm h mai mic (nodul mai adânc)
+    pq = [(f[repr(start)], f[repr(start)], next(tie), start)]
     visited = set()
-    while pq:
-        _, state = heapq.heappop(pq)
+    while pq and len(visited) < max_nodes:
+        _, _, _, state = heapq.heappop(pq)
         key = repr(state)
         if key in visited:
             continue
@@ -106,7 +111,8 @@ def a_star(problem, max_nodes=100000):
             nd = d[key] + cost
             if nk not in d or nd < d[nk]:
                 d[nk] = nd
-                f[nk] = nd + problem.heuristic(neigh)
+                h = problem.cost_to_go(neigh)
+                f[nk] = nd + h
                 came_from[nk] = state
-                heapq.heappush(pq, (f[nk], neigh))
+                heapq.heappush(pq, (f[nk], h, next(tie), neigh))
     return None
@@ -1,62 +1,231 @@
+from array import array
 from collections import deque
 import heapq
+import itertools
 from typing import Any, Dict, Iterable, Tuple, List, Callable, Optional, Set
 import math
 
+# peste aceste limite structurile dense ar ocupa prea multă memorie și revenim la set/dict de repr
+BITSET_MAX_STATES = 1 << 28
+DENSE_TABLE_MAX_STATES = 1 << 24
+# bitset-ul are un bit pe stare (32 MB la limită), deci se alege după numărul de stări; tabelele dense
+# au 4-8 octeți pe stare și se alocă integral de la început, deci le folosim doar când spațiul nu e mult
+# mai mare decât bugetul căutării: intrarea lor bate intrarea de dict până la ~16 stări pe nod vizitat
+DENSE_TABLE_NODES_FACTOR = 16
 
-def bfs(problem, max_nodes: int = 10_000):
+
+def _enumerable_size(problem, limit: int, max_nodes: Optional[int] = None, factor: int = 1) -> Optional[int]:
+    size_fn = getattr(problem, "num_states", None)
+    size = size_fn() if callable(size_fn) else None
+    if size is None or size > limit:
+        return None
+    if max_nodes is not None and size > factor * max_nodes:
+        return None
+    return size
+
+
+class ReprVisited:
+    """Visited set keyed by repr(state), for state spaces without a perfect index."""
+
+    def __init__(self):
+        self._keys: Set[str] = set()
+
+    def __contains__(self, state) -> bool:
+        return repr(state) in self._keys
+
+    def add(self, state) -> None:
+        self._keys.add(repr(state))
+
+    def __len__(self) -> int:
+        return len(self._keys)
+
+
+class BitsetVisited:
+    """Visited set over problem.state_index(): one bit per state of the enumerable space."""
+
+    def __init__(self, problem, size: int):
+        self._index = problem.state_index
+        self._bits = bytearray((size + 7) >> 3)
+        self._count = 0
+
+    def __contains__(self, state) -> bool:
+        i = self._index(state)
+        return (self._bits[i >> 3] >> (i & 7)) & 1 == 1
+
+    def add(self, state) -> None:
+        i = self._index(state)
+        mask = 1 << (i & 7)
+        if not self._bits[i >> 3] & mask:
+            self._bits[i >> 3] |= mask
+            self._count += 1
+
+    def __len__(self) -> int:
+        return self._count
+
+
+def visited_set(problem):
+    size = _enumerable_size(problem, BITSET_MAX_STATES)
+    if size is None:
+        return ReprVisited()
+    return BitsetVisited(problem, size)
+
+
+class ReprCostTable:
+    def __init__(self):
+        self._d: Dict[str, float] = {}
+
+    def get(self, state) -> float:
+        return self._d.get(repr(state), math.inf)
+
+    def set(self, state, value: float) -> None:
+        self._d[repr(state)] = value
+
+
+class DenseCostTable:
+    """g-values in a flat array('d') indexed by problem.state_index()."""
+
+    def __init__(self, problem, size: int):
+        self._index = problem.state_index
+        self._d = array('d', [math.inf]) * size
+
+    def get(self, state) -> float:
+        return self._d[self._index(state)]
+
+    def set(self, state, value: float) -> None:
+        self._d[self._index(state)] = value
+
+
+def cost_table(problem, max_nodes: Optional[int] = None):
+    size = _enumerable_size(problem, DENSE_TABLE_MAX_STATES, max_nodes, DENSE_TABLE_NODES_FACTOR)
+    if size is None:
+        return ReprCostTable()
+    return DenseCostTable(problem, size)
+
+
+class ReprParentTable:
+    """Parent of every reached state, keyed by repr(state); the start is its own parent."""
+
+    def __init__(self, problem):
+        self._d: Dict[str, Any] = {}
+
+    def __contains__(self, state) -> bool:
+        return repr(state) in self._d
+
+    def set(self, state, parent) -> None:
+        self._d[repr(state)] = parent
+
+    def path(self, state) -> List[Any]:
+        """States from the start to `state`, which must have been reached."""
+        path = [state]
+        parent = self._d[repr(state)]
+        while repr(parent) != repr(path[-1]):
+            path.append(parent)
+            parent = self._d[repr(parent)]
+        path.reverse()
+        return path
+
+
+class DenseParentTable:
+    """
+    Parents as problem.state_index() values in a flat array (-1 = not reached), 4 bytes per
+    state when the indices fit; path() rebuilds the states with problem.index_state().
+    """
+
+    def __init__(self, problem, size: int):
+        self._index = problem.state_index
+        self._state = problem.index_state
+        self._p = array('i' if size <= 1 << 31 else 'q', [-1]) * size
+
+    def __contains__(self, state) -> bool:
+        return self._p[self._index(state)] >= 0
+
+    def set(self, state, parent) -> None:
+        self._p[self._index(state)] = self._index(parent)
+
+    def path(self, state) -> List[Any]:
+        i = self._index(state)
+        indices = [i]
+        while self._p[i] != i:
+            i = self._p[i]
+            indices.append(i)
+        return [self._state(i) for i in reversed(indices)]
+
+
+def parent_table(problem, max_nodes: Optional[int] = None):
+    size = _enumerable_size(problem, DENSE_TABLE_MAX_STATES, max_nodes, DENSE_TABLE_NODES_FACTOR)
+    if size is None:
+        return ReprParentTable(problem)
+    return DenseParentTable(problem, size)
+
+
+def bfs(problem, max_nodes: int = 10_000, return_path: bool = False):
+    """Goal state, or with return_path the shortest list of states from the start to it."""
     start = problem.initial_state()
     q = deque([start])
-    visited = set()
-    def key(s): return repr(s)
+    visited = visited_set(problem)
+    parents = parent_table(problem, max_nodes) if return_path else None
+    if parents is not None:
+        parents.set(start, start)
     while q and len(visited) < max_nodes:
         state = q.popleft()
-        if key(state) in visited:
+        if state in visited:
             continue
-        visited.add(key(state))
+        visited.add(state)
         if problem.is_goal(state):
-            return state
+            return parents.path(state) if parents is not None else state
         for neigh, _ in problem.successors(state):
-            if key(neigh) not in visited:
+            if neigh not in visited:
+                # prima descoperire vine de pe nivelul cel mai mic, deci drumul rămâne cel mai scurt
+                if parents is not None and neigh not in parents:
+                    parents.set(neigh, state)
                 q.append(neigh)
     return None
 
-def dfs(problem, max_nodes: int = 10_000):
+def dfs(problem, max_nodes: int = 10_000, return_path: bool = False):
+    """Goal state, or with return_path the list of states from the start to it."""
     start = problem.initial_state()
-    stack = [start]
-    visited = set()
-    def key(s): return repr(s)
+    stack = [(start, start)]
+    visited = visited_set(problem)
+    parents = parent_table(problem, max_nodes) if return_path else None
     while stack and len(visited) < max_nodes:
-        state = stack.pop()
-        if key(state) in visited:
+        state, parent = stack.pop()
+        if state in visited:
             continue
-        visited.add(key(state))
+        visited.add(state)
+        if parents is not None:
+            parents.set(state, parent)
         if problem.is_goal(state):
-            return state
+            return parents.path(state) if parents is not None else state
         for neigh, _ in problem.successors(state):
-            if key(neigh) not in visited:
-                stack.append(neigh)
+            if neigh not in visited:
+                stack.append((neigh, state))
     return None
 
-def uniform_cost(problem, max_nodes: int = 100000):
+def uniform_cost(problem, max_nodes: int = 100000, return_path: bool = False):
+    """Cheapest goal state, or with return_path the cheapest list of states from the start to it."""
     start = problem.initial_state()
-    d = {repr(start): 0.0}
-    pq = [(0.0, start)]
-    visited = set()
+    d = cost_table(problem, max_nodes)
+    d.set(start, 0.0)
+    tie = itertools.count()
+    pq = [(0.0, next(tie), start)]
+    visited = visited_set(problem)
+    parents = parent_table(problem, max_nodes) if return_path else None
+    if parents is not None:
+        parents.set(start, start)
     while pq:
-        dist, state = heapq.heappop(pq)
-        key = repr(state)
-        if key in visited:
+        dist, _, state = heapq.heappop(pq)
+        if state in visited:
             continue
-        visited.add(key)
+        visited.add(state)
         if problem.is_goal(state):
-            return state
+            return parents.path(state) if parents is not None else state
         for neigh, cost in problem.successors(state):
-            nk = repr(neigh)
             nd = dist + cost
-            if nk not in d or nd < d[nk]:
-                d[nk] = nd
-                heapq.heappush(pq, (nd, neigh))
+            if nd < d.get(neigh):
+                d.set(neigh, nd)
+                if parents is not None:
+                    parents.set(neigh, state)
+                heapq.heappush(pq, (nd, next(tie), neigh))
     return None
 
 def iddfs(problem, max_depth=20):
@@ -0,0 +1,299 @@
+import random
+from functools import lru_cache
+from typing import Dict, List, Optional, Sequence, Tuple
+
+MAX_RETRIES = 20
+BLOCK_MAX_NODES = 20_000
+BLOCK_RETRIES = 5
+
+KNIGHT_MOVES = [(2, 1), (1, 2), (-1, 2), (-2, 1), (-2, -1), (-1, -2), (1, -2), (2, -1)]
+
+
+def warnsdorff(problem, max_nodes: int = 5_000_000):
+    """
+    Warnsdorff's rule for KnightsTourProblem: always jump to the square with the fewest
+    onward moves, breaking ties by distance from the center (farthest first, Roth's rule).
+    A dead end triggers a retry with random tie-breaking, up to MAX_RETRIES attempts; if all
+    of them fail, large boards fall back to `divide_and_conquer_tour`.
+    Returns a full tour accepted by problem.validate_solution, or None.
+    """
+    if problem.__class__.__name__ != 'KnightsTourProblem':
+        return None
+
+    prefix = [tuple(p) for p in problem.initial_state()]
+    tour = _warnsdorff_with_retries(problem, prefix, max_nodes)
+    if tour is None and len(prefix) == 1:
+        tour = divide_and_conquer_tour(problem.n, prefix[0])
+
+    if tour is None or len(tour) != problem.total:
+        return None
+    ok, _ = problem.validate_solution(tour)
+    return tour if ok else None
+
+
+def _warnsdorff_with_retries(problem, prefix: List[tuple], max_nodes: int) -> Optional[List[tuple]]:
+    n = problem.n
+    neighbors = problem.neighbors
+    center = (n - 1) / 2.0
+    roth = [-((r - center) ** 2 + (c - center) ** 2) for r, c in problem.coords]
+    rng = random.Random(0)
+    nodes = 0
+
+    for attempt in range(MAX_RETRIES):
+        tiebreak = roth if attempt == 0 else [rng.random() for _ in range(problem.total)]
+        visited = bytearray(problem.total)
+        degree = bytearray(len(nb) for nb in neighbors)
+        path = []
+        for r, c in prefix:
+            sq = r * n + c
+            visited[sq] = 1
+            path.append(sq)
+            for t in neighbors[sq]:
+                degree[t] -= 1
+
+        cur = path[-1]
+        while len(path) < problem.total and nodes < max_nodes:
+            nodes += 1
+            best = -1
+            best_key = None
+            for t in neighbors[cur]:
+                if not visited[t]:
+                    key = (degree[t], tiebreak[t])
+                    if best_key is None or key < best_key:
+                        best, best_key = t, key
+            if best < 0:
+                break
+            cur = best
+            visited[cur] = 1
+            path.append(cur)
+            for t in neighbors[cur]:
+                degree[t] -= 1
+
+        if len(path) == problem.total:
+            return [problem.coords[sq] for sq in path]
+        if nodes >= max_nodes:
+            break
+    return None
+
+
+# -------- Divide and conquer --------
+
+def _split_sizes(n: int, even_count: bool) -> Optional[List[int]]:
+    """
+    Split n into parts of 6 and as few 8s (then 10s) as possible, plus one trailing 7 (or 9)
+    when n is odd (two 7s or 9s if that is the only way to get an even number of parts). Blocks with both sides
+    odd then only appear once, at the bottom-right corner, where their majority color is
+    the color every odd-board tour has to start from.
+    """
+    tails = [[7], [9]] if n % 2 else [[], [7, 7], [9, 9]]
+    for tens in range(0, 4):
+        for tail in tails:
+            rest = n - sum(tail) - 10 * tens
+            for eights in range(0, 8):
+                sixes, r = divmod(rest - 8 * eights, 6)
+                if sixes < 0 or r:
+                    continue
+                count = sixes + eights + tens + len(tail)
+                if count >= 2 and (not even_count or count % 2 == 0):
+                    return [6] * sixes + [8] * eights + [10] * tens + tail
+    return None
+
+
+def _block_cycle(rows: int, cols: int) -> List[Tuple[int, int]]:
+    """Hamiltonian cycle over a rows x cols grid of blocks (rows even, cols >= 2)."""
+    order = [(0, j) for j in range(cols)]
+    for i in range(1, rows):
+        js = range(cols - 1, 0, -1) if i % 2 else range(1, cols)
+        order.extend((i, j) for j in js)
+    order.extend((i, 0) for i in range(rows - 1, 0, -1))
+    return order
+
+
+@lru_cache(maxsize=None)
+def _local_neighbors(h: int, w: int) -> Tuple[Tuple[int, ...], ...]:
+    return tuple(
+        tuple((r + dr) * w + (c + dc) for dr, dc in KNIGHT_MOVES if 0 <= r + dr < h and 0 <= c + dc < w)
+        for r in range(h) for c in range(w)
+    )
+
+
+def _block_path(h: int, w: int, entry: int, exits: frozenset, toward: Optional[Tuple[int, int]],
+                seed: int) -> Optional[List[int]]:
+    """
+    Hamiltonian knight path on an h x w block from `entry` ending in `exits` (any square if empty).
+    Depth-first Warnsdorff search with dead-end pruning: ties go to squares farther from the
+    side the path must leave through, so the exit region tends to be visited last.
+    """
+    # un salt schimbă culoarea: cu număr par de pătrate capătul are culoarea opusă intrării,
+    # cu număr impar ambele capete sunt pe culoarea majoritară (cea a colțului (0, 0))
+    color = (entry // w + entry % w) % 2
+    if (h * w) % 2:
+        if color:
+            return None
+        exits = frozenset(x for x in exits if (x // w + x % w) % 2 == 0)
+    else:
+        exits = frozenset(x for x in exits if (x // w + x % w) % 2 != color)
+    if toward is not None and not exits:
+        return None
+
+    total = h * w
+    neighbors = _local_neighbors(h, w)
+    if toward is None:
+        far = [0.0] * total
+    else:
+        dr, dc = toward
+        far = [-(r * dr + c * dc) for r in range(h) for c in range(w)]
+    rng = random.Random(seed)
+    noise = [rng.random() * 0.5 if seed else 0.0 for _ in range(total)]
+    tiebreak = [f + x for f, x in zip(far, noise)]
+
+    visited = bytearray(total)
+    degree = bytearray(len(nb) for nb in neighbors)
+    path = [entry]
+    visited[entry] = 1
+    for t in neighbors[entry]:
+        degree[t] -= 1
+    nodes = 0
+
+    def feasible(cur: int) -> bool:
+        # un pătrat nevizitat care nu mai poate fi intrat și părăsit trebuie să fie capătul drumului
+        near = neighbors[cur]
+        end = -1
+        for v in range(total):
+            if visited[v]:
+                continue
+            d = degree[v] + (1 if v in near else 0)
+            if d == 0:
+                return len(path) == total - 1
+            if d == 1:
+                if end >= 0:
+                    return False
+                end = v
+        return end < 0 or not exits or end in exits
+
+    def dfs(cur: int) -> bool:
+        nonlocal nodes
+        if len(path) == total:
+            return not exits or cur in exits
+        nodes += 1
+        if nodes > BLOCK_MAX_NODES or not feasible(cur):
+            return False
+        candidates = [t for t in neighbors[cur] if not visited[t]]
+        candidates.sort(key=lambda t: (degree[t], tiebreak[t]))
+        for t in candidates:
+            visited[t] = 1
+            path.append(t)
+            for u in neighbors[t]:
+                degree[u] -= 1
+            if dfs(t):
+                return True
+            for u in neighbors[t]:
+                degree[u] += 1
+            path.pop()
+            visited[t] = 0
+        return False
+
+    return path if dfs(entry) else None
+
+
+def divide_and_conquer_tour(n: int, start: Sequence[int]) -> Optional[List[tuple]]:
+    """
+    Open knight's tour for very large boards (n >= 24): the board is cut into blocks of mostly
+    6 x 6 squares (see `_split_sizes`), blocks are visited along a Hamiltonian cycle of the block grid rotated to
+    begin at the start block, and each block gets a small search whose last square jumps into
+    an entry of the next block from which that block can be completed. Block paths are cached
+    by shape and entry, so a 1000 x 1000 board only needs a few hundred small searches.
+    """
+    if n < 24:
+        return None
+    row_sizes = _split_sizes(n, even_count=True)
+    col_sizes = _split_sizes(n, even_count=False)
+    if row_sizes is None or col_sizes is None:
+        return None
+    row_offsets = [0]
+    for size in row_sizes[:-1]:
+        row_offsets.append(row_offsets[-1] + size)
+    col_offsets = [0]
+    for size in col_sizes[:-1]:
+        col_offsets.append(col_offsets[-1] + size)
+
+    def block_of(x: int, offsets: List[int]) -> int:
+        i = 0
+        while i + 1 < len(offsets) and offsets[i + 1] <= x:
+            i += 1
+        return i
+
+    sr, sc = int(start[0]), int(start[1])
+    cycle = _block_cycle(len(row_sizes), len(col_sizes))
+    first = cycle.index((block_of(sr, row_offsets), block_of(sc, col_offsets)))
+    order = cycle[first:] + cycle[:first]
+
+    def shape(k: int) -> tuple:
+        bi, bj = order[k]
+        if k + 1 == len(order):
+            return row_sizes[bi], col_sizes[bj], None, None, None
+        ni, nj = order[k + 1]
+        return row_sizes[bi], col_sizes[bj], (ni - bi, nj - bj), row_sizes[ni], col_sizes[nj]
+
+    paths: Dict[tuple, Optional[List[int]]] = {}
+
+    def solve_block(k: int, entry: int, lookahead: bool) -> Optional[List[int]]:
+        key = (shape(k), entry, shape(k + 1) if lookahead and k + 1 < len(order) else None)
+        if key in paths:
+            return paths[key]
+        h, w, toward, nh, nw = key[0]
+        path = None
+        if toward is None:
+            path = _block_path(h, w, entry, frozenset(), None, 0)
+        else:
+            jumps = _exit_jumps(h, w, toward, nh, nw)
+            if lookahead and k + 1 < len(order):
+                exits = frozenset(x for x, ys in jumps.items()
+                                  if any(solve_block(k + 1, y, False) is not None for y in ys))
+            else:
+                exits = frozenset(jumps)
+            for seed in range(BLOCK_RETRIES):
+                path = _block_path(h, w, entry, exits, toward, seed)
+                if path is not None:
+                    break
+        paths[key] = path
+        return path
+
+    tour: List[tuple] = []
+    bi, bj = order[0]
+    entry = (sr - row_offsets[bi]) * col_sizes[bj] + (sc - col_offsets[bj])
+    for k, (bi, bj) in enumerate(order):
+        path = solve_block(k, entry, True)
+        if path is None:
+            return None
+        h, w = row_sizes[bi], col_sizes[bj]
+        r0, c0 = row_offsets[bi], col_offsets[bj]
+        tour.extend((r0 + sq // w, c0 + sq % w) for sq in path)
+        if k + 1 == len(order):
+            break
+        # intrarea în blocul următor: primul salt din ultimul pătrat de unde blocul poate fi completat
+        ys = _exit_jumps(*shape(k))[path[-1]]
+        entry = next((y for y in ys if solve_block(k + 1, y, True) is not None), None)
+        if entry is None:
+            return None
+    return tour
+
+
+@lru_cache(maxsize=None)
+def _exit_jumps(h: int, w: int, toward: Tuple[int, int], nh: int, nw: int) -> Dict[int, Tuple[int, ...]]:
+    """Local squares of an h x w block that jump into the adjacent nh x nw block, with their landing squares."""
+    dr0, dc0 = toward
+    # colțul blocului vecin în coordonatele blocului curent
+    or0 = h if dr0 > 0 else (-nh if dr0 < 0 else 0)
+    oc0 = w if dc0 > 0 else (-nw if dc0 < 0 else 0)
+    jumps = {}
+    for sq in range(h * w):
+        r, c = sq // w, sq % w
+        ys = []
+        for dr, dc in KNIGHT_MOVES:
+            er, ec = r + dr - or0, c + dc - oc0
+            if 0 <= er < nh and 0 <= ec < nw:
+                ys.append(er * nw + ec)
+        if ys:
+            jumps[sq] = tuple(ys)
+    return jumps
@@ -1,13 +1,15 @@
+import io
 import streamlit as st
 import algorithms.uninformed as uninformed
 import algorithms.informed as informed
-from utils.algorithm_runner import run_benchmark_all_algorithms
+import algorithms.warnsdorff as warnsdorff
+from utils.algorithm_runner import applicable_algorithms, run_benchmark_all_algorithms
 from problems.n_queens import NQueensProblem
 from problems.hanoi import GeneralizedHanoi
 from problems.graph_coloring import GraphColoringProblem
 from problems.knights_tour import KnightsTourProblem
 from problems.csp import *
-import random
+from problems.graph_csr import parse_dimacs, planted_coloring_graph
 
 ALGO_FUNCS = {
     "BFS": uninformed.bfs,
@@ -21,28 +23,17 @@ ALGO_FUNCS = {
     "Simulated Annealing": informed.simulated_annealing,
     "Beam Search": informed.beam_search,
     "A*": informed.a_star,
+    "Warnsdorff": warnsdorff.warnsdorff,
 }
 
 ALGO_LIST = list(ALGO_FUNCS.keys())
 
+# buget pentru verificarea numărului cromatic la generarea unei instanțe
+CHROMATIC_CHECK_SECONDS = 2.0
+
 
 def build_graph(nodes: int, edges: int, colors: int):
-    graph = {i: set() for i in range(nodes)}
-    color_classes = [[] for _ in range(colors)]
-    for node in range(nodes):
-        color_classes[node % colors].append(node)
-    attempts = 0
-    max_attempts = max(1, edges * 10)
-    while attempts < edges and attempts < max_attempts:
-        c1, c2 = random.sample(range(colors), 2)
-        if color_classes[c1] and color_classes[c2]:
-            n1 = random.choice(color_classes[c1])
-            n2 = random.choice(color_classes[c2])
-            if n2 not in graph[n1]:
-                graph[n1].add(n2)
-                graph[n2].add(n1)
-                attempts += 1
-    return graph, attempts
+    return planted_coloring_graph(nodes, edges, colors)
 
 
 def preview_problem(problem):
@@ -85,11 +76,15 @@ with st.sidebar:
             discs = st.number_input("Număr de discuri", min_value=1, max_value=20, value=5, step=1)
             target = st.number_input("Peg țintă", min_value=1, max_value=int(pegs), value=2, step=1)
         elif problem_name == "Graph Coloring":
-            nodes = st.number_input("Număr de noduri", min_value=1, max_value=500, value=20, step=1)
-            edges = st.number_input("Număr de muchii dorite", min_value=0, max_value=2000, value=40, step=1)
+            graph_source = st.radio("Sursă graf", ["Generat aleator", "Fișier DIMACS (.col)"], horizontal=True)
+            if graph_source == "Generat aleator":
+                nodes = st.number_input("Număr de noduri", min_value=1, max_value=500, value=20, step=1)
+                edges = st.number_input("Număr de muchii dorite", min_value=0, max_value=2000, value=40, step=1)
+            else:
+                dimacs_file = st.file_uploader("Graf DIMACS", type=["col"])
             colors = st.number_input("Număr de culori", min_value=2, max_value=20, value=3, step=1)
         elif problem_name == "Knight's Tour":
-            size = st.number_input("Dimensiune tablă (n)", min_value=4, max_value=30, value=8, step=1)
+            size = st.number_input("Dimensiune tablă (n)", min_value=4, max_value=1000, value=8, step=1)
             start_r = st.number_input("Start row (0-index)", min_value=0, max_value=int(size) - 1, value=0, step=1)
             start_c = st.number_input("Start col (0-index)", min_value=0, max_value=int(size) - 1, value=0, step=1)
 
@@ -102,6 +97,7 @@ with st.sidebar:
         mm_depth = st.number_input("Adâncime", min_value=2, max_value=8, value=3, step=1)
         mm_low = st.number_input("Valoare frunză minimă", min_value=-100, max_value=0, value=-10, step=1)
         mm_high = st.number_input("Valoare frunză maximă", min_value=1, max_value=100, value=10, step=1)
+        mm_seed = st.text_input("Seed (opțional, arbore leneș reproductibil)", value="")
         gen_mm_btn = st.button("Generează arbore")
     elif mode == "Quiz Nash":
         st.subheader("Parametri joc (Nash)")
@@ -121,7 +117,7 @@ with st.sidebar:
     elif mode == "BKT cu optimizari":
         st.subheader("Parametri CSP")
         bkt_size_choice = st.selectbox("Dimensiune problemă", ["Small (4)", "Medium (6)", "Large (8)"], index=1)
-        bkt_optimization = st.selectbox("Alege optimizarea", ["FC", "MRV", "AC-3"], index=2)
+        bkt_optimization = st.selectbox("Alege optimizarea", list(OPTIMIZATION_OPTIONS), index=2)
         bkt_generate_btn = st.button("Generează instanță")
 
 
@@ -129,6 +125,8 @@ if "problem" not in st.session_state:
     st.session_state.problem = None
 if "benchmark" not in st.session_state:
     st.session_state.benchmark = None
+if "chromatic" not in st.session_state:
+    st.session_state.chromatic = None
 if "minimax" not in st.session_state:
     st.session_state.minimax = None
 if "nash" not in st.session_state:
@@ -136,14 +134,31 @@ if "nash" not in st.session_state:
 
 if mode == "Probleme & Benchmark" and generate_btn:
     try:
+        chromatic = None
         if problem_name == "N-Queens":
             prob = NQueensProblem(int(n))
         elif problem_name == "Generalized Hanoi":
             prob = GeneralizedHanoi(int(pegs), int(discs), int(target))
         elif problem_name == "Graph Coloring":
-            graph, built = build_graph(int(nodes), int(edges), int(colors))
+            if graph_source == "Generat aleator":
+                graph, built = build_graph(int(nodes), int(edges), int(colors))
+                st.caption(f"Generat {built} muchii (cerute {int(edges)}).")
+            else:
+                if dimacs_file is None:
+                    raise ValueError("Încarcă un fișier .col")
+                graph = parse_dimacs(io.TextIOWrapper(dimacs_file, encoding="utf-8", errors="replace"))
+                st.caption(f"Încărcat {graph.num_nodes} noduri și {graph.num_edges} muchii.")
             prob = GraphColoringProblem(graph, int(colors))
-            st.caption(f"Generat {built} muchii (cerute {int(edges)}).")
+            # un graf generat are o colorare plantată cu exact `colors` culori; doar unul încărcat poate cere mai multe
+            if graph_source != "Generat aleator":
+                lower, upper, _ = prob.chromatic_number(time_limit=CHROMATIC_CHECK_SECONDS)
+                chromatic = (lower, upper)
+                if lower == upper:
+                    st.caption(f"Număr cromatic: {lower}.")
+                else:
+                    st.caption(f"Număr cromatic între {lower} și {upper}.")
+                if lower > int(colors):
+                    st.warning(f"Graful are nevoie de cel puțin {lower} culori: cu {int(colors)} nu există soluție.")
         elif problem_name == "Knight's Tour":
             prob = KnightsTourProblem(int(size), start=(int(start_r), int(start_c)))
         else:
@@ -155,8 +170,13 @@ if mode == "Probleme & Benchmark" and generate_btn:
                 prob.prefill_level(level)
             except Exception as e:
                 st.warning(f"Eroare la aplicare prefill: {e}")
+            too_few = chromatic is not None and chromatic[0] > prob.colors
+            if isinstance(prob, GraphColoringProblem) and prob.prefilled and not too_few:
+                if prob.prefill_extends(time_limit=CHROMATIC_CHECK_SECONDS) is False:
+                    st.warning(f"Culorile din prefill nu se pot completa la o colorare cu {prob.colors} culori.")
         st.session_state.problem = prob
         st.session_state.benchmark = None
+        st.session_state.chromatic = chromatic
         st.success("Instanță generată.")
     except Exception as e:
         st.error(f"Eroare la generare: {e}")
@@ -176,7 +196,13 @@ if mode == "Probleme & Benchmark":
             st.info("Generează instanța pentru a rula benchmark.")
         else:
             run_btn = st.button("Rulează benchmark")
-            if run_btn:
+            chromatic = st.session_state.chromatic
+            infeasible = (chromatic is not None and isinstance(st.session_state.problem, GraphColoringProblem)
+                          and chromatic[0] > st.session_state.problem.colors)
+            if run_btn and infeasible:
+                st.warning(f"Benchmark oprit: sunt necesare cel puțin {chromatic[0]} culori, "
+                           f"instanța are {st.session_state.problem.colors}.")
+            elif run_btn:
                 with st.spinner("Rulez algoritmii, poate dura…"):
                     times, validity = run_benchmark_all_algorithms(st.session_state.problem, ALGO_FUNCS)
                     st.session_state.benchmark = {"times": times, "validity": validity}
@@ -198,7 +224,9 @@ if mode == "Probleme & Benchmark":
 
 if mode == "Probleme & Benchmark":
     st.subheader("Alegerea ta")
-    choice = st.selectbox("Alege algoritmul considerat cel mai potrivit", ALGO_LIST)
+    algo_list = (ALGO_LIST if st.session_state.problem is None
+                 else list(applicable_algorithms(st.session_state.problem, ALGO_FUNCS)))
+    choice = st.selectbox("Alege algoritmul considerat cel mai potrivit", algo_list)
     if st.session_state.get("benchmark") is None:
         st.info("Rulează benchmark pentru a calcula scorul.")
     else:
@@ -227,49 +255,38 @@ if mode == "Probleme & Benchmark":
             st.warning("Nu există timpuri valide pentru calculul scorului.")
 
 # -------- Quiz Minimax UI --------
-def render_minimax_tree(problem):
-    lines = []
-    def rec(node, level=0, is_max=True, prefix=""):
-        if isinstance(node, int):
-            lines.append(f"{prefix}FRUNZĂ: {node}")
-        else:
-            node_type = "MAX" if is_max else "MIN"
-            child_count = len(node)
-            if level == 0:
-                lines.append(f"RĂDĂCINĂ ({node_type})")
-                new_prefix = ""
-            else:
-                lines.append(f"{prefix}{node_type} (cu {child_count} copii)")
-                new_prefix = prefix
-            next_is_max = not is_max
-            for i, child in enumerate(node):
-                is_last = (i == len(node) - 1)
-                if level == 0:
-                    connector = "└─ " if is_last else "├─ "
-                    child_prefix = connector
-                else:
-                    indent = "   " if is_last else "│  "
-                    connector = "└─ " if is_last else "├─ "
-                    child_prefix = new_prefix + indent + connector
-                rec(child, level + 1, next_is_max, child_prefix)
-    rec(problem.root, 0, True, "")
-    return "\n".join(lines)
+def render_minimax_tree(problem, path=()):
+    # arborii mari (tablouri NumPy) nu se desfac în liste: se desenează doar câteva niveluri de la `path`
+    return "\n".join(minimax_tree_lines(problem, path))
 
 from problems.minimax_tree import MinimaxTreeProblem
+from utils.display import MINIMAX_RENDER_LEVELS, minimax_tree_lines
 if mode == "Quiz Minimax":
     if gen_mm_btn:
         try:
+            seed = mm_seed.strip()
             st.session_state.minimax = MinimaxTreeProblem(
-                branching=int(mm_branch), depth=int(mm_depth), leaf_min=int(mm_low), leaf_max=int(mm_high)
+                branching=int(mm_branch), depth=int(mm_depth), leaf_min=int(mm_low), leaf_max=int(mm_high),
+                lazy=bool(seed), seed=int(seed) if seed else None
             )
-            st.success("Arbore generat.")
+            st.success(f"Arbore generat (seed {seed})." if seed else "Arbore generat.")
         except Exception as e:
             st.error(f"Eroare la generare: {e}")
     if st.session_state.minimax is None:
         st.info("Generează un arbore pentru quiz.")
     else:
         st.subheader("Arbore Minimax")
-        st.code(render_minimax_tree(st.session_state.minimax))
+        mm_path = ()
+        if not st.session_state.minimax.is_nested:
+            st.caption(f"Arbore mare: se afișează doar primele {MINIMAX_RENDER_LEVELS} niveluri de sub nodul ales.")
+            path_text = st.text_input("Drumul nodului afișat (indici de copii, ex: 0 2)", value="")
+            try:
+                mm_path = tuple(int(k) for k in path_text.split())
+                st.session_state.minimax.node_info(mm_path)
+            except ValueError as e:
+                st.error(f"Drum invalid: {e}")
+                mm_path = ()
+        st.code(render_minimax_tree(st.session_state.minimax, mm_path))
         st.subheader("Răspunsul tău")
         user_root = st.number_input("Valoarea rădăcinii", value=0, step=1)
         user_leaves = st.number_input("Noduri frunză evaluate (Alpha-Beta)", value=0, step=1)
@@ -304,7 +321,7 @@ if mode == "Quiz Minimax":
                     score = max(0.0, score)
                 reason = " ".join(reasons)
             st.metric("Scorul tău", f"{score:.2f}%")
-            st.info(f"Corect: rădăcină = {correct_root}, frunze evaluate = {correct_visited} (total frunze = {total_leaves})")
+            st.info(f"Corect: rădăcină = {correct_root}, frunze evaluate = {correct_visited} (total frunze = {total_leaves if total_leaves is not None else 'nedisponibil'})")
 
 # -------- Quiz Nash UI --------
 from problems.random_nash_generator import generate_balanced_nash_game
@@ -475,6 +492,7 @@ if mode == "BKT cu optimizari":
                 seen.add((var, neighbor))
     st.subheader("Constrângeri")
     st.text(", ".join(constraints_readable))
+    st.caption(f"Soluții posibile: {count_solutions(partial_assignment, variables, domains, constraints, constraint_types)}")
 
     # Variabile de completat
     vars_to_fill = [v for v in variables if v not in partial_assignment]
@@ -493,46 +511,35 @@ if mode == "BKT cu optimizari":
             st.session_state["bkt_score"] = None
         else:
 
-                 # Setăm optimizarea (doar pentru informație, soluția e deja validă)
-                use_fc = use_ac3 = False
-                mrv = None
-                if optimization == "FC":
-                    use_fc = True
-                elif optimization == "MRV":
-                    mrv = "MRV"
-                elif optimization == "AC-3":
-                    use_ac3 = True
-
-                # Găsim TOATE soluțiile posibile cu optimizarea selectată
-                all_solutions = backtrack_all_solutions(
+                options = OPTIMIZATION_OPTIONS[optimization]
+
+                # Noduri până la prima soluție cu optimizarea aleasă, pentru comparație
+                first_stats = {}
+                backtrack(copy.deepcopy(partial_assignment), variables, domains, constraints, constraint_types,
+                          stats=first_stats, **options)
+
+                # Soluția cea mai apropiată de răspuns, fără a enumera toate soluțiile
+                search_stats = {}
+                best_solution, best_correct_count = best_matching_solution(
+                    user_assignment,
                     copy.deepcopy(partial_assignment),
                     variables,
-                    copy.deepcopy(domains),
+                    domains,
                     constraints,
                     constraint_types,
-                    mrv=mrv,
-                    use_fc=use_fc,
-                    use_ac3=use_ac3
+                    stats=search_stats,
+                    **options
                 )
+                search_stats["first_nodes"] = first_stats.get("nodes", 0)
+                st.session_state["bkt_stats"] = search_stats
 
-                # Scorarea: compară cu cea mai apropiată soluție din toate soluțiile
-                if not all_solutions:
+                if best_solution is None:
                     # Nu s-a găsit nicio soluție (neașteptat dacă inputul e valid)
                     st.session_state["bkt_score"] = 0.0
                     st.session_state["bkt_solution"] = None
                     st.session_state["bkt_correct_count"] = 0
                     st.session_state["bkt_total_missing"] = len(vars_to_fill)
                 else:
-                    # Găsim cea mai bună potrivire comparând cu fiecare soluție
-                    best_solution = None
-                    best_correct_count = -1
-
-                    for sol in all_solutions:
-                        correct_count = sum(1 for v in vars_to_fill if user_assignment.get(v) == sol.get(v))
-                        if correct_count > best_correct_count:
-                            best_correct_count = correct_count
-                            best_solution = sol
-
                     if best_correct_count == len(vars_to_fill):
                         # Răspunsul se potrivește perfect cu o soluție
                         score = 100.0
@@ -544,7 +551,6 @@ if mode == "BKT cu optimizari":
                     st.session_state["bkt_solution"] = best_solution
                     st.session_state["bkt_correct_count"] = best_correct_count
                     st.session_state["bkt_total_missing"] = len(vars_to_fill)
-                    st.session_state["bkt_all_solutions"] = all_solutions
 
     # Afișăm scorul și soluția dacă există
     if st.session_state.get("bkt_score") is not None:
@@ -554,6 +560,13 @@ if mode == "BKT cu optimizari":
             f"({st.session_state['bkt_correct_count']}/{st.session_state['bkt_total_missing']} corect)"
         )
 
+        bkt_stats = st.session_state.get("bkt_stats", {})
+        if bkt_stats:
+            st.caption(f"Noduri până la prima soluție: {bkt_stats.get('first_nodes', 0)} · "
+                       f"noduri la evaluarea răspunsului: {bkt_stats.get('nodes', 0)}")
+        if bkt_stats.get("revisions"):
+            st.caption(f"Revizii AC-3 în căutare: {bkt_stats['revisions']}")
+
         if st.session_state.get("bkt_solution") is not None:
             st.subheader("Soluție completă (aleasă de BKT)")
             st.table([{
@@ -3,10 +3,11 @@ from utils.io_utils import OPTIMIZATIONS
 from utils.display import *
 from utils.problem_factory import create_problem_instance
 from utils.prefill import handle_prefill_editing, show_prefill_preview
-from utils.algorithm_runner import run_benchmark_all_algorithms
+from utils.algorithm_runner import applicable_algorithms, run_benchmark_all_algorithms
 from problems.minimax_quiz import run_minimax_quiz
 import algorithms.uninformed as uninformed
 import algorithms.informed as informed
+import algorithms.warnsdorff as warnsdorff
 from problems.nash_quiz import run_nash_quiz
 from problems.csp import *
 import copy
@@ -23,7 +24,8 @@ ALGO_FUNCS = {
     "Hill Climbing": informed.hill_climbing,
     "Simulated Annealing": informed.simulated_annealing,
     "Beam Search": informed.beam_search,
-    "A*": informed.a_star
+    "A*": informed.a_star,
+    "Warnsdorff": warnsdorff.warnsdorff
 }
 
 ALGO_LIST = list(ALGO_FUNCS.keys())
@@ -48,19 +50,17 @@ def main():
         variables, domains, constraints, constraint_types, partial_assignment = generate_solvable_csp_with_partial()
         print_constraints_readable(variables, domains, constraints, constraint_types, partial_assignment)
 
-        strategy = None
-        use_fc = use_ac3 = False
-        if problem_name == 'FC':
-            use_fc = True
-        elif problem_name == 'MRV':
-            strategy = "MRV"
-        elif problem_name == 'AC-3':
-            use_ac3 = True
+        options = OPTIMIZATION_OPTIONS[problem_name]
 
         vars_to_fill = [v for v in variables if v not in partial_assignment]
         user_assignment = read_complete_user_assignment(vars_to_fill, partial_assignment, read_user_assignment)
-        solution = backtrack(copy.deepcopy(partial_assignment), variables, domains, constraints, constraint_types,
-                             mrv=strategy, use_fc=use_fc, use_ac3=use_ac3)
+        stats = {}
+        # comparăm cu soluția cea mai apropiată de răspuns, nu cu prima găsită
+        solution, _ = best_matching_solution(user_assignment, copy.deepcopy(partial_assignment), variables, domains,
+                                             constraints, constraint_types, stats=stats, **options)
+        print(f"Noduri explorate: {stats.get('nodes', 0)}")
+        if stats.get("revisions"):
+            print(f"Revizii AC-3: {stats['revisions']}")
 
         benchmark_csp(solution, vars_to_fill, user_assignment)
         return
@@ -80,16 +80,17 @@ def main():
     print_instance_generated()
     times, validity = run_benchmark_all_algorithms(problem, ALGO_FUNCS)
     
-    user_choice = get_algorithm_choice(ALGO_LIST)
+    algo_list = list(applicable_algorithms(problem, ALGO_FUNCS))
+    user_choice = get_algorithm_choice(algo_list)
     
-    if user_choice not in ALGO_FUNCS:
+    if user_choice not in algo_list:
         print("Algoritm invalid.")
         return
     
     user_time = times[user_choice]
     user_is_valid = validity.get(user_choice, False)
     
-    print_benchmark_results(times, validity, user_choice, user_time, user_is_valid, ALGO_LIST)
+    print_benchmark_results(times, validity, user_choice, user_time, user_is_valid, algo_list)
 
 
 if __name__ == "__main__":
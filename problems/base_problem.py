@@ -1,5 +1,5 @@
 from abc import ABC, abstractmethod
-from typing import Any, Iterable, Tuple
+from typing import Any, Iterable, Optional, Tuple
 
 
 class Problem(ABC):
@@ -22,6 +22,22 @@ class Problem(ABC):
     def heuristic(self, state: Any) -> float:
         return 0.0
 
+    def cost_to_go(self, state: Any) -> float:
+        """Estimated cost to a goal, minimized by greedy and A*; by default the heuristic itself."""
+        return self.heuristic(state)
+
+    def num_states(self) -> Optional[int]:
+        """Size of the state space when it is enumerable, None otherwise."""
+        return None
+
+    def state_index(self, state: Any) -> int:
+        """Perfect index of a state in range(num_states()); only defined when num_states() is not None."""
+        raise NotImplementedError()
+
+    def index_state(self, index: int) -> Any:
+        """Inverse of state_index, defined together with it."""
+        raise NotImplementedError()
+
 
     def prefill(self, state_or_positions: Any) -> None:
         setattr(self, "prefilled", state_or_positions)
@@ -0,0 +1,245 @@
+import heapq
+import time
+from typing import Dict, List, Optional, Sequence, Tuple
+
+CHROMATIC_MAX_NODES = 200_000
+CHROMATIC_TIME_LIMIT = 5.0
+CLIQUE_SEEDS = 64
+
+
+def greedy_clique(adj: Sequence[Sequence[int]], seeds: int = CLIQUE_SEEDS) -> List[int]:
+    """
+    Large clique found greedily: starting from each of the `seeds` highest-degree vertices,
+    repeatedly add the candidate with the most neighbors among the remaining candidates.
+    """
+    n = len(adj)
+    if n == 0:
+        return []
+    nbrs = [set(nb) for nb in adj]
+    order = sorted(range(n), key=lambda v: -len(adj[v]))
+    best: List[int] = [order[0]]
+    for v in order[:seeds]:
+        if len(adj[v]) < len(best):
+            break  # nicio clică mai mare nu poate conține v
+        clique = [v]
+        cand = set(nbrs[v])
+        while cand:
+            u = max(cand, key=lambda x: len(nbrs[x] & cand))
+            clique.append(u)
+            cand &= nbrs[u]
+        if len(clique) > len(best):
+            best = clique
+    return best
+
+
+def dsatur_coloring(adj: Sequence[Sequence[int]]) -> List[int]:
+    """Greedy DSATUR coloring (color indices per vertex), O((V + E) log V)."""
+    n = len(adj)
+    color = [-1] * n
+    masks = [0] * n
+    heap = [(0, -len(adj[v]), v) for v in range(n)]
+    heapq.heapify(heap)
+    while heap:
+        neg_sat, neg_deg, v = heapq.heappop(heap)
+        if color[v] >= 0 or -neg_sat != masks[v].bit_count():
+            continue
+        free = ~masks[v]
+        c = (free & -free).bit_length() - 1
+        color[v] = c
+        for u in adj[v]:
+            if color[u] < 0 and not (masks[u] >> c) & 1:
+                masks[u] |= 1 << c
+                heapq.heappush(heap, (-masks[u].bit_count(), -len(adj[u]), u))
+    return color
+
+
+def largest_first_coloring(adj: Sequence[Sequence[int]]) -> List[int]:
+    """Welsh–Powell: vertices by decreasing degree, each gets the smallest free color."""
+    color = [-1] * len(adj)
+    for v in sorted(range(len(adj)), key=lambda x: -len(adj[x])):
+        used = {color[u] for u in adj[v]}
+        c = 0
+        while c in used:
+            c += 1
+        color[v] = c
+    return color
+
+
+def chromatic_bounds(adj: Sequence[Sequence[int]], max_nodes: int = CHROMATIC_MAX_NODES,
+                     time_limit: float = CHROMATIC_TIME_LIMIT) -> Tuple[int, int, List[int]]:
+    """
+    Exact chromatic number by DSATUR branch and bound.
+
+    The lower bound is a greedy clique, whose vertices are pre-colored 0..|Q|-1 to break
+    color symmetry; the upper bound is the best of DSATUR and largest-first. Then k-colorability
+    is decided for k = lower, lower + 1, ... below the upper bound: the search branches on the
+    most saturated vertex and opens at most one new color per branch. Tight palettes make
+    saturation prune early, so this beats tightening the bound from above.
+    Returns (lower, upper, coloring with `upper` colors); lower == upper means exact,
+    otherwise the node or time limit stopped the search first.
+    """
+    n = len(adj)
+    if n == 0:
+        return 0, 0, []
+
+    clique = greedy_clique(adj)
+    lower = len(clique)
+    best_col = min((dsatur_coloring(adj), largest_first_coloring(adj)), key=max)
+    upper = max(best_col) + 1
+
+    deg = [len(nb) for nb in adj]
+    color = [-1] * n
+    # counts[v][c] = câți vecini colorați ai lui v au culoarea c; len(counts[v]) = saturația
+    counts: List[dict] = [{} for _ in range(n)]
+
+    def assign(v: int, c: int) -> None:
+        color[v] = c
+        for u in adj[v]:
+            d = counts[u]
+            d[c] = d.get(c, 0) + 1
+
+    def unassign(v: int) -> None:
+        c = color[v]
+        color[v] = -1
+        for u in adj[v]:
+            d = counts[u]
+            d[c] -= 1
+            if not d[c]:
+                del d[c]
+
+    def select() -> int:
+        chosen, key = -1, (-1, -1)
+        for v in range(n):
+            if color[v] < 0:
+                k = (len(counts[v]), deg[v])
+                if k > key:
+                    chosen, key = v, k
+        return chosen
+
+    for i, v in enumerate(clique):
+        assign(v, i)
+
+    deadline = time.perf_counter() + time_limit
+    nodes = 0
+
+    def colorable(k: int) -> Optional[bool]:
+        """True / False when decided, None when the limits ran out."""
+        nonlocal nodes
+
+        def options(v: int, used: int) -> List[int]:
+            return [c for c in range(min(used + 1, k)) if c not in counts[v]]
+
+        v = select()
+        if v < 0:
+            return True
+        stack = [[v, options(v, len(clique)), 0, len(clique)]]
+        while stack:
+            nodes += 1
+            if nodes > max_nodes or (nodes & 1023 == 0 and time.perf_counter() > deadline):
+                for frame in stack:
+                    if color[frame[0]] >= 0:
+                        unassign(frame[0])
+                return None
+            frame = stack[-1]
+            v, opts, i, used = frame
+            if color[v] >= 0:
+                unassign(v)
+            if i >= len(opts):
+                stack.pop()
+                continue
+            c = opts[i]
+            frame[2] = i + 1
+            assign(v, c)
+            nxt = select()
+            if nxt < 0:
+                return True
+            nxt_opts = options(nxt, max(used, c + 1))
+            if nxt_opts:
+                stack.append([nxt, nxt_opts, 0, max(used, c + 1)])
+        return False
+
+    for k in range(lower, upper):
+        found = colorable(k)
+        if found is None:
+            break
+        if found:
+            upper, best_col = k, color[:]
+            break
+        lower = k + 1
+    return min(lower, upper), upper, best_col
+
+
+def extends_coloring(adj: Sequence[Sequence[int]], k: int, precolored: Dict[int, int],
+                     max_nodes: int = CHROMATIC_MAX_NODES,
+                     time_limit: float = CHROMATIC_TIME_LIMIT) -> Optional[bool]:
+    """
+    Whether the partial coloring `precolored` (vertex -> color) can be completed to a proper
+    coloring with k colors: True / False when decided, None when the node or time limit ran
+    out. Same DSATUR backtracking as chromatic_bounds; colors no precolored vertex uses are
+    interchangeable, so a branch opens at most one new one.
+    """
+    n = len(adj)
+    color = [-1] * n
+    counts: List[dict] = [{} for _ in range(n)]
+    deg = [len(nb) for nb in adj]
+
+    def assign(v: int, c: int) -> None:
+        color[v] = c
+        for u in adj[v]:
+            d = counts[u]
+            d[c] = d.get(c, 0) + 1
+
+    def unassign(v: int) -> None:
+        c = color[v]
+        color[v] = -1
+        for u in adj[v]:
+            d = counts[u]
+            d[c] -= 1
+            if not d[c]:
+                del d[c]
+
+    for v, c in precolored.items():
+        if not 0 <= c < k or c in counts[v]:
+            return False
+        assign(v, c)
+
+    def select() -> int:
+        chosen, key = -1, (-1, -1)
+        for v in range(n):
+            if color[v] < 0:
+                key_v = (len(counts[v]), deg[v])
+                if key_v > key:
+                    chosen, key = v, key_v
+        return chosen
+
+    def options(v: int, used: int) -> List[int]:
+        return [c for c in range(min(used + 1, k)) if c not in counts[v]]
+
+    deadline = time.perf_counter() + time_limit
+    used = max(precolored.values(), default=-1) + 1
+    v = select()
+    if v < 0:
+        return True
+    stack = [[v, options(v, used), 0, used]]
+    nodes = 0
+    while stack:
+        nodes += 1
+        if nodes > max_nodes or (nodes & 1023 == 0 and time.perf_counter() > deadline):
+            return None
+        frame = stack[-1]
+        v, opts, i, used = frame
+        if color[v] >= 0:
+            unassign(v)
+        if i >= len(opts):
+            stack.pop()
+            continue
+        c = opts[i]
+        frame[2] = i + 1
+        assign(v, c)
+        nxt = select()
+        if nxt < 0:
+            return True
+        nxt_opts = options(nxt, max(used, c + 1))
+        if nxt_opts:
+            stack.append([nxt, nxt_opts, 0, max(used, c + 1)])
+    return False
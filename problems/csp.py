@@ -1,6 +1,25 @@
 import random
+import operator
 from collections import deque, defaultdict
-import copy
+
+from problems.csp_globals import AllDifferent, LinearSum, Table
+from problems.csp_model import CSPModel
+
+OPERATORS = {
+    '=': operator.eq, '==': operator.eq, '!=': operator.ne,
+    '<': operator.lt, '>': operator.gt, '<=': operator.le, '>=': operator.ge,
+}
+
+# optimizările oferite în interfață și argumentele corespunzătoare pentru backtrack
+OPTIMIZATION_OPTIONS = {
+    "FC": dict(use_fc=True),
+    "MRV": dict(mrv="MRV"),
+    "AC-3": dict(use_ac3=True),
+    "MRV+grad": dict(mrv="MRV+deg"),
+    "dom/wdeg": dict(mrv="dom/wdeg", use_fc=True),
+    "LCV": dict(mrv="MRV", lcv=True),
+    "Restarturi": dict(mrv="dom/wdeg", use_fc=True, restarts=True),
+}
 
 
 def generate_csp_random(num_vars=4, min_val=1, max_val=10, max_domain_size=5, num_constraints=5):
@@ -42,130 +61,328 @@ def map_operator(op):
     return '==' if op == '=' else op
 
 
-def is_consistent(var, value, assignment, constraints, constraint_types):
+class CompatibilityTable:
+    """
+    Binary constraints compiled once: for every arc (xi, xj) and every value x in the domain
+    of xi, the set of values of xj compatible with x. Pairs outside the compiled domains
+    (e.g. values added after compilation) fall back to the `operator` function.
+    """
+
+    def __init__(self, domains, constraint_types):
+        self.ops = {arc: OPERATORS[op] for arc, op in constraint_types.items()}
+        self.universe = {var: frozenset(vals) for var, vals in domains.items()}
+        self.supports = {}
+        for (xi, xj), fn in self.ops.items():
+            dj = domains.get(xj, [])
+            self.supports[(xi, xj)] = {x: frozenset(y for y in dj if fn(x, y)) for x in domains.get(xi, [])}
+
+    def compatible(self, xi, xj, x, y):
+        row = self.supports[(xi, xj)].get(x)
+        if row is not None and y in self.universe.get(xj, ()):
+            return y in row
+        return self.ops[(xi, xj)](x, y)
+
+    def filter(self, xi, xj, x, values):
+        """Values of xj (from `values`) compatible with xi = x."""
+        row = self.supports[(xi, xj)].get(x)
+        if row is None:
+            fn = self.ops[(xi, xj)]
+            return [y for y in values if fn(x, y)]
+        universe = self.universe.get(xj, ())
+        fn = self.ops[(xi, xj)]
+        return [y for y in values if (y in row if y in universe else fn(x, y))]
+
+    def has_support(self, xi, xj, x, values):
+        return self.first_support(xi, xj, x, values) is not None
+
+    def first_support(self, xi, xj, x, values):
+        """First value of xj in `values` compatible with xi = x, or None."""
+        row = self.supports[(xi, xj)].get(x)
+        fn = self.ops[(xi, xj)]
+        universe = self.universe.get(xj, ()) if row is not None else ()
+        for y in values:
+            if (y in row) if y in universe else fn(x, y):
+                return y
+        return None
+
+
+def is_consistent(var, value, assignment, constraints, constraint_types, compat=None):
+    # fără tabel compilat operatorii se iau direct din OPERATORS, fără a construi nimic la fiecare apel
     for neighbor in constraints[var]:
         if neighbor in assignment:
-            op = map_operator(constraint_types[(var, neighbor)])
-            neighbor_val = assignment[neighbor]
-            if not eval(f"{value} {op} {neighbor_val}"):
+            if compat is not None:
+                ok = compat.compatible(var, neighbor, value, assignment[neighbor])
+            else:
+                ok = OPERATORS[constraint_types[(var, neighbor)]](value, assignment[neighbor])
+            if not ok:
                 return False
     return True
 
 
 def select_unassigned_variable(variables, assignment, domains, strategy=None):
-    unassigned = [v for v in variables if v not in assignment]
-    if not unassigned:
-        return None
-    if strategy == "MRV":
-        return min(unassigned, key=lambda var: len(domains[var]))
-    return unassigned[0]
+    """First unassigned variable, or with strategy="MRV" the one with the smallest domain (CSPModel.select)."""
+    model = CSPModel(variables, domains, {}, {}, assignment)
+    i = model.select("MRV" if strategy == "MRV" else None)
+    return None if i is None else model.names[i]
 
 
-def forward_checking(var, value, domains, constraints, constraint_types, assignment):
-    temp_domains = copy.deepcopy(domains)
+def forward_checking(var, value, domains, constraints, constraint_types, assignment, compat=None):
+    """
+    Copy of `domains` with the free neighbors of var filtered by var = value
+    (CSPModel.forward_check), or None on a wipe-out. `compat` is accepted and ignored.
+    """
+    model = CSPModel(list(domains), domains, constraints, constraint_types, assignment)
+    if not model.forward_check(model.index[var], value):
+        return None
+    temp_domains = {v: list(vals) for v, vals in domains.items()}
     for neighbor in constraints[var]:
         if neighbor not in assignment:
-            op = map_operator(constraint_types[(var, neighbor)])
-            temp_domains[neighbor] = [val for val in temp_domains[neighbor] if eval(f"{value} {op} {val}")]
-            if not temp_domains[neighbor]:
-                return None
+            temp_domains[neighbor] = list(model.domains[model.index[neighbor]])
     return temp_domains
 
 
-def ac3(domains, constraints, constraint_types):
-    queue = deque([(xi, xj) for xi in constraints for xj in constraints[xi]])
-
-    def revise(xi, xj):
-        revised = False
-        op = map_operator(constraint_types[(xi, xj)])
-        original_domain = domains[xi][:]
-        domains[xi] = [x for x in domains[xi] if any(eval(f"{x} {op} {y}") for y in domains[xj])]
-        if domains[xi] != original_domain:
-            revised = True
-        return revised
-
-    while queue:
-        xi, xj = queue.popleft()
-        if revise(xi, xj):
-            if not domains[xi]:
-                return False
-            for xk in constraints[xi]:
-                if xk != xj:
-                    queue.append((xk, xi))
-    return True
-
-
-def backtrack(assignment, variables, domains, constraints, constraint_types, mrv=None, use_fc=False, use_ac3=False):
+def ac3(domains, constraints, constraint_types, compat=None, trail=None, arcs=None, residues=None, stats=None):
+    """
+    Standalone arc consistency on `domains`, in place: compiles a CSPModel and runs its AC-3
+    (make_arc_consistent, the same engine MAC uses inside backtrack). False on a wipe-out.
+    `arcs` seeds the queue with every arc into their target variables (default: every arc);
+    with `trail` each pruned variable's old list is saved there as (var, values); `stats`
+    counts revisions under "revisions". `compat` and `residues` are accepted and ignored:
+    order constraints are revised from the extremes of the other domain instead of residues.
+    """
+    model = CSPModel(list(domains), domains, constraints, constraint_types)
+    if arcs is None:
+        consistent = model.make_arc_consistent(stats=stats)
+    else:
+        targets = dict.fromkeys(model.index[xj] for _, xj in arcs)
+        consistent = all(model.make_arc_consistent(into=j, stats=stats) for j in targets)
+    for var, values in zip(model.names, model.domains):
+        if len(values) != len(domains[var]):
+            if trail is not None:
+                trail.append((var, domains[var]))
+            domains[var] = values
+    return consistent
+
+
+def backtrack(assignment, variables, domains, constraints, constraint_types, mrv=None, use_fc=False, use_ac3=False,
+              stats=None, lcv=False, restarts=False, cbj=False, global_constraints=()):
+    """
+    Backtracking search on the compiled CSPModel; use_ac3 maintains arc consistency (MAC):
+    the network is made arc consistent once at the root, then each assignment only re-queues
+    the arcs into the assigned variable. `mrv` picks the variable order (None, "MRV",
+    "MRV+deg" or "dom/wdeg"), `lcv` tries least-constraining values first and `restarts`
+    restarts on a Luby schedule with nogood recording. `cbj` backjumps to the culprit of a
+    dead end instead of the previous variable (FC-CBJ together with use_fc); it does not
+    combine with AC-3 or restarts. `global_constraints` adds n-ary constraints from
+    problems.csp_globals, propagated by FC (one pass) and AC-3 (to a fixpoint with the arcs).
+    `stats` (a dict) collects the number of tried values ("nodes"), AC revisions and restarts.
+    On success `assignment` is completed in place and returned, otherwise it is left as given.
+    """
+    if cbj and (use_ac3 or restarts):
+        raise ValueError("CBJ se combină doar cu FC și cu ordinile de variabile")
     if len(assignment) == len(variables):
         return assignment
-
-    var = select_unassigned_variable(variables, assignment, domains, mrv)
-    if var is None:
-        return assignment
-
-    for value in domains[var]:
-        if is_consistent(var, value, assignment, constraints, constraint_types):
-            assignment[var] = value
-            temp_domains = domains
-
-            if use_fc:
-                temp_domains = forward_checking(var, value, domains, constraints, constraint_types, assignment)
-                if temp_domains is None:
-                    del assignment[var]
-                    continue
-            elif use_ac3:
-                temp_domains = copy.deepcopy(domains)
-                temp_domains[var] = [value]
-                if not ac3(temp_domains, constraints, constraint_types):
-                    del assignment[var]
-                    continue
-
-            result = backtrack(assignment, variables, temp_domains, constraints, constraint_types, mrv, use_fc, use_ac3)
-            if result:
-                return result
-            del assignment[var]
-    return None
+    model = CSPModel(variables, domains, constraints, constraint_types, assignment, global_constraints)
+    if cbj:
+        found = model.search_cbj(mrv, use_fc, stats, lcv)
+    else:
+        if use_ac3 and not use_fc and not model.make_arc_consistent(stats=stats):
+            return None
+        found = model.solve(mrv, use_fc, use_ac3, stats, lcv, restarts)
+    if not found:
+        return None
+    assignment.update(model.solution())
+    return assignment
 
 
-def backtrack_all_solutions(assignment, variables, domains, constraints, constraint_types, mrv=None, use_fc=False, use_ac3=False, solutions=None):
+def backtrack_all_solutions(assignment, variables, domains, constraints, constraint_types, mrv=None, use_fc=False, use_ac3=False, solutions=None,
+                            stats=None, lcv=False, global_constraints=()):
     """Găsește TOATE soluțiile pentru CSP-ul dat."""
     if solutions is None:
         solutions = []
-    
-    if len(assignment) == len(variables):
-        solutions.append(copy.deepcopy(assignment))
+    model = CSPModel(variables, domains, constraints, constraint_types, assignment, global_constraints)
+    if use_ac3 and not use_fc and not model.make_arc_consistent(stats=stats):
         return solutions
 
-    var = select_unassigned_variable(variables, assignment, domains, mrv)
-    if var is None:
-        solutions.append(copy.deepcopy(assignment))
-        return solutions
-
-    for value in domains[var]:
-        if is_consistent(var, value, assignment, constraints, constraint_types):
-            assignment[var] = value
-            # Copiem domains pentru a evita modificări în-place
-            temp_domains = copy.deepcopy(domains)
-
-            if use_fc:
-                temp_domains = forward_checking(var, value, domains, constraints, constraint_types, assignment)
-                if temp_domains is None:
-                    del assignment[var]
-                    continue
-            elif use_ac3:
-                temp_domains = copy.deepcopy(domains)
-                temp_domains[var] = [value]
-                if not ac3(temp_domains, constraints, constraint_types):
-                    del assignment[var]
-                    continue
+    def collect(m):
+        solutions.append({**assignment, **m.solution()})
+        return False
 
-            backtrack_all_solutions(assignment, variables, temp_domains, constraints, constraint_types, mrv, use_fc, use_ac3, solutions)
-            del assignment[var]
-    
+    model.search(collect, mrv, use_fc, use_ac3, stats, lcv)
     return solutions
 
 
-def print_constraints_readable(variables, domains, constraints, constraint_types, partial_assignment):
+def best_matching_solution(answer, assignment, variables, domains, constraints, constraint_types, mrv=None,
+                           use_fc=False, use_ac3=False, stats=None, lcv=False, restarts=False,
+                           global_constraints=()):
+    """
+    Solution extending `assignment` that agrees with `answer` on the most variables, without
+    enumerating the solution set. If the answer is itself a solution it is accepted after one
+    O(constraints) check; otherwise branch and bound tries the answer's value first for every
+    variable and prunes when even matching every remaining variable could not beat the best
+    solution found. Returns (solution, agreement), or (None, 0) if the CSP has no solution.
+    The answer's value goes first and the others follow the `lcv` ordering. With `restarts`
+    a first solution found by restarted search seeds the bound. `stats` counts tried values
+    under "nodes".
+    """
+    compat = CompatibilityTable(domains, constraint_types)
+    targets = {v: answer[v] for v in variables if v not in assignment and v in answer}
+    candidate = {**assignment, **targets}
+    if (len(candidate) == len(variables)
+            and all(value in domains[v] for v, value in targets.items())
+            and all(compat.compatible(v, nb, value, candidate[nb]) for v, value in targets.items()
+                    for nb in constraints[v])
+            and all(c.satisfied(candidate) for c in global_constraints)):
+        return candidate, len(targets)
+
+    model = CSPModel(variables, domains, constraints, constraint_types, assignment, global_constraints)
+    if use_ac3 and not use_fc and not model.make_arc_consistent(stats=stats):
+        return None, 0
+    want = [None] * len(model)
+    for v, value in targets.items():
+        want[model.index[v]] = value
+    wanted = [model.index[v] for v in targets]
+    best = [None, -1]
+    if restarts:
+        if not model.solve(mrv, use_fc, use_ac3, stats, lcv, restarts=True):
+            return None, 0
+        found = model.solution()
+        best = [{**assignment, **found}, sum(1 for v, value in targets.items() if found[v] == value)]
+        model = CSPModel(variables, domains, constraints, constraint_types, assignment, global_constraints)
+        if use_ac3 and not use_fc:
+            model.make_arc_consistent()
+
+    def search(agree):
+        i = model.select(mrv)
+        if i is None:
+            if agree > best[1]:
+                best[0], best[1] = {**assignment, **model.solution()}, agree
+            return
+        # margine superioară: toate variabilele rămase ar putea încă primi valoarea din răspuns
+        reachable = sum(1 for j in wanted if j in model.unassigned and want[j] in model.domains[j])
+        if agree + reachable <= best[1]:
+            return
+
+        values = model.order_values(i, lcv)
+        if want[i] in values:
+            values = [want[i]] + [x for x in values if x != want[i]]
+        for value in values:
+            if best[1] == len(targets):
+                return
+            if stats is not None:
+                stats["nodes"] = stats.get("nodes", 0) + 1
+            if not model.is_consistent(i, value):
+                continue
+            model.assign(i, value)
+            mark = len(model.trail)
+            if model.propagate(i, value, use_fc, use_ac3, stats):
+                search(agree + (1 if value == want[i] else 0))
+            model.undo(mark)
+            model.unassign(i)
+
+    search(0)
+    return best[0], max(best[1], 0)
+
+
+def count_solutions(assignment, variables, domains, constraints, constraint_types, compat=None, global_constraints=()):
+    """
+    Number of solutions extending `assignment` (what len(backtrack_all_solutions(...)) returns),
+    computed without enumerating them. The constraint graph is split into connected
+    components, whose counts multiply. Inside a component, degree-1 variables are eliminated
+    one by one: each leaf sends its parent, for every parent value, the weighted number of
+    compatible leaf values, so tree components cost O(n * d^2). A cyclic core that remains is
+    conditioned on its most connected variable, value by value, and the rest is counted the
+    same way (it often splits into trees again). With global constraints the solutions are
+    counted by search under AC-3 instead.
+    """
+    if global_constraints:
+        model = CSPModel(variables, domains, constraints, constraint_types, assignment, global_constraints)
+        count = [0]
+
+        def tally(m):
+            count[0] += 1
+            return False
+
+        if model.make_arc_consistent():
+            model.search(tally, "MRV", use_ac3=True)
+        return count[0]
+    if compat is None:
+        compat = CompatibilityTable(domains, constraint_types)
+    # variabilele deja asignate au domeniu fix; constrângerile dintre ele nu sunt verificate de backtrack
+    weights = {v: {x: 1 for x in ([assignment[v]] if v in assignment else domains[v])} for v in variables}
+    adj = {v: set() for v in variables}
+    for v in variables:
+        for nb in constraints.get(v, ()):
+            if nb in adj and not (v in assignment and nb in assignment):
+                adj[v].add(nb)
+    return _count_weighted(set(variables), adj, weights, compat)
+
+
+def _count_weighted(alive, adj, weights, compat):
+    total = 1
+    seen = set()
+    for start in alive:
+        if start in seen:
+            continue
+        seen.add(start)
+        comp = [start]
+        for v in comp:
+            for nb in adj[v]:
+                if nb in alive and nb not in seen:
+                    seen.add(nb)
+                    comp.append(nb)
+        total *= _count_component(comp, adj, weights, compat)
+        if total == 0:
+            return 0
+    return total
+
+
+def _count_component(comp, adj, weights, compat):
+    alive = set(comp)
+    w = {v: dict(weights[v]) for v in comp}
+    degree = {v: len(adj[v] & alive) for v in comp}
+    leaves = deque(v for v in comp if degree[v] == 1)
+    while leaves and len(alive) > 1:
+        leaf = leaves.popleft()
+        if leaf not in alive or degree[leaf] != 1:
+            continue
+        parent = next(nb for nb in adj[leaf] if nb in alive)
+        wl = w[leaf]
+        wp = w[parent]
+        for x in list(wp):
+            m = sum(wy for y, wy in wl.items() if compat.compatible(parent, leaf, x, y))
+            if m:
+                wp[x] *= m
+            else:
+                del wp[x]
+        alive.discard(leaf)
+        degree[parent] -= 1
+        if degree[parent] == 1:
+            leaves.append(parent)
+        if not wp:
+            return 0
+
+    if len(alive) == 1:
+        return sum(w[next(iter(alive))].values())
+
+    # nucleu ciclic: condiționăm pe variabila cu cele mai multe legături rămase
+    x = max(alive, key=lambda v: degree[v])
+    rest = alive - {x}
+    nbs = [nb for nb in adj[x] if nb in rest]
+    total = 0
+    for val, wx in w[x].items():
+        sub = dict(w)
+        for nb in nbs:
+            sub[nb] = {y: wy for y, wy in w[nb].items() if compat.compatible(nb, x, y, val)}
+            if not sub[nb]:
+                break
+        else:
+            total += wx * _count_weighted(rest, adj, sub, compat)
+    return total
+
+
+def print_constraints_readable(variables, domains, constraints, constraint_types, partial_assignment,
+                               global_constraints=()):
     print("Variabile:", variables)
     print("Domenii:", domains)
     seen = set()
@@ -177,38 +394,160 @@ def print_constraints_readable(variables, domains, constraints, constraint_types
                 readable.append(f"{var} {op} {neighbor}")
                 seen.add((var, neighbor))
     print("Constrangeri:", ",".join(readable))
+    if global_constraints:
+        print("Constrangeri globale:", "; ".join(map(str, global_constraints)))
     print("Asignare partiala:", partial_assignment)
 
 
+def _planted_domains(variables, solution, min_val, max_val, max_domain_size):
+    # fiecare domeniu conține valoarea plantată plus valori aleatoare din interval
+    max_domain_size = max(1, min(max_domain_size, max_val - min_val + 1))
+    domains = {}
+    for var in variables:
+        size = random.randint(min(2, max_domain_size), max_domain_size)
+        others = random.sample(range(min_val, max_val), size - 1)
+        # eșantionăm din interval fără valoarea plantată, apoi o adăugăm
+        others = [x if x < solution[var] else x + 1 for x in others]
+        domains[var] = sorted(others + [solution[var]])
+    return domains
+
+
+def _planted_binary_constraints(variables, solution, num_constraints, retie=False):
+    # operatorul se alege întâi, uniform din '!=', '=', '<', '>' (ca în generate_csp_random),
+    # apoi o pereche pe care soluția plantată îl satisface. '=' cere valori egale: perechea se ia
+    # din variabilele cu aceeași valoare, iar cu retie=True o variabilă încă neconstrânsă poate
+    # primi valoarea celeilalte (solution se modifică pe loc). Un operator fără pereche potrivită
+    # după num_vars încercări se trage din nou, deci '=' rămâne mai rar doar când soluția are
+    # puține valori egale.
+    constraints = defaultdict(list)
+    constraint_types = {}
+    groups = defaultdict(list)
+    for var in variables:
+        groups[solution[var]].append(var)
+    num_vars = len(variables)
+    num_constraints = min(num_constraints, num_vars * (num_vars - 1) // 2)
+    op, misses = None, 0
+    while len(constraint_types) < 2 * num_constraints:
+        if op is None or misses >= num_vars:
+            op, misses = random.choice(['!=', '=', '<', '>']), 0
+        misses += 1
+        x = random.choice(variables)
+        if op == '=':
+            y = random.choice(groups[solution[x]])
+            if y == x and retie:
+                y = random.choice(variables)
+                if y == x or y in constraints:
+                    continue
+                groups[solution[y]].remove(y)
+                solution[y] = solution[x]
+                groups[solution[y]].append(y)
+        else:
+            y = random.choice(variables)
+            if solution[x] == solution[y]:
+                continue
+            if op != '!=' and (solution[x] < solution[y]) != (op == '<'):
+                x, y = y, x
+        if y == x or (x, y) in constraint_types:
+            continue
+        constraints[x].append(y)
+        constraints[y].append(x)
+        constraint_types[(x, y)] = op
+        constraint_types[(y, x)] = {'<': '>', '>': '<'}.get(op, op)
+        op = None
+    return constraints, constraint_types
+
+
+def _planted_partial(variables, solution, max_partial_vars):
+    if max_partial_vars is None:
+        max_partial_vars = len(variables) - 1
+    num_partial = random.randint(min(1, max_partial_vars), max_partial_vars)
+    return {var: solution[var] for var in random.sample(variables, num_partial)}
+
+
 def generate_solvable_csp_with_partial(num_vars=4, min_val=1, max_val=10, max_domain_size=5,
                                        num_constraints=5, max_attempts=100, max_partial_vars=None):
     """
     Generează un CSP aleator care are cel puțin o soluție și o asignare partială consistentă.
-    Partial_assignment se alege dintr-o soluție completă.
+    Soluția este plantată întâi: fiecare domeniu o conține, iar fiecare constrângere primește
+    un operator satisfăcut de ea, deci CSP-ul e solvabil dintr-o singură trecere, în
+    O(num_vars * max_domain_size + num_constraints), oricât de mare ar fi instanța.
+    Operatorii sunt aproximativ uniformi peste '!=', '=', '<', '>', ca în generate_csp_random.
+    Partial_assignment se alege din soluția plantată. max_attempts e acceptat doar pentru
+    compatibilitate cu apelurile vechi și e ignorat: nu mai există reîncercări.
     """
-    for _ in range(max_attempts):
-        variables, domains, constraints, constraint_types, _ = generate_csp_random(
-            num_vars, min_val, max_val, max_domain_size, num_constraints
-        )
+    variables = [f'X{i}' for i in range(num_vars)]
+    values = range(min_val, max_val + 1)
+    solution = {var: random.choice(values) for var in variables}
+    constraints, constraint_types = _planted_binary_constraints(variables, solution, num_constraints, retie=True)
+    domains = _planted_domains(variables, solution, min_val, max_val, max_domain_size)
+    partial_assignment = _planted_partial(variables, solution, max_partial_vars)
+    return variables, domains, constraints, constraint_types, partial_assignment
 
-        # Verificăm dacă există cel puțin o soluție completă
-        solution = backtrack({}, variables, domains, constraints, constraint_types)
-        if not solution:
-            continue  # regenerează CSP dacă nu e solvabil
 
-        # Generăm o partial_assignment din soluție
-        partial_assignment = {}
-        if max_partial_vars is None:
-            max_partial_vars = num_vars - 1
-        num_partial = random.randint(1, max_partial_vars)
+def generate_solvable_puzzle_csp(size=5, max_domain_size=None, num_sums=3, num_tables=2, table_rows=6,
+                                 num_constraints=0, max_partial_vars=None):
+    """
+    Generează un CSP de tip puzzle pe o grilă size x size (variabila X{r*size+c}), cu soluție
+    plantată: un pătrat latin aleator. Fiecare rând și fiecare coloană primesc AllDifferent,
+    num_sums grupuri de 2-3 celule vecine primesc o sumă (=, <= sau >=) satisfăcută de soluție,
+    iar num_tables perechi de celule primesc un tabel cu tuplul plantat și table_rows - 1
+    tupluri aleatoare. Pe lângă ele se pot planta num_constraints constrângeri binare.
+    Returnează (variables, domains, constraints, constraint_types, global_constraints,
+    partial_assignment); implicit sunt date cel mult o treime din celule.
+    """
+    variables = [f'X{i}' for i in range(size * size)]
+    symbols = random.sample(range(1, size + 1), size)
+    rows = random.sample(range(size), size)
+    cols = random.sample(range(size), size)
+    solution = {f'X{r * size + c}': symbols[(rows[r] + cols[c]) % size] for r in range(size) for c in range(size)}
+    domains = _planted_domains(variables, solution, 1, size, max_domain_size or size)
+
+    global_constraints = []
+    for r in range(size):
+        global_constraints.append(AllDifferent([f'X{r * size + c}' for c in range(size)]))
+    for c in range(size):
+        global_constraints.append(AllDifferent([f'X{r * size + c}' for r in range(size)]))
+    for _ in range(num_sums):
+        r, c = random.randrange(size), random.randrange(size - 1)
+        cells = [f'X{r * size + c + k}' for k in range(min(random.randint(2, 3), size - c))]
+        coefficients = [random.randint(1, 3) for _ in cells]
+        total = sum(k * solution[v] for v, k in zip(cells, coefficients))
+        op = random.choice(['=', '<=', '>='])
+        rhs = total + {'=': 0, '<=': random.randint(0, size), '>=': -random.randint(0, size)}[op]
+        global_constraints.append(LinearSum(cells, coefficients, op, rhs))
+    for _ in range(num_tables):
+        x, y = random.sample(variables, 2)
+        allowed = {(solution[x], solution[y])}
+        allowed |= {(random.choice(domains[x]), random.choice(domains[y])) for _ in range(table_rows - 1)}
+        global_constraints.append(Table([x, y], allowed))
 
-        candidate_vars = random.sample(variables, num_partial)
-        for var in candidate_vars:
-            partial_assignment[var] = solution[var]
+    constraints, constraint_types = _planted_binary_constraints(variables, solution, num_constraints)
+    if max_partial_vars is None:
+        max_partial_vars = len(variables) // 3
+    partial_assignment = _planted_partial(variables, solution, max_partial_vars)
+    return variables, domains, constraints, constraint_types, global_constraints, partial_assignment
 
-        return variables, domains, constraints, constraint_types, partial_assignment
 
-    raise Exception("Nu am reușit să genereze un CSP solvabil cu partial_assignment după multe încercări.")
+def decompose_alldifferent(constraints, constraint_types, global_constraints):
+    """
+    Same CSP with every AllDifferent replaced by pairwise '!=' constraints (pairs that are
+    already constrained keep their operator). Returns (constraints, constraint_types,
+    remaining global constraints); the arguments are not modified.
+    """
+    constraints = defaultdict(list, {v: list(nbs) for v, nbs in constraints.items()})
+    constraint_types = dict(constraint_types)
+    remaining = []
+    for c in global_constraints:
+        if not isinstance(c, AllDifferent):
+            remaining.append(c)
+            continue
+        for k, x in enumerate(c.variables):
+            for y in c.variables[k + 1:]:
+                if (x, y) not in constraint_types:
+                    constraints[x].append(y)
+                    constraints[y].append(x)
+                    constraint_types[(x, y)] = constraint_types[(y, x)] = '!='
+    return constraints, constraint_types, remaining
 
 
 def read_user_assignment(input_str):
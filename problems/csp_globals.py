@@ -0,0 +1,318 @@
+from typing import Dict, Hashable, List, Mapping, Sequence, Tuple
+
+from problems.csp_model import UNASSIGNED
+
+SUM_OPERATORS = ('=', '<=', '>=')
+
+
+class AllDifferent:
+    """alldifferent(variables): pairwise distinct values."""
+
+    def __init__(self, variables: Sequence[Hashable]):
+        self.variables = tuple(variables)
+
+    def satisfied(self, assignment: Mapping) -> bool:
+        values = [assignment[v] for v in self.variables]
+        return len(set(values)) == len(values)
+
+    def compile(self, index: Mapping, gid: int) -> "_AllDifferentPropagator":
+        return _AllDifferentPropagator(gid, [index[v] for v in self.variables])
+
+    def __str__(self):
+        return f"alldifferent({', '.join(map(str, self.variables))})"
+
+
+class LinearSum:
+    """sum(coefficients[k] * variables[k]) op rhs, with op one of '=', '<=', '>='."""
+
+    def __init__(self, variables: Sequence[Hashable], coefficients: Sequence[int], op: str, rhs: int):
+        op = '=' if op == '==' else op
+        if op not in SUM_OPERATORS or len(coefficients) != len(variables):
+            raise ValueError(f"Sumă liniară invalidă: {op} cu {len(coefficients)} coeficienți")
+        self.variables = tuple(variables)
+        self.coefficients = tuple(coefficients)
+        self.op = op
+        self.rhs = rhs
+
+    def satisfied(self, assignment: Mapping) -> bool:
+        total = sum(c * assignment[v] for v, c in zip(self.variables, self.coefficients))
+        return _compare(total, self.op, self.rhs)
+
+    def compile(self, index: Mapping, gid: int) -> "_LinearSumPropagator":
+        return _LinearSumPropagator(gid, [index[v] for v in self.variables], self.coefficients, self.op, self.rhs)
+
+    def __str__(self):
+        terms = " + ".join(f"{c}*{v}" if c != 1 else str(v) for v, c in zip(self.variables, self.coefficients))
+        return f"{terms} {self.op} {self.rhs}"
+
+
+class Table:
+    """(variables) takes one of the allowed `tuples`."""
+
+    def __init__(self, variables: Sequence[Hashable], tuples: Sequence[Sequence[int]]):
+        self.variables = tuple(variables)
+        self.tuples = sorted(set(map(tuple, tuples)))
+
+    def satisfied(self, assignment: Mapping) -> bool:
+        return tuple(assignment[v] for v in self.variables) in set(self.tuples)
+
+    def compile(self, index: Mapping, gid: int) -> "_TablePropagator":
+        return _TablePropagator(gid, [index[v] for v in self.variables], self.tuples)
+
+    def __str__(self):
+        return f"({', '.join(map(str, self.variables))}) ∈ {{{', '.join(map(str, self.tuples))}}}"
+
+
+def _compare(total: int, op: str, rhs: int) -> bool:
+    if op == '=':
+        return total == rhs
+    return total <= rhs if op == '<=' else total >= rhs
+
+
+def _narrow(model, i: int, kept: List[int]) -> bool:
+    """Restrict variable i to `kept`; an assigned variable only checks its value. False on a wipe-out."""
+    x = model.assignment[i]
+    if x != UNASSIGNED:
+        return x in kept
+    if len(kept) != len(model.domains[i]):
+        model.prune(i, kept)
+    return bool(kept)
+
+
+def _strongly_connected(adj: List[List[int]]) -> List[int]:
+    """Component id of every node (iterative Tarjan)."""
+    n = len(adj)
+    index = [-1] * n
+    low = [0] * n
+    comp = [-1] * n
+    on_stack = [False] * n
+    stack: List[int] = []
+    counter = components = 0
+    for root in range(n):
+        if index[root] >= 0:
+            continue
+        work = [(root, 0)]
+        while work:
+            v, k = work.pop()
+            if k == 0:
+                index[v] = low[v] = counter
+                counter += 1
+                stack.append(v)
+                on_stack[v] = True
+            if k < len(adj[v]):
+                work.append((v, k + 1))
+                w = adj[v][k]
+                if index[w] < 0:
+                    work.append((w, 0))
+                elif on_stack[w]:
+                    low[v] = min(low[v], index[w])
+                continue
+            if low[v] == index[v]:
+                while True:
+                    w = stack.pop()
+                    on_stack[w] = False
+                    comp[w] = components
+                    if w == v:
+                        break
+                components += 1
+            if work:
+                parent = work[-1][0]
+                low[parent] = min(low[parent], low[v])
+    return comp
+
+
+class _AllDifferentPropagator:
+    """
+    Without `strong` (forward checking) the values of assigned variables are removed from
+    the others. With `strong` Régin's filtering gives generalized arc consistency: a maximum
+    matching between variables and values is kept, and a value survives only if its edge is
+    matched, lies on an alternating cycle (same strongly connected component) or on an even
+    alternating path from a free value. The last matching seeds the next call.
+    """
+
+    def __init__(self, gid: int, scope: List[int]):
+        self.gid = gid
+        self.scope = tuple(scope)
+        self.matching: List = [None] * len(scope)
+
+    def initial_state(self):
+        return None
+
+    def check(self, model, i: int, x: int) -> bool:
+        assignment = model.assignment
+        return all(j == i or assignment[j] != x for j in self.scope)
+
+    def propagate(self, model, strong: bool) -> bool:
+        if strong:
+            return self._regin(model)
+        assignment = model.assignment
+        used = set()
+        for j in self.scope:
+            x = assignment[j]
+            if x != UNASSIGNED:
+                if x in used:
+                    return False
+                used.add(x)
+        if not used:
+            return True
+        for j in self.scope:
+            if assignment[j] == UNASSIGNED:
+                dj = model.domains[j]
+                if not _narrow(model, j, [y for y in dj if y not in used]):
+                    return False
+        return True
+
+    def _regin(self, model) -> bool:
+        doms = [model.values_of(j) for j in self.scope]
+        k = len(doms)
+        owner: Dict[int, int] = {}  # valoare -> poziția care o folosește în cuplaj
+        match = [None] * k
+        for p, v in enumerate(self.matching):
+            if v is not None and v not in owner and v in doms[p]:
+                owner[v] = p
+                match[p] = v
+
+        def augment(p, visited):
+            for v in doms[p]:
+                if v not in visited:
+                    visited.add(v)
+                    q = owner.get(v)
+                    if q is None or augment(q, visited):
+                        owner[v] = p
+                        match[p] = v
+                        return True
+            return False
+
+        for p in range(k):
+            if match[p] is None and not augment(p, set()):
+                return False
+        self.matching = match
+
+        # noduri: pozițiile 0..k-1, apoi valorile; muchie necuplată poziție -> valoare, cuplată valoare -> poziție
+        values = sorted({v for d in doms for v in d})
+        vid = {v: k + t for t, v in enumerate(values)}
+        adj: List[List[int]] = [[vid[v] for v in d if v != match[p]] for p, d in enumerate(doms)]
+        adj += [[owner[v]] if v in owner else [] for v in values]
+        preds: List[List[int]] = [[] for _ in adj]
+        for u, out in enumerate(adj):
+            for w in out:
+                preds[w].append(u)
+        reach = [False] * len(adj)
+        frontier = [vid[v] for v in values if v not in owner]
+        for u in frontier:
+            reach[u] = True
+        while frontier:
+            u = frontier.pop()
+            for w in preds[u]:
+                if not reach[w]:
+                    reach[w] = True
+                    frontier.append(w)
+        comp = _strongly_connected(adj)
+
+        for p, d in enumerate(doms):
+            kept = [v for v in d if v == match[p] or reach[vid[v]] or comp[p] == comp[vid[v]]]
+            if len(kept) != len(d) and not _narrow(model, self.scope[p], kept):
+                return False
+        return True
+
+
+class _LinearSumPropagator:
+    """Bounds propagation: every term is bounded by the rhs minus the extreme sums of the other terms."""
+
+    def __init__(self, gid: int, scope: List[int], coefficients: Sequence[int], op: str, rhs: int):
+        self.gid = gid
+        self.scope = tuple(scope)
+        self.coefficients = tuple(coefficients)
+        self.op = op
+        self.rhs = rhs
+
+    def initial_state(self):
+        return None
+
+    def check(self, model, i: int, x: int) -> bool:
+        # ca la constrângerile binare: verificată doar când toate celelalte variabile au valori
+        assignment = model.assignment
+        total = 0
+        for j, c in zip(self.scope, self.coefficients):
+            y = x if j == i else assignment[j]
+            if y == UNASSIGNED:
+                return True
+            total += c * y
+        return _compare(total, self.op, self.rhs)
+
+    def propagate(self, model, strong: bool) -> bool:
+        upper = self.op in ('=', '<=')
+        lower = self.op in ('=', '>=')
+        changed = True
+        while changed:
+            changed = False
+            terms = [(j, c, model.values_of(j)) for j, c in zip(self.scope, self.coefficients)]
+            lows = [min(c * v for v in d) for _, c, d in terms]
+            highs = [max(c * v for v in d) for _, c, d in terms]
+            lo, hi = sum(lows), sum(highs)
+            if (upper and lo > self.rhs) or (lower and hi < self.rhs):
+                return False
+            for t, (j, c, d) in enumerate(terms):
+                top = self.rhs - (lo - lows[t]) if upper else None
+                bottom = self.rhs - (hi - highs[t]) if lower else None
+                kept = [v for v in d if (top is None or c * v <= top) and (bottom is None or c * v >= bottom)]
+                if len(kept) != len(d):
+                    if not _narrow(model, j, kept):
+                        return False
+                    changed = True
+        return True
+
+
+class _TablePropagator:
+    """
+    Compact-table propagation: the still valid tuples form a bitset (an int), and
+    supports[p][v] is the bitset of tuples with value v at position p. Domains that changed
+    since the last call (a different list object) mask the bitset with the union of their
+    values' supports; a value stays if its supports meet the bitset. The state
+    (bitset, domains seen) is saved on the model's trail, so it is restored on backtrack.
+    """
+
+    def __init__(self, gid: int, scope: List[int], tuples: List[Tuple[int, ...]]):
+        self.gid = gid
+        self.scope = tuple(scope)
+        self.tuples = tuples
+        self.supports: List[Dict[int, int]] = [{} for _ in scope]
+        for t, row in enumerate(tuples):
+            for p, v in enumerate(row):
+                self.supports[p][v] = self.supports[p].get(v, 0) | (1 << t)
+        self.allowed = set(tuples)
+
+    def initial_state(self):
+        return (1 << len(self.tuples)) - 1, (None,) * len(self.scope)
+
+    def check(self, model, i: int, x: int) -> bool:
+        assignment = model.assignment
+        row = []
+        for j in self.scope:
+            y = x if j == i else assignment[j]
+            if y == UNASSIGNED:
+                return True
+            row.append(y)
+        return tuple(row) in self.allowed
+
+    def propagate(self, model, strong: bool) -> bool:
+        current, seen = model.gstate[self.gid]
+        doms = [model.values_of(j) for j in self.scope]
+        valid = current
+        for p, d in enumerate(doms):
+            if d is not seen[p]:
+                support = self.supports[p]
+                mask = 0
+                for v in d:
+                    mask |= support.get(v, 0)
+                valid &= mask
+        if not valid:
+            return False
+        for p, d in enumerate(doms):
+            support = self.supports[p]
+            kept = [v for v in d if support.get(v, 0) & valid]
+            if len(kept) != len(d) and not _narrow(model, self.scope[p], kept):
+                return False
+        seen = tuple(model.values_of(j) for j in self.scope)
+        model.set_state(self.gid, (valid, seen))
+        return True
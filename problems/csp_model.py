@@ -0,0 +1,595 @@
+import operator
+import random
+from array import array
+from typing import Callable, Dict, Hashable, Iterable, List, Mapping, Optional, Sequence
+
+# valoare santinelă în tabloul de asignări: nicio valoare de domeniu nu poate fi -2^63
+UNASSIGNED = -(1 << 63)
+
+EQ, NE, LT, GT, LE, GE = range(6)
+OP_CODES = {'=': EQ, '==': EQ, '!=': NE, '<': LT, '>': GT, '<=': LE, '>=': GE}
+OP_FUNCS = (operator.eq, operator.ne, operator.lt, operator.gt, operator.le, operator.ge)
+REVERSED_OP = (EQ, NE, GT, LT, GE, LE)
+
+VARIABLE_ORDERS = (None, "MRV", "MRV+deg", "dom/wdeg")
+RESTART_BASE = 32
+
+
+def luby(k: int) -> int:
+    """k-th term (1-based) of the Luby sequence 1, 1, 2, 1, 1, 2, 4, 1, ..."""
+    size = 1
+    while size < k + 1:
+        size = 2 * size + 1
+    while size > 1:
+        size //= 2
+        if k > size:
+            k -= size
+        elif k == size:
+            return (size + 1) // 2
+    return 1
+
+
+class _Restart(Exception):
+    pass
+
+
+def filter_values(op: int, x: int, values: Sequence[int]) -> List[int]:
+    """Values y from `values` with `x op y`, in their original order."""
+    if op == EQ:
+        return [x] if x in values else []
+    if op == NE:
+        return [y for y in values if y != x]
+    if op == LT:
+        return [y for y in values if y > x]
+    if op == GT:
+        return [y for y in values if y < x]
+    if op == LE:
+        return [y for y in values if y >= x]
+    return [y for y in values if y <= x]
+
+
+def supported_values(op: int, values: Sequence[int], other: Sequence[int]) -> List[int]:
+    """
+    Values x from `values` that have a support y in `other` with `x op y`. Order constraints
+    only need the extreme of `other`, `!=` only its size, so a revision is O(|values| + |other|).
+    """
+    if not other:
+        return []
+    if op == EQ:
+        other = set(other)
+        return [x for x in values if x in other]
+    if op == NE:
+        if len(other) > 1:
+            return list(values)
+        return [x for x in values if x != other[0]]
+    if op == LT:
+        hi = max(other)
+        return [x for x in values if x < hi]
+    if op == GT:
+        lo = min(other)
+        return [x for x in values if x > lo]
+    if op == LE:
+        hi = max(other)
+        return [x for x in values if x <= hi]
+    lo = min(other)
+    return [x for x in values if x >= lo]
+
+
+class CSPModel:
+    """
+    CSP compiled to integers: variable i is names[i], its neighbors are
+    nbr_idx[nbr_ptr[i]:nbr_ptr[i + 1]] with the operator codes of (i, j) and (j, i) in the
+    parallel nbr_op / nbr_rop arrays and the constraint id of the pair in nbr_cid. Global
+    constraints (see problems.csp_globals) are compiled to propagators with integer scopes;
+    var_globals[i] lists those on variable i and gstate holds their backtrackable state.
+    The constraint weights used by dom/wdeg grow by one each time a constraint causes a
+    failure and persist across restarts, like the recorded nogoods. The assignment is an
+    int64 array holding UNASSIGNED for free variables, and `unassigned` is kept up to date
+    by assign/unassign. Domains are lists that are never mutated: pruning replaces them and
+    records the old list on the trail, so undo(mark) restores every domain (and global
+    constraint state) changed since len(trail) was `mark`.
+    """
+
+    def __init__(self, variables: Iterable[Hashable], domains: Mapping, constraints: Mapping,
+                 constraint_types: Mapping, assignment: Optional[Mapping] = None,
+                 global_constraints: Sequence = ()):
+        self.names = list(variables)
+        self.index = {v: i for i, v in enumerate(self.names)}
+        n = len(self.names)
+        self.domains: List[List[int]] = [list(domains[v]) for v in self.names]
+
+        self.nbr_ptr = array('q', [0])
+        self.nbr_idx = array('q')
+        self.nbr_op = array('b')
+        self.nbr_rop = array('b')
+        self.nbr_cid = array('q')
+        cids = {}
+        for i, v in enumerate(self.names):
+            for nb in constraints.get(v, ()):
+                j = self.index.get(nb)
+                if j is None:
+                    continue
+                op = OP_CODES[constraint_types[(v, nb)]]
+                rop = constraint_types.get((nb, v))
+                self.nbr_idx.append(j)
+                self.nbr_op.append(op)
+                self.nbr_rop.append(REVERSED_OP[op] if rop is None else OP_CODES[rop])
+                self.nbr_cid.append(cids.setdefault((min(i, j), max(i, j)), len(cids)))
+            self.nbr_ptr.append(len(self.nbr_idx))
+        # aceleași arce, grupate pe variabilă, pentru buclele interioare
+        self.arcs = [tuple(zip(self.nbr_idx[self.nbr_ptr[i]:self.nbr_ptr[i + 1]],
+                               self.nbr_op[self.nbr_ptr[i]:self.nbr_ptr[i + 1]],
+                               self.nbr_rop[self.nbr_ptr[i]:self.nbr_ptr[i + 1]],
+                               self.nbr_cid[self.nbr_ptr[i]:self.nbr_ptr[i + 1]]))
+                     for i in range(n)]
+
+        self.assignment = array('q', [UNASSIGNED]) * n
+        self.unassigned = set(range(n))
+        self.trail: List[tuple] = []
+        self.globals = [c.compile(self.index, g) for g, c in enumerate(global_constraints)]
+        self.var_globals: List[List[int]] = [[] for _ in range(n)]
+        for g, prop in enumerate(self.globals):
+            for i in prop.scope:
+                self.var_globals[i].append(g)
+        self.gstate = [prop.initial_state() for prop in self.globals]
+        # ponderile globalelor urmează după cele ale perechilor binare
+        self.global_cid = len(cids)
+        self.weights = [1] * (len(cids) + len(self.globals))
+        # nogoods[(i, x)]: tuple-uri de asignări (j, y) care, toate prezente, interzic i = x
+        self.nogoods: Dict[tuple, List[tuple]] = {}
+        self.tiebreak = list(range(n))
+        for v, x in (assignment or {}).items():
+            if v in self.index:
+                # domeniul unei variabile deja asignate este chiar valoarea ei, pentru AC
+                self.domains[self.index[v]] = [x]
+                self.assign(self.index[v], x)
+
+    def __len__(self) -> int:
+        return len(self.names)
+
+    def neighbors(self, i: int) -> array:
+        return self.nbr_idx[self.nbr_ptr[i]:self.nbr_ptr[i + 1]]
+
+    def assign(self, i: int, x: int):
+        self.assignment[i] = x
+        self.unassigned.discard(i)
+
+    def unassign(self, i: int):
+        self.assignment[i] = UNASSIGNED
+        self.unassigned.add(i)
+
+    def solution(self) -> Dict:
+        """Current assignment keyed by variable name (free variables are left out)."""
+        if not self.unassigned:
+            return dict(zip(self.names, self.assignment))
+        return {self.names[i]: x for i, x in enumerate(self.assignment) if x != UNASSIGNED}
+
+    def select(self, order: Optional[str] = None, start: int = 0) -> Optional[int]:
+        """
+        Next variable to branch on. order=None takes the first unassigned one in variable
+        order; `start` is a hint that no variable before it is free, which keeps that O(1)
+        amortized along a search path. The dynamic orders pick the smallest domain ("MRV"),
+        then the most free neighbors ("MRV+deg"), or the smallest ratio of domain size to
+        the summed weight of the constraints towards free neighbors ("dom/wdeg"). Remaining
+        ties go to the earlier variable, or to a random one after shuffle_ties().
+        """
+        if not self.unassigned:
+            return None
+        if order is None:
+            assignment = self.assignment
+            i = start
+            while assignment[i] != UNASSIGNED:
+                i += 1
+            return i
+        domains, tiebreak = self.domains, self.tiebreak
+        if order == "MRV":
+            return min(self.unassigned, key=lambda i: (len(domains[i]), tiebreak[i]))
+        assignment, arcs = self.assignment, self.arcs
+        if order == "MRV+deg":
+            def key(i):
+                degree = sum(1 for j, _, _, _ in arcs[i] if assignment[j] == UNASSIGNED)
+                degree += len(self._live_globals(i))
+                return len(domains[i]), -degree, tiebreak[i]
+            return min(self.unassigned, key=key)
+        if order == "dom/wdeg":
+            weights = self.weights
+
+            def key(i):
+                wdeg = sum(weights[c] for j, _, _, c in arcs[i] if assignment[j] == UNASSIGNED)
+                wdeg += sum(weights[self.global_cid + g] for g in self._live_globals(i))
+                # variabilele fără vecini liberi nu mai pot eșua: le lăsăm la final
+                return (0, len(domains[i]) / wdeg, tiebreak[i]) if wdeg else (1, len(domains[i]), tiebreak[i])
+            return min(self.unassigned, key=key)
+        raise ValueError(f"Ordine necunoscută a variabilelor: {order}")
+
+    def _live_globals(self, i: int) -> List[int]:
+        # globalele lui i care mai au și alte variabile libere
+        if not self.var_globals[i]:
+            return []
+        assignment = self.assignment
+        return [g for g in self.var_globals[i]
+                if any(j != i and assignment[j] == UNASSIGNED for j in self.globals[g].scope)]
+
+    def values_of(self, i: int) -> List[int]:
+        """Domain of i, or just its value once assigned (FC leaves assigned domains unpruned)."""
+        x = self.assignment[i]
+        return self.domains[i] if x == UNASSIGNED else [x]
+
+    def shuffle_ties(self):
+        random.shuffle(self.tiebreak)
+
+    def order_values(self, i: int, lcv: bool = False) -> List[int]:
+        """
+        Domain of i in the order to try it: as stored, or with lcv least-constraining value
+        first, i.e. the value that removes the fewest values from the free neighbors.
+        """
+        values = self.domains[i]
+        if not lcv or len(values) < 2:
+            return values
+        assignment, domains = self.assignment, self.domains
+        free = [(domains[j], op) for j, op, _, _ in self.arcs[i] if assignment[j] == UNASSIGNED]
+        if not free:
+            return values
+        return sorted(values, key=lambda x: sum(len(dj) - len(filter_values(op, x, dj)) for dj, op in free))
+
+    def is_consistent(self, i: int, x: int) -> bool:
+        assignment = self.assignment
+        for j, op, _, c in self.arcs[i]:
+            y = assignment[j]
+            if y != UNASSIGNED and not OP_FUNCS[op](x, y):
+                self.weights[c] += 1
+                return False
+        for g in self.var_globals[i]:
+            if not self.globals[g].check(self, i, x):
+                self.weights[self.global_cid + g] += 1
+                return False
+        return True
+
+    def violates_nogood(self, i: int, x: int) -> bool:
+        assignment = self.assignment
+        for others in self.nogoods.get((i, x), ()):
+            if all(assignment[j] == y for j, y in others):
+                return True
+        return False
+
+    def prune(self, i: int, values: List[int]):
+        self.trail.append((i, self.domains[i]))
+        self.domains[i] = values
+
+    def set_state(self, g: int, state):
+        """Replace the state of global constraint g, saving the old one on the trail as (~g, state)."""
+        self.trail.append((~g, self.gstate[g]))
+        self.gstate[g] = state
+
+    def undo(self, mark: int):
+        domains, trail = self.domains, self.trail
+        while len(trail) > mark:
+            i, values = trail.pop()
+            if i >= 0:
+                domains[i] = values
+            else:
+                self.gstate[~i] = values
+
+    def forward_check(self, i: int, x: int) -> bool:
+        """Remove the values of free neighbors incompatible with i = x. False on a wipe-out."""
+        assignment, domains = self.assignment, self.domains
+        for j, op, _, c in self.arcs[i]:
+            if assignment[j] == UNASSIGNED:
+                dj = domains[j]
+                kept = filter_values(op, x, dj)
+                if len(kept) != len(dj):
+                    self.prune(j, kept)
+                if not kept:
+                    self.weights[c] += 1
+                    return False
+        return self._propagate_globals(self.var_globals[i], strong=False)
+
+    def _propagate_globals(self, gids: Iterable[int], strong: bool) -> bool:
+        for g in gids:
+            if not self.globals[g].propagate(self, strong):
+                self.weights[self.global_cid + g] += 1
+                return False
+        return True
+
+    def make_arc_consistent(self, into: Optional[int] = None, stats: Optional[dict] = None) -> bool:
+        """
+        AC-3 over the compiled arcs, each arc queued at most once at a time, interleaved with
+        the global constraints' full propagators until nothing changes. With `into` the
+        queues start from the arcs (k, into) and the globals on `into` only, as after a
+        domain change of `into`; otherwise from everything. `stats` counts arc revisions
+        under "revisions".
+        """
+        domains, arcs, trail, var_globals = self.domains, self.arcs, self.trail, self.var_globals
+        n = len(domains)
+        if into is None:
+            queue = [(i, j, rop, c) for j in range(n) for i, _, rop, c in arcs[j]]
+            gqueue = list(range(len(self.globals)))
+        else:
+            queue = [(k, into, rop, c) for k, _, rop, c in arcs[into]]
+            gqueue = list(var_globals[into])
+        queued = {i * n + j for i, j, _, _ in queue}
+        gqueued = set(gqueue)
+        head = revisions = 0
+        wiped = False
+        while True:
+            seen = len(trail)
+            while head < len(queue):
+                xi, xj, op, c = queue[head]
+                head += 1
+                queued.discard(xi * n + xj)
+                revisions += 1
+                di = domains[xi]
+                kept = supported_values(op, di, domains[xj])
+                if len(kept) == len(di):
+                    continue
+                self.prune(xi, kept)
+                if not kept:
+                    self.weights[c] += 1
+                    wiped = True
+                    break
+                for xk, _, rop, ck in arcs[xi]:
+                    key = xk * n + xi
+                    if xk != xj and key not in queued:
+                        queued.add(key)
+                        queue.append((xk, xi, rop, ck))
+                if head > 4096 and head * 2 > len(queue):
+                    del queue[:head]
+                    head = 0
+            if wiped or not self.globals:
+                break
+            # domeniile schimbate de revizii repun în coadă globalele lor
+            for v, _ in trail[seen:]:
+                if v >= 0:
+                    for g in var_globals[v]:
+                        if g not in gqueued:
+                            gqueued.add(g)
+                            gqueue.append(g)
+            if not gqueue:
+                break
+            g = gqueue.pop()
+            gqueued.discard(g)
+            seen = len(trail)
+            if not self._propagate_globals((g,), strong=True):
+                wiped = True
+                break
+            for v, _ in trail[seen:]:
+                if v < 0:
+                    continue
+                for xk, _, rop, ck in arcs[v]:
+                    key = xk * n + v
+                    if key not in queued:
+                        queued.add(key)
+                        queue.append((xk, v, rop, ck))
+                for h in var_globals[v]:
+                    if h != g and h not in gqueued:
+                        gqueued.add(h)
+                        gqueue.append(h)
+        if stats is not None:
+            stats["revisions"] = stats.get("revisions", 0) + revisions
+        return not wiped
+
+    def propagate(self, i: int, x: int, use_fc: bool = False, use_ac3: bool = False,
+                  stats: Optional[dict] = None) -> bool:
+        """Propagation after assign(i, x): forward checking, or MAC restricted to the arcs into i."""
+        if use_fc:
+            return self.forward_check(i, x)
+        if use_ac3:
+            self.prune(i, [x])
+            return self.make_arc_consistent(into=i, stats=stats)
+        return True
+
+    def search(self, on_solution: Callable[["CSPModel"], bool], order: Optional[str] = None,
+               use_fc: bool = False, use_ac3: bool = False, stats: Optional[dict] = None,
+               lcv: bool = False, node_limit: Optional[int] = None,
+               on_cutoff: Optional[Callable[[List[tuple]], None]] = None) -> Optional[bool]:
+        """
+        Depth-first search from the current state; on_solution is called on every complete
+        assignment and returns True to stop. Returns True if the search was stopped, False
+        once the space is exhausted, and None when more than `node_limit` values have been
+        tried. On such a cutoff on_cutoff receives the subtrees left unexplored, each as a
+        tuple of (variable, value) decisions from the current state; without on_cutoff the
+        refuted decisions of the abandoned branch are recorded as nogoods (nld-nogoods) so a
+        later run never explores them again. The model is back in its initial state
+        afterwards, except when stopped. `stats` counts tried values ("nodes").
+        """
+        domains, assignment, unassigned, trail = self.domains, self.assignment, self.unassigned, self.trail
+        is_consistent, select, order_values = self.is_consistent, self.select, self.order_values
+        nogoods = self.nogoods
+        propagate = use_fc or use_ac3
+        nodes = 0
+        path = []  # (variabilă, valori respinse după propagare sau subarbore epuizat, valori în ordinea încercării)
+
+        def descend(start):
+            nonlocal nodes
+            i = select(order, start)
+            if i is None:
+                return on_solution(self)
+            nxt = i + 1 if order is None else 0
+            unassigned.discard(i)
+            refuted = []
+            values = order_values(i, lcv)
+            path.append((i, refuted, values))
+            for x in values:
+                if node_limit is not None and nodes >= node_limit:
+                    raise _Restart(x)
+                nodes += 1
+                if not is_consistent(i, x) or (nogoods and self.violates_nogood(i, x)):
+                    continue
+                assignment[i] = x
+                mark = len(trail)
+                if propagate and not self.propagate(i, x, use_fc, use_ac3, stats):
+                    self.undo(mark)
+                    refuted.append(x)
+                    continue
+                if descend(nxt):
+                    return True
+                if len(trail) > mark:
+                    self.undo(mark)
+                refuted.append(x)
+            path.pop()
+            assignment[i] = UNASSIGNED
+            unassigned.add(i)
+            return False
+
+        mark = len(trail)
+        try:
+            return descend(0)
+        except _Restart as cutoff:
+            if on_cutoff is None:
+                self._record_nogoods(path)
+            else:
+                on_cutoff(self._open_subtrees(path, cutoff.args[0]))
+            for i, _, _ in path:
+                assignment[i] = UNASSIGNED
+                unassigned.add(i)
+            self.undo(mark)
+            return None
+        finally:
+            if stats is not None:
+                stats["nodes"] = stats.get("nodes", 0) + nodes
+
+    def _record_nogoods(self, path: List[tuple]):
+        # pentru nivelul k: deciziile pozitive de deasupra lui + o valoare respinsă la nivelul k
+        positives = []
+        for i, refuted, _ in path:
+            for x in refuted:
+                self.nogoods.setdefault((i, x), []).append(tuple(positives))
+            positives.append((i, self.assignment[i]))
+
+    def _open_subtrees(self, path: List[tuple], next_value: int) -> List[tuple]:
+        # pe fiecare nivel: valorile încă neîncercate, sub deciziile curente de deasupra
+        subtrees = []
+        prefix = ()
+        for depth, (i, _, values) in enumerate(path):
+            last = depth == len(path) - 1
+            current = next_value if last else self.assignment[i]
+            start = values.index(current) + (0 if last else 1)
+            subtrees.extend(prefix + ((i, x),) for x in values[start:])
+            prefix += ((i, current),)
+        return subtrees
+
+    def solve(self, order: Optional[str] = None, use_fc: bool = False, use_ac3: bool = False,
+              stats: Optional[dict] = None, lcv: bool = False, restarts: bool = False) -> bool:
+        """
+        First solution, left in the assignment. With restarts the search is cut off after
+        RESTART_BASE * luby(k) values on run k and started again with freshly shuffled ties,
+        keeping the nogoods and constraint weights learned so far (order defaults to
+        dom/wdeg, which is what makes the weights pay off). `stats` counts "restarts".
+        """
+        if not restarts:
+            return bool(self.search(lambda m: True, order, use_fc, use_ac3, stats, lcv))
+        order = order or "dom/wdeg"
+        run = 1
+        while True:
+            found = self.search(lambda m: True, order, use_fc, use_ac3, stats, lcv,
+                                node_limit=RESTART_BASE * luby(run))
+            if found is not None:
+                return found
+            if stats is not None:
+                stats["restarts"] = stats.get("restarts", 0) + 1
+            self.shuffle_ties()
+            run += 1
+
+    def search_cbj(self, order: Optional[str] = None, use_fc: bool = False, stats: Optional[dict] = None,
+                   lcv: bool = False) -> bool:
+        """
+        First solution by conflict-directed backjumping (CBJ, or FC-CBJ with use_fc). Every
+        variable collects the earlier variables its values failed against: the earliest
+        assigned neighbor violated by a value, and with FC the variables whose pruning wiped
+        out a future domain or emptied its own. When its values run out, the search jumps
+        straight back to the deepest variable of that conflict set, skipping every level in
+        between, and merges the set into that variable's own. Preassigned variables are
+        fixed and never enter a conflict set. Returns True with the solution left in the
+        assignment, False if there is none. `stats` counts tried values ("nodes"). Global
+        constraints are not supported: their failures have no conflict sets here.
+        """
+        if self.globals:
+            raise ValueError("CBJ nu suportă constrângeri globale")
+        domains, assignment, unassigned, arcs = self.domains, self.assignment, self.unassigned, self.arcs
+        weights, trail = self.weights, self.trail
+        select, order_values = self.select, self.order_values
+        depth = [-1] * len(self)  # nivelul variabilelor asignate de căutare, -1 pentru rest
+        past_fc = [[] for _ in range(len(self))]  # variabilele care au tăiat din domeniul fiecăreia
+        fc_log = []
+        nodes = 0
+
+        def culprit(i, x):
+            # None dacă i = x e consistentă; -1 dacă intră în conflict cu o variabilă dată
+            found = None
+            for j, op, _, c in arcs[i]:
+                y = assignment[j]
+                if y != UNASSIGNED and not OP_FUNCS[op](x, y):
+                    weights[c] += 1
+                    if depth[j] < 0:
+                        return -1
+                    if found is None or depth[j] < depth[found]:
+                        found = j
+            return found
+
+        def forward_check(i, x):
+            # variabila golită de FC, sau None
+            for j, op, _, c in arcs[i]:
+                if assignment[j] == UNASSIGNED:
+                    dj = domains[j]
+                    kept = filter_values(op, x, dj)
+                    if len(kept) != len(dj):
+                        self.prune(j, kept)
+                        past_fc[j].append(i)
+                        fc_log.append(j)
+                    if not kept:
+                        weights[c] += 1
+                        return j
+            return None
+
+        def undo(mark, fc_mark):
+            self.undo(mark)
+            while len(fc_log) > fc_mark:
+                past_fc[fc_log.pop()].pop()
+
+        def release(i):
+            assignment[i] = UNASSIGNED
+            unassigned.add(i)
+            depth[i] = -1
+
+        def descend(start, level):
+            nonlocal nodes
+            i = select(order, start)
+            if i is None:
+                return None
+            nxt = i + 1 if order is None else 0
+            unassigned.discard(i)
+            depth[i] = level
+            conflicts = set()
+            for x in order_values(i, lcv):
+                nodes += 1
+                j = culprit(i, x)
+                if j is not None:
+                    if j >= 0:
+                        conflicts.add(j)
+                    continue
+                assignment[i] = x
+                mark, fc_mark = len(trail), len(fc_log)
+                if use_fc:
+                    wiped = forward_check(i, x)
+                    if wiped is not None:
+                        conflicts.update(past_fc[wiped])
+                        undo(mark, fc_mark)
+                        continue
+                jump = descend(nxt, level + 1)
+                if jump is None:
+                    return None
+                undo(mark, fc_mark)
+                if i not in jump:
+                    release(i)
+                    return jump
+                conflicts |= jump
+            conflicts.update(past_fc[i])
+            conflicts.discard(i)
+            release(i)
+            return conflicts
+
+        try:
+            return descend(0, 0) is None
+        finally:
+            if stats is not None:
+                stats["nodes"] = stats.get("nodes", 0) + nodes
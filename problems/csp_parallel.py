@@ -0,0 +1,165 @@
+from concurrent.futures import FIRST_COMPLETED, ProcessPoolExecutor, wait
+from typing import Dict, Iterator, List, Optional, Tuple
+
+from problems.csp_model import CSPModel
+
+SPLIT_DEPTH = 2
+# după atâtea valori încercate, un worker predă subarborii rămași ca sarcini noi
+NODE_BUDGET = 20_000
+
+Prefix = Tuple[Tuple[int, int], ...]
+
+_worker = {}
+
+
+def _compile(variables, domains, constraints, constraint_types, assignment, global_constraints, use_fc,
+             use_ac3) -> Optional[CSPModel]:
+    model = CSPModel(variables, domains, constraints, constraint_types, assignment, global_constraints)
+    if use_ac3 and not use_fc and not model.make_arc_consistent():
+        return None
+    return model
+
+
+def _replay(model: CSPModel, prefix: Prefix, use_fc: bool, use_ac3: bool) -> bool:
+    """Apply the decisions of `prefix` with propagation; False if one of them fails."""
+    for i, x in prefix:
+        if not model.is_consistent(i, x):
+            return False
+        model.assign(i, x)
+        if not model.propagate(i, x, use_fc, use_ac3):
+            return False
+    return True
+
+
+def _rewind(model: CSPModel, prefix: Prefix, mark: int):
+    model.undo(mark)
+    for i, _ in prefix:
+        model.unassign(i)
+
+
+def _init_worker(csp, options):
+    _worker["model"] = _compile(*csp, options["use_fc"], options["use_ac3"])
+    _worker["options"] = options
+
+
+def _run_task(prefix: Prefix, node_budget: int, count_only: bool):
+    """
+    Enumerate the subtree under `prefix` in a worker, for at most `node_budget` tried values.
+    Returns (solutions or their number, unexplored subtrees as prefixes, nodes).
+    """
+    model, options = _worker["model"], _worker["options"]
+    found = 0 if count_only else []
+    pending: List[Prefix] = []
+    stats = {}
+    if model is None:
+        return found, pending, 0
+
+    def on_solution(m):
+        nonlocal found
+        if count_only:
+            found += 1
+        else:
+            found.append(tuple(m.assignment))
+        return False
+
+    mark = len(model.trail)
+    try:
+        if _replay(model, prefix, options["use_fc"], options["use_ac3"]):
+            model.search(on_solution, options["mrv"], options["use_fc"], options["use_ac3"], stats, options["lcv"],
+                         node_limit=node_budget,
+                         on_cutoff=lambda subtrees: pending.extend(prefix + s for s in subtrees))
+    finally:
+        _rewind(model, prefix, mark)
+    return found, pending, stats.get("nodes", 0)
+
+
+def _split(model: CSPModel, depth: int, options: dict) -> Tuple[List[Prefix], List[tuple]]:
+    """
+    Consistent prefixes of `depth` decisions (after propagation), following the search order,
+    plus the solutions reached before that depth.
+    """
+    prefixes: List[Prefix] = []
+    shallow: List[tuple] = []
+    use_fc, use_ac3 = options["use_fc"], options["use_ac3"]
+
+    def expand(prefix):
+        i = model.select(options["mrv"])
+        if i is None:
+            shallow.append(tuple(model.assignment))
+            return
+        if len(prefix) == depth:
+            prefixes.append(prefix)
+            return
+        for x in model.order_values(i, options["lcv"]):
+            if not model.is_consistent(i, x):
+                continue
+            model.assign(i, x)
+            mark = len(model.trail)
+            if model.propagate(i, x, use_fc, use_ac3):
+                expand(prefix + ((i, x),))
+            model.undo(mark)
+            model.unassign(i)
+
+    expand(())
+    return prefixes, shallow
+
+
+def _run_parallel(assignment, variables, domains, constraints, constraint_types, mrv, use_fc, use_ac3, lcv,
+                  split_depth, node_budget, max_workers, count_only, stats, global_constraints) -> Iterator:
+    # produce, pe măsură ce sosesc, loturi de soluții (tuple de valori) sau numere de soluții
+    options = dict(mrv=mrv, use_fc=use_fc, use_ac3=use_ac3, lcv=lcv)
+    csp = (list(variables), dict(domains), dict(constraints), dict(constraint_types), dict(assignment),
+           tuple(global_constraints))
+    model = _compile(*csp, use_fc, use_ac3)
+    if model is None:
+        return
+    prefixes, shallow = _split(model, split_depth, options)
+    if shallow:
+        yield len(shallow) if count_only else shallow
+    if not prefixes:
+        return
+
+    pool = ProcessPoolExecutor(max_workers, initializer=_init_worker, initargs=(csp, options))
+    try:
+        running = {pool.submit(_run_task, prefix, node_budget, count_only) for prefix in prefixes}
+        while running:
+            done, running = wait(running, return_when=FIRST_COMPLETED)
+            for future in done:
+                found, pending, nodes = future.result()
+                if stats is not None:
+                    stats["nodes"] = stats.get("nodes", 0) + nodes
+                    stats["tasks"] = stats.get("tasks", 0) + 1
+                # subarborii nefinalizați devin sarcini noi pentru workerii liberi
+                running |= {pool.submit(_run_task, prefix, node_budget, count_only) for prefix in pending}
+                if found:
+                    yield found
+    finally:
+        pool.shutdown(wait=False, cancel_futures=True)
+
+
+def iter_solutions_parallel(assignment, variables, domains, constraints, constraint_types, mrv=None, use_fc=False,
+                            use_ac3=False, lcv=False, split_depth: int = SPLIT_DEPTH,
+                            node_budget: int = NODE_BUDGET, max_workers: Optional[int] = None,
+                            stats: Optional[dict] = None, global_constraints=()) -> Iterator[Dict]:
+    """
+    Every solution extending `assignment` (the set backtrack_all_solutions returns), enumerated
+    in a process pool and yielded as soon as a worker reports it, in no particular order.
+    The tree is split into the consistent prefixes of `split_depth` decisions, one task each.
+    A task that tries `node_budget` values without finishing hands its unexplored subtrees
+    back as new tasks, so one heavy subtree is spread over the idle workers instead of
+    keeping a single one busy. `stats` gets the total "nodes" and the number of "tasks".
+    """
+    names = list(variables)
+    for batch in _run_parallel(assignment, variables, domains, constraints, constraint_types, mrv, use_fc, use_ac3,
+                               lcv, split_depth, node_budget, max_workers, False, stats, global_constraints):
+        for values in batch:
+            yield {**assignment, **dict(zip(names, values))}
+
+
+def count_solutions_parallel(assignment, variables, domains, constraints, constraint_types, mrv=None, use_fc=False,
+                             use_ac3=False, lcv=False, split_depth: int = SPLIT_DEPTH,
+                             node_budget: int = NODE_BUDGET, max_workers: Optional[int] = None,
+                             stats: Optional[dict] = None, global_constraints=()) -> int:
+    """Number of solutions, enumerated like iter_solutions_parallel; workers only send counts back."""
+    return sum(_run_parallel(assignment, variables, domains, constraints, constraint_types, mrv, use_fc, use_ac3,
+                             lcv, split_depth, node_budget, max_workers, True, stats, global_constraints))
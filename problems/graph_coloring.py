@@ -1,14 +1,159 @@
-from typing import Any, Iterable, Tuple, Dict, List, Set
+from typing import Any, Iterable, Optional, Tuple, Dict, List, Set, Union
 from problems.base_problem import Problem
+from problems.chromatic import CHROMATIC_MAX_NODES, CHROMATIC_TIME_LIMIT, chromatic_bounds, extends_coloring
+from problems.graph_csr import AdjacencyView, CSRGraph
+import heapq
 import random
 
+
+class _Step:
+    """One node colored on top of the parent step; the chain leads back to the initial coloring."""
+    __slots__ = ("parent", "node", "color", "depth", "changed")
+
+    def __init__(self, parent: Optional["_Step"], node: int, color: int, depth: int):
+        self.parent = parent
+        self.node = node
+        self.color = color
+        self.depth = depth
+        # vecinii cărora culoarea le-a intrat în mască la ultima aplicare a pasului
+        self.changed: List[int] = []
+
+
+class _Board:
+    """
+    DSATUR bookkeeping of the node indices, shared by every coloring grown from the same
+    initial one: the color of each node (-1 = uncolored), per-node bitsets of the colors
+    already used by neighbors, a lazy max-saturation heap and the number of uncolored nodes
+    with zero (dead) / one (tight) color left. The arrays describe one coloring at a time
+    (`current`); focus() moves them to another one by undoing the steps up to the common
+    ancestor and applying the ones down to the target, O(degree log V) per step.
+    """
+    __slots__ = ("adj", "colors", "color", "masks", "heap", "dead", "tight", "current")
+
+    def __init__(self, adj: List[List[int]], colors: int, coloring: Dict[int, int]):
+        self.adj = adj
+        self.colors = colors
+        self.color = [-1] * len(adj)
+        self.masks = [0] * len(adj)
+        for i, c in coloring.items():
+            self.color[i] = c
+            for j in adj[i]:
+                self.masks[j] |= 1 << c
+        self.dead = self.tight = 0
+        for i in range(len(adj)):
+            if self.color[i] < 0:
+                sat = self.masks[i].bit_count()
+                if sat >= colors:
+                    self.dead += 1
+                elif sat == colors - 1:
+                    self.tight += 1
+        self._rebuild_heap()
+        self.current: Optional[_Step] = None
+
+    def _rebuild_heap(self):
+        self.heap = [(-self.masks[i].bit_count(), -len(self.adj[i]), i)
+                     for i in range(len(self.adj)) if self.color[i] < 0]
+        heapq.heapify(self.heap)
+
+    def _count(self, sat: int, delta: int):
+        if sat >= self.colors:
+            self.dead += delta
+        elif sat == self.colors - 1:
+            self.tight += delta
+
+    def _mark(self, step: _Step):
+        i, bit = step.node, 1 << step.color
+        masks, color, heap = self.masks, self.color, self.heap
+        self._count(masks[i].bit_count(), -1)
+        color[i] = step.color
+        changed = []
+        for j in self.adj[i]:
+            if color[j] >= 0 or masks[j] & bit:
+                continue
+            sat = masks[j].bit_count()
+            masks[j] |= bit
+            self._count(sat, -1)
+            self._count(sat + 1, 1)
+            changed.append(j)
+            heapq.heappush(heap, (-sat - 1, -len(self.adj[j]), j))
+        step.changed = changed
+
+    def _unmark(self, step: _Step):
+        i, clear = step.node, ~(1 << step.color)
+        masks, heap = self.masks, self.heap
+        for j in step.changed:
+            sat = masks[j].bit_count()
+            masks[j] &= clear
+            self._count(sat, -1)
+            self._count(sat - 1, 1)
+            heapq.heappush(heap, (-sat + 1, -len(self.adj[j]), j))
+        self.color[i] = -1
+        sat = masks[i].bit_count()
+        self._count(sat, 1)
+        heapq.heappush(heap, (-sat, -len(self.adj[i]), i))
+
+    def focus(self, step: _Step):
+        a = self.current
+        if a is step:
+            return
+        redo = []
+        b = step
+        while a is not b:
+            if a.depth >= b.depth:
+                self._unmark(a)
+                a = a.parent
+            else:
+                redo.append(b)
+                b = b.parent
+        for s in reversed(redo):
+            self._mark(s)
+        self.current = step
+        if len(self.heap) > 2 * len(self.adj):
+            # prea multe intrări depășite: reconstruim heap-ul doar din nodurile necolorate
+            self._rebuild_heap()
+
+    def select(self) -> Optional[int]:
+        """Uncolored node index with maximum saturation, ties broken by degree."""
+        heap, color, masks = self.heap, self.color, self.masks
+        while heap:
+            neg_sat, _, i = heap[0]
+            if color[i] >= 0 or -neg_sat != masks[i].bit_count():
+                heapq.heappop(heap)  # intrare depășită
+                continue
+            return i
+        return None
+
+
+class ColoringState(dict):
+    """
+    Partial coloring (node -> color) used in path mode that also knows its last step and the
+    shared DSATUR board; board() moves the board to this coloring.
+    """
+    __slots__ = ("step", "_board")
+
+    def board(self) -> _Board:
+        self._board.focus(self.step)
+        return self._board
+
+
 class GraphColoringProblem(Problem):
-    def __init__(self, graph: Dict[int, Set[int]], colors: int, mode: str = 'path'):
-        self.graph = graph
+    def __init__(self, graph: Union[Dict[int, Set[int]], CSRGraph], colors: int, mode: str = 'path'):
+        # graful poate veni și în format CSR (instanțe mari); self.graph rămâne o vedere tip dict
+        if isinstance(graph, CSRGraph):
+            self.csr = graph
+            self.graph = AdjacencyView(graph)
+        else:
+            self.csr = None
+            self.graph = graph
         self.colors = colors
-        self.nodes = list(graph.keys())
+        self.nodes = list(self.graph.keys())
         self.mode = mode
         self.prefilled = None
+        self._index = {node: i for i, node in enumerate(self.nodes)}
+        if self.csr is not None:
+            self._adj = self.csr.adjacency_lists()
+        else:
+            self._adj = [[self._index[nb] for nb in graph[node]] for node in self.nodes]
 
     def initial_state(self) -> Dict[int,int]:
         if self.mode == 'local':
@@ -25,26 +170,53 @@ class GraphColoringProblem(Problem):
             if len(state) != len(self.nodes):
                 return False
             for node, color in state.items():
-                for nb in self.graph[node]:
+                for nb in self._neighbors(node):
                     if nb in state and state[nb] == color:
                         return False
             return True
 
     def _count_conflicts(self, state: Dict[int,int]) -> int:
         """Count the number of conflicting edges in the coloring."""
+        if self.csr is not None:
+            return self.csr.count_conflicts(self.csr.color_array(state, self.colors))
         count = 0
         for node, color in state.items():
-            for nb in self.graph[node]:
+            for nb in self._neighbors(node):
                 if nb in state and state[nb] == color and node < nb:
                     count += 1
         return count
 
     def valid_assignment(self, state: Dict[int,int], node: int, color: int) -> bool:
-        for nb in self.graph[node]:
+        for nb in self._neighbors(node):
             if nb in state and state[nb] == color:
                 return False
         return True
 
+    def _neighbors(self, node: int) -> Iterable[int]:
+        # pe CSR nodurile sunt chiar indicii, deci evităm construirea unui set prin vedere
+        if self.csr is not None:
+            return self._adj[node]
+        return self.graph[node]
+
+    def _as_coloring(self, state: Dict[int,int]) -> ColoringState:
+        if isinstance(state, ColoringState):
+            return state
+        colored = ColoringState(state)
+        # colorarea inițială e rădăcina lanțului de pași; tabla pornește fixată pe ea
+        colored.step = _Step(None, -1, -1, len(state))
+        colored._board = _Board(self._adj, self.colors, {self._index[node]: c for node, c in state.items()})
+        colored._board.current = colored.step
+        return colored
+
+    def _assign(self, parent: ColoringState, i: int, color: int) -> ColoringState:
+        # dicționarul se copiază (starea e colorarea întreagă, iar căutările îi calculează oricum repr-ul),
+        # dar tabla e comună: copilul primește doar un pas nou, aplicat în O(grad log V) la prima consultare
+        child = ColoringState(parent)
+        child[self.nodes[i]] = color
+        child.step = _Step(parent.step, i, color, len(child))
+        child._board = parent._board
+        return child
+
     def successors(self, state: Dict[int,int]) -> Iterable[Tuple[Dict[int,int], float]]:
         if self.mode == 'local':
             for node in self.nodes:
@@ -55,38 +227,78 @@ class GraphColoringProblem(Problem):
                         new_state[node] = new_color
                         yield new_state, 1.0
         else:
-            uncolored = [n for n in self.nodes if n not in state]
-            if not uncolored:
+            colored = self._as_coloring(state)
+            board = colored.board()
+            i = board.select()
+            if i is None:
                 return
-            
-            uncolored.sort(key=lambda n: len(self.graph[n]), reverse=True)
-            node = uncolored[0]
-            
+
+            mask = board.masks[i]
             for c in range(self.colors):
-                if self.valid_assignment(state, node, c):
-                    new_state = state.copy()
-                    new_state[node] = c
-                    yield new_state, 1.0
+                if not (mask >> c) & 1:
+                    yield self._assign(colored, i, c), 1.0
 
     def heuristic(self, state: Dict[int,int]) -> float:
+        # scor de maximizat (hill climbing, simulated annealing, beam), în ambele moduri
+        return -self.cost_to_go(state)
+
+    def cost_to_go(self, state: Dict[int,int]) -> float:
         if self.mode == 'local':
-            return -self._count_conflicts(state)
-        else:
-            uncolored = [n for n in self.nodes if n not in state]
-            if not uncolored:
-                return 0.0
-            
-            
-            penalty = 0.0
-            for node in uncolored:
-                neighbor_colors = {state[nb] for nb in self.graph[node] if nb in state}
-                remaining_colors = self.colors - len(neighbor_colors)
-                if remaining_colors == 0:
-                    penalty += 100.0
-                elif remaining_colors == 1:
-                    penalty += 0.5
-            
-            return -(len(uncolored) + penalty)
+            return float(self._count_conflicts(state))
+        uncolored = len(self.nodes) - len(state)
+        if not uncolored:
+            return 0.0
+
+        # fiecare nod necolorat costă o mutare, nodurile fără culori rămase blochează
+        board = self._as_coloring(state).board()
+        penalty = 100.0 * board.dead + 0.5 * board.tight
+        return uncolored + penalty
+
+    def components(self) -> List[List[int]]:
+        """Connected components as lists of nodes, largest first."""
+        seen = bytearray(len(self.nodes))
+        comps = []
+        for s in range(len(self.nodes)):
+            if seen[s]:
+                continue
+            seen[s] = 1
+            comp = [s]
+            for i in comp:
+                for j in self._adj[i]:
+                    if not seen[j]:
+                        seen[j] = 1
+                        comp.append(j)
+            comps.append([self.nodes[i] for i in comp])
+        comps.sort(key=len, reverse=True)
+        return comps
+
+    def subproblem(self, nodes: Iterable[int]) -> "GraphColoringProblem":
+        """Problem on the subgraph induced by `nodes`, with the matching part of the prefill."""
+        keep = set(nodes)
+        graph = {node: {nb for nb in self._neighbors(node) if nb in keep} for node in keep}
+        sub = GraphColoringProblem(graph, self.colors, mode=self.mode)
+        if isinstance(self.prefilled, dict):
+            sub.prefill({k: v for k, v in self.prefilled.items() if k in keep})
+        return sub
+
+    def chromatic_number(self, max_nodes: int = CHROMATIC_MAX_NODES,
+                         time_limit: float = CHROMATIC_TIME_LIMIT) -> Tuple[int, int, Dict[int,int]]:
+        """
+        Bounds (lower, upper) on the chromatic number of the graph and a coloring with `upper`
+        colors. lower == upper means the value is exact; see chromatic.chromatic_bounds.
+        """
+        lower, upper, coloring = chromatic_bounds(self._adj, max_nodes, time_limit)
+        return lower, upper, {node: coloring[i] for i, node in enumerate(self.nodes)}
+
+    def prefill_extends(self, max_nodes: int = CHROMATIC_MAX_NODES,
+                        time_limit: float = CHROMATIC_TIME_LIMIT) -> Optional[bool]:
+        """
+        Whether the prefilled colors can be completed with `colors` colors (None when the
+        limits ran out first); see chromatic.extends_coloring.
+        """
+        prefilled = self.prefilled if isinstance(self.prefilled, dict) else {}
+        precolored = {self._index[node]: c for node, c in prefilled.items() if node in self._index}
+        return extends_coloring(self._adj, self.colors, precolored, max_nodes, time_limit)
 
     def prefill(self, mapping: Any) -> None:
         if mapping is None:
@@ -151,7 +363,7 @@ class GraphColoringProblem(Problem):
             c = int(color)
             if not (0 <= c < self.colors):
                 return False, f"Color {c} out of range for node {node}"
-            for nb in self.graph[int(node)]:
+            for nb in self._neighbors(int(node)):
                 if nb in solution and int(solution[nb]) == c:
                     return False, f"Edge conflict between {node} and {nb} with color {c}"
         return True, ""
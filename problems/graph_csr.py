@@ -0,0 +1,222 @@
+import os
+from array import array
+from collections.abc import Mapping
+from pathlib import Path
+from typing import Dict, Iterable, Iterator, Optional, Set, Tuple, Union
+
+import numpy as np
+
+MAX_SAMPLING_ROUNDS = 64
+CACHE_DIR = Path(__file__).resolve().parents[1] / "cache" / "graphs"
+
+# format binar: magic, (noduri, len(indices)) ca int64, indptr int64, indices int32 - little endian
+_MAGIC = b"CSRGRAF1"
+_HEADER = len(_MAGIC) + 16
+
+
+class CSRGraph:
+    """
+    Undirected graph in compressed-sparse-row form: the neighbors of node i are
+    indices[indptr[i]:indptr[i + 1]]. Nodes are 0..num_nodes-1 and every edge is stored
+    in both directions.
+    """
+
+    def __init__(self, indptr: np.ndarray, indices: np.ndarray):
+        self.indptr = np.asarray(indptr, dtype=np.int64)
+        self.indices = np.asarray(indices, dtype=np.int32)
+        self.num_nodes = len(self.indptr) - 1
+
+    @classmethod
+    def from_edges(cls, u: np.ndarray, v: np.ndarray, num_nodes: int) -> "CSRGraph":
+        """Build from edge endpoint arrays; self-loops and duplicate edges are dropped."""
+        u = np.asarray(u, dtype=np.int64)
+        v = np.asarray(v, dtype=np.int64)
+        keep = u != v
+        lo = np.minimum(u[keep], v[keep])
+        hi = np.maximum(u[keep], v[keep])
+        keys = np.unique(lo * num_nodes + hi)
+        lo, hi = keys // num_nodes, keys % num_nodes
+        src = np.concatenate([lo, hi])
+        dst = np.concatenate([hi, lo])
+        order = np.lexsort((dst, src))
+        counts = np.bincount(src, minlength=num_nodes)
+        indptr = np.zeros(num_nodes + 1, dtype=np.int64)
+        np.cumsum(counts, out=indptr[1:])
+        return cls(indptr, dst[order])
+
+    @classmethod
+    def from_dict(cls, graph: Dict[int, Iterable[int]]) -> "CSRGraph":
+        """Nodes must be 0..len(graph)-1, as produced by the generators."""
+        n = len(graph)
+        u = np.fromiter((a for a, nbs in graph.items() for _ in nbs), dtype=np.int64)
+        v = np.fromiter((b for nbs in graph.values() for b in nbs), dtype=np.int64)
+        return cls.from_edges(u, v, n)
+
+    @property
+    def num_edges(self) -> int:
+        return len(self.indices) // 2
+
+    def degrees(self) -> np.ndarray:
+        return np.diff(self.indptr)
+
+    def neighbors(self, i: int) -> np.ndarray:
+        return self.indices[self.indptr[i]:self.indptr[i + 1]]
+
+    def adjacency_lists(self) -> list:
+        return [a.tolist() for a in np.split(self.indices, self.indptr[1:-1])]
+
+    def to_dict(self) -> Dict[int, Set[int]]:
+        return {i: set(nbs) for i, nbs in enumerate(self.adjacency_lists())}
+
+    def color_array(self, state: Dict[int, int], colors: int) -> np.ndarray:
+        """Dense color vector (-1 = uncolored), int8 when the palette allows it."""
+        dtype = np.int8 if colors <= 127 else np.int16
+        arr = np.full(self.num_nodes, -1, dtype=dtype)
+        if state:
+            keys = np.fromiter(state.keys(), dtype=np.int64, count=len(state))
+            arr[keys] = np.fromiter(state.values(), dtype=np.int64, count=len(state))
+        return arr
+
+    def count_conflicts(self, color_arr: np.ndarray) -> int:
+        """Number of edges whose two (colored) endpoints share a color."""
+        src = np.repeat(np.arange(self.num_nodes), self.degrees())
+        a = color_arr[src]
+        same = (a == color_arr[self.indices]) & (a >= 0)
+        return int(np.count_nonzero(same)) // 2
+
+
+class AdjacencyView(Mapping):
+    """Read-only Dict[int, Set[int]] view over a CSRGraph, so existing code keeps working."""
+
+    def __init__(self, csr: CSRGraph):
+        self.csr = csr
+
+    def __getitem__(self, node: int) -> Set[int]:
+        if not (isinstance(node, (int, np.integer)) and 0 <= node < self.csr.num_nodes):
+            raise KeyError(node)
+        return set(self.csr.neighbors(int(node)).tolist())
+
+    def __iter__(self) -> Iterator[int]:
+        return iter(range(self.csr.num_nodes))
+
+    def __len__(self) -> int:
+        return self.csr.num_nodes
+
+    def __contains__(self, node) -> bool:
+        return isinstance(node, (int, np.integer)) and 0 <= node < self.csr.num_nodes
+
+
+def planted_coloring_graph(nodes: int, edges: int, colors: int,
+                           seed: Optional[int] = None) -> Tuple[CSRGraph, int]:
+    """
+    Random graph that is colorable with `colors` colors: node i belongs to class i % colors
+    and edges are sampled uniformly among pairs of nodes from different classes.
+    Returns the graph and the number of edges actually generated (it can be lower than
+    requested when the graph cannot hold that many).
+    """
+    rng = np.random.default_rng(seed)
+    n = max(0, int(nodes))
+    if n < 2 or colors < 2 or edges <= 0:
+        return CSRGraph.from_edges(np.empty(0), np.empty(0), n), 0
+
+    sizes = np.bincount(np.arange(n) % colors, minlength=colors)
+    max_edges = int((n * n - int((sizes * sizes).sum())) // 2)
+    target = min(int(edges), max_edges)
+
+    keys = np.empty(0, dtype=np.int64)
+    for _ in range(MAX_SAMPLING_ROUNDS):
+        need = target - len(keys)
+        if need <= 0:
+            break
+        # eșantionăm în lot; perechile din aceeași clasă și duplicatele se elimină vectorizat
+        batch = 2 * need + 64
+        u = rng.integers(0, n, size=batch)
+        v = rng.integers(0, n, size=batch)
+        ok = (u % colors) != (v % colors)
+        lo = np.minimum(u[ok], v[ok])
+        hi = np.maximum(u[ok], v[ok])
+        keys = np.unique(np.concatenate([keys, lo * n + hi]))
+
+    if len(keys) > target:
+        keys = rng.permutation(keys)[:target]
+    graph = CSRGraph.from_edges(keys // n, keys % n, n)
+    return graph, graph.num_edges
+
+
+def parse_dimacs(lines: Iterable[str]) -> CSRGraph:
+    """
+    Streaming parser for DIMACS .col files ("p edge N M" header, "e u v" lines, 1-based).
+    Endpoints go straight into typed arrays, so no Python list of edges is ever built.
+    """
+    n = None
+    u = array("q")
+    v = array("q")
+    for line in lines:
+        tag = line[:1]
+        if tag == "e":
+            _, a, b = line.split()[:3]
+            u.append(int(a) - 1)
+            v.append(int(b) - 1)
+        elif tag == "p":
+            n = int(line.split()[2])
+    if n is None:
+        raise ValueError("DIMACS file has no 'p edge' line")
+    src = np.frombuffer(u, dtype=np.int64)
+    dst = np.frombuffer(v, dtype=np.int64)
+    if len(src) and (min(src.min(), dst.min()) < 0 or max(src.max(), dst.max()) >= n):
+        raise ValueError(f"DIMACS edge endpoint outside 1..{n}")
+    return CSRGraph.from_edges(src, dst, n)
+
+
+def load_dimacs(path: Union[str, Path]) -> CSRGraph:
+    with open(path, "r", encoding="utf-8", errors="replace") as f:
+        return parse_dimacs(f)
+
+
+def save_binary(graph: CSRGraph, path: Union[str, Path]) -> None:
+    with open(path, "wb") as f:
+        f.write(_MAGIC)
+        f.write(np.array([graph.num_nodes, len(graph.indices)], dtype="<i8").tobytes())
+        f.write(graph.indptr.astype("<i8").tobytes())
+        f.write(graph.indices.astype("<i4").tobytes())
+
+
+def load_binary(path: Union[str, Path]) -> CSRGraph:
+    """Memory-map a graph written by save_binary; the arrays are used in place, without copies."""
+    with open(path, "rb") as f:
+        head = f.read(_HEADER)
+    if len(head) < _HEADER or head[:len(_MAGIC)] != _MAGIC:
+        raise ValueError(f"{path} is not a binary CSR graph")
+    n, nnz = (int(x) for x in np.frombuffer(head[len(_MAGIC):], dtype="<i8"))
+    indptr = np.memmap(path, dtype="<i8", mode="r", offset=_HEADER, shape=(n + 1,))
+    if nnz:
+        indices = np.memmap(path, dtype="<i4", mode="r", offset=_HEADER + 8 * (n + 1), shape=(nnz,))
+    else:
+        indices = np.empty(0, dtype=np.int32)
+    return CSRGraph(indptr, indices)
+
+
+def load_graph(path: Union[str, Path], cache_dir: Optional[Path] = None) -> CSRGraph:
+    """
+    Load a .col (DIMACS) or .csr (binary) graph. A parsed .col file is cached in binary form,
+    keyed by name, size and modification time, so later loads only map the cached file.
+    """
+    path = Path(path)
+    if path.suffix == ".csr":
+        return load_binary(path)
+
+    directory = Path(cache_dir) if cache_dir is not None else CACHE_DIR
+    stat = path.stat()
+    cached = directory / f"{path.stem}_{stat.st_size}_{int(stat.st_mtime)}.csr"
+    if cached.exists():
+        return load_binary(cached)
+
+    graph = load_dimacs(path)
+    try:
+        directory.mkdir(parents=True, exist_ok=True)
+        tmp = cached.with_suffix(".tmp")
+        save_binary(graph, tmp)
+        os.replace(tmp, cached)
+    except OSError:
+        pass  # cache indisponibil - graful parsat rămâne valid
+    return graph
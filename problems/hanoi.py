@@ -1,5 +1,41 @@
-from typing import Any, Iterable, Tuple
+from collections import deque
+from functools import lru_cache
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Tuple
 from problems.base_problem import Problem
+from problems.hanoi_pdb import HanoiPatternDatabase, pattern_size
+
+Move = Tuple[int, int, int]
+
+# discurile mici dintr-o stare arbitrară sunt rezolvate exact prin BFS cât timp spațiul are cel mult atâtea stări
+SEARCH_MAX_STATES = 4096
+
+
+@lru_cache(maxsize=None)
+def frame_stewart_table(num_towers: int, num_disks: int) -> Tuple[List[List[int]], List[List[int]]]:
+    """
+    Frame–Stewart move counts and optimal splits.
+
+    cost[k][m] is the number of moves for a tower of m disks using k pegs; split[k][m] is how
+    many of the smallest disks are parked on an intermediate peg before the rest is moved with
+    k - 1 pegs. For k = 3 the split is m - 1, i.e. the classical optimal recursion.
+    """
+    cost = [[0] * (num_disks + 1) for _ in range(num_towers + 1)]
+    split = [[0] * (num_disks + 1) for _ in range(num_towers + 1)]
+    for m in range(1, num_disks + 1):
+        cost[3][m] = 2 ** m - 1
+        split[3][m] = m - 1
+    for k in range(4, num_towers + 1):
+        if num_disks >= 1:
+            cost[k][1] = 1
+        for m in range(2, num_disks + 1):
+            best_t, best = 1, None
+            for t in range(1, m):
+                c = 2 * cost[k][t] + cost[k - 1][m - t]
+                if best is None or c < best:
+                    best_t, best = t, c
+            cost[k][m] = best
+            split[k][m] = best_t
+    return cost, split
 
 class GeneralizedHanoi(Problem):
     def __init__(self, num_towers: int, num_disks: int, target_tower: int = 2, initial_positions: Tuple[int, ...] = None):
@@ -16,6 +52,7 @@ class GeneralizedHanoi(Problem):
             self._initial_positions = tuple(int(p) for p in initial_positions)
         else:
             self._initial_positions = None
+        self._pdb = None
 
     def initial_state(self) -> Tuple[int, ...]:
         if getattr(self, "prefilled", None) is not None:
@@ -57,10 +94,154 @@ class GeneralizedHanoi(Problem):
                     new_disks[moving_disk - 1] = j
                     yield tuple([n] + new_disks), 1.0
 
+    def num_states(self) -> Optional[int]:
+        return self.num_towers ** self.num_disks
+
+    def state_index(self, state: Tuple[int, ...]) -> int:
+        idx = 0
+        for p in reversed(state[1:]):
+            idx = idx * self.num_towers + (p - 1)
+        return idx
+
+    def index_state(self, index: int) -> Tuple[int, ...]:
+        positions = []
+        for _ in range(self.num_disks):
+            index, p = divmod(index, self.num_towers)
+            positions.append(p + 1)
+        return tuple([self.num_towers] + positions)
+
+    def tower_moves(self, num_disks: int, src: int, dst: int) -> Iterator[Move]:
+        """Stream the Frame–Stewart moves for the tower of disks 1..num_disks from src to dst."""
+        _, split = frame_stewart_table(self.num_towers, self.num_disks)
+        pegs = tuple(range(1, self.num_towers + 1))
+        # stivă explicită: ("tower", lo, hi, src, dst, pegs) sau ("move", disc, src, dst); O(n) elemente
+        stack: List[tuple] = [("tower", 1, num_disks, src, dst, pegs)]
+        while stack:
+            task = stack.pop()
+            if task[0] == "move":
+                yield task[1], task[2], task[3]
+                continue
+            _, lo, hi, a, b, avail = task
+            m = hi - lo + 1
+            if m <= 0 or a == b:
+                continue
+            if m == 1:
+                yield lo, a, b
+                continue
+            t = split[len(avail)][m]
+            via = next(p for p in avail if p != a and p != b)
+            rest = tuple(p for p in avail if p != via)
+            stack.append(("tower", lo, lo + t - 1, via, b, avail))
+            stack.append(("tower", lo + t, hi, a, b, rest))
+            stack.append(("tower", lo, lo + t - 1, a, via, avail))
+
+    def _search_moves(self, positions: List[int], num_disks: int, dst: int) -> List[Move]:
+        """Optimal moves (BFS) bringing disks 1..num_disks onto dst; larger disks never block them."""
+        start = tuple(positions[:num_disks])
+        goal = tuple([dst] * num_disks)
+        if start == goal:
+            return []
+        parent: Dict[tuple, Optional[Tuple[tuple, Move]]] = {start: None}
+        q = deque([start])
+        while q:
+            cur = q.popleft()
+            if cur == goal:
+                break
+            tops: Dict[int, int] = {}
+            for disk, peg in enumerate(cur, start=1):
+                tops.setdefault(peg, disk)
+            for a, disk in tops.items():
+                for b in range(1, self.num_towers + 1):
+                    if b != a and (b not in tops or disk < tops[b]):
+                        nxt = list(cur)
+                        nxt[disk - 1] = b
+                        nxt = tuple(nxt)
+                        if nxt not in parent:
+                            parent[nxt] = (cur, (disk, a, b))
+                            q.append(nxt)
+        moves = []
+        node = goal
+        while parent[node] is not None:
+            node, mv = parent[node]
+            moves.append(mv)
+        moves.reverse()
+        return moves
+
+    def _plan(self) -> Tuple[List[int], List[int], int]:
+        """
+        Greedy plan for an arbitrary start: walking from the largest disk down, every disk that
+        is not already where it must end up needs the smaller disks gathered on some other peg.
+        Returns (positions, targets, base) where disks 1..base are left to the exact search.
+        """
+        positions = list(self.initial_state()[1:])
+        n = self.num_disks
+        targets = [0] * (n + 1)
+        if n == 0:
+            return positions, targets, 0
+        targets[n] = self.target_tower
+        for k in range(n, 1, -1):
+            src = positions[k - 1]
+            if src == targets[k]:
+                targets[k - 1] = targets[k]
+                continue
+            below = positions[k - 2]
+            if below != src and below != targets[k]:
+                targets[k - 1] = below
+            else:
+                targets[k - 1] = next(p for p in range(1, self.num_towers + 1) if p != src and p != targets[k])
+        base = min(n, pattern_size(self.num_towers, SEARCH_MAX_STATES))
+        return positions, targets, base
+
+    def solution_moves(self) -> Iterator[Move]:
+        """
+        Stream (disk, from_peg, to_peg) moves from the initial state to the goal.
+
+        A start with every disk on one peg uses the optimal recursion (3 pegs) or Frame–Stewart
+        (4+ pegs). Any other legal start uses the greedy plan from `_plan` with an exact BFS
+        for the smallest disks, which is optimal for 3 pegs.
+        """
+        positions = list(self.initial_state()[1:])
+        if len(set(positions)) <= 1:
+            if positions:
+                yield from self.tower_moves(self.num_disks, positions[0], self.target_tower)
+            return
+
+        positions, targets, base = self._plan()
+        yield from self._search_moves(positions, base, targets[base])
+        for k in range(base + 1, self.num_disks + 1):
+            src = positions[k - 1]
+            if src != targets[k]:
+                yield k, src, targets[k]
+                yield from self.tower_moves(k - 1, targets[k - 1], targets[k])
+
+    def solution_length(self) -> int:
+        """Length of `solution_moves()`, computed without generating the moves."""
+        cost, _ = frame_stewart_table(self.num_towers, self.num_disks)
+        positions = list(self.initial_state()[1:])
+        if len(set(positions)) <= 1:
+            if not positions or positions[0] == self.target_tower:
+                return 0
+            return cost[self.num_towers][self.num_disks]
+
+        positions, targets, base = self._plan()
+        total = len(self._search_moves(positions, base, targets[base]))
+        for k in range(base + 1, self.num_disks + 1):
+            if positions[k - 1] != targets[k]:
+                total += 1 + cost[self.num_towers][k - 1]
+        return total
+
+    def solve(self) -> Tuple[int, ...]:
+        """Play `solution_moves()` from the initial state and return the final state."""
+        state = list(self.initial_state())
+        for disk, _, dst in self.solution_moves():
+            state[disk] = dst
+        return tuple(state)
+
     def heuristic(self, state: Tuple[int, ...]) -> float:
-        disks = state[1:]
-        not_on_target = sum(1 for t in disks if t != self.target_tower)
-        return -not_on_target
+        """Admissible cost-to-go from the additive pattern databases."""
+        if self._pdb is None:
+            self._pdb = HanoiPatternDatabase(self.num_towers, self.num_disks)
+        return float(self._pdb.value(state[1:], self.target_tower))
 
     
     def prefill(self, positions: Any) -> None:
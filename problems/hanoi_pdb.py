@@ -0,0 +1,130 @@
+import mmap
+import os
+from pathlib import Path
+from typing import Dict, List, Optional, Sequence, Tuple, Union
+
+CACHE_DIR = Path(__file__).resolve().parents[1] / "cache" / "hanoi_pdb"
+MAX_PDB_ENTRIES = 1 << 18
+
+_UNSEEN = 255
+_CAP = 254
+
+_tables: Dict[str, Union[mmap.mmap, bytearray]] = {}
+
+
+def pattern_size(num_towers: int, max_entries: int = MAX_PDB_ENTRIES) -> int:
+    """Largest number of disks whose abstract state space fits in max_entries."""
+    size = 1
+    while num_towers ** (size + 1) <= max_entries:
+        size += 1
+    return size
+
+
+def build_table(num_towers: int, size: int) -> bytearray:
+    """
+    Exact distances for `size` disks to the goal "all disks on peg 0", one byte per state.
+
+    A state is indexed as sum(peg[d] * num_towers ** d), disk 0 being the smallest.
+    Moves are reversible, so a BFS from the goal gives the distance to the goal.
+    Distances above 254 are clamped, which keeps the table a valid lower bound.
+    """
+    T = num_towers
+    dist = bytearray([_UNSEEN]) * (T ** size)
+    weights = [T ** d for d in range(size)]
+    dist[0] = 0
+    frontier = [0]
+    level = 0
+    while frontier:
+        level += 1
+        value = min(level, _CAP)
+        next_frontier = []
+        for idx in frontier:
+            # top[p] = cel mai mic disc de pe tija p (size = tija goală)
+            top = [size] * T
+            rest = idx
+            for d in range(size):
+                p = rest % T
+                rest //= T
+                if top[p] == size:
+                    top[p] = d
+            for a in range(T):
+                da = top[a]
+                if da == size:
+                    continue
+                w = weights[da]
+                for b in range(T):
+                    if b != a and da < top[b]:
+                        j = idx + (b - a) * w
+                        if dist[j] == _UNSEEN:
+                            dist[j] = value
+                            next_frontier.append(j)
+        frontier = next_frontier
+    return dist
+
+
+def load_table(num_towers: int, size: int, cache_dir: Optional[Path] = None) -> Union[mmap.mmap, bytearray]:
+    """
+    Return the table for (num_towers, size), memory-mapped from the cache directory.
+
+    The distances only depend on how many disks the pattern holds, not on which ones,
+    so every subset of the same size shares one file.
+    """
+    directory = Path(cache_dir) if cache_dir is not None else CACHE_DIR
+    path = directory / f"hanoi_T{num_towers}_k{size}.pdb"
+    key = str(path)
+    if key in _tables:
+        return _tables[key]
+
+    expected = num_towers ** size
+    try:
+        if not path.exists() or path.stat().st_size != expected:
+            directory.mkdir(parents=True, exist_ok=True)
+            tmp = path.with_suffix(".tmp")
+            tmp.write_bytes(build_table(num_towers, size))
+            os.replace(tmp, path)
+        with open(path, "rb") as f:
+            table = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+    except OSError:
+        # cache indisponibil (ex: director read-only) - păstrăm tabela în memorie
+        table = build_table(num_towers, size)
+
+    _tables[key] = table
+    return table
+
+
+class HanoiPatternDatabase:
+    """
+    Disjoint additive pattern databases for Generalized Hanoi.
+
+    Disks are split into consecutive groups (largest disks first). Each move relocates a
+    single disk, so it is counted by exactly one group and the sum of the group distances
+    never overestimates the real cost-to-go.
+    """
+
+    def __init__(self, num_towers: int, num_disks: int, max_entries: int = MAX_PDB_ENTRIES,
+                 cache_dir: Optional[Path] = None):
+        self.num_towers = num_towers
+        self.num_disks = num_disks
+        size = min(pattern_size(num_towers, max_entries), max(1, num_disks))
+
+        self.groups: List[Tuple[int, int]] = []
+        hi = num_disks
+        while hi > 0:
+            lo = max(0, hi - size)
+            self.groups.append((lo, hi))
+            hi = lo
+        self.tables = [load_table(num_towers, hi - lo, cache_dir) for lo, hi in self.groups]
+
+    def value(self, positions: Sequence[int], target: int) -> int:
+        """Lower bound on the moves needed to bring every disk (1-based pegs) onto `target`."""
+        T = self.num_towers
+        total = 0
+        for (lo, hi), table in zip(self.groups, self.tables):
+            idx = 0
+            w = 1
+            for p in positions[lo:hi]:
+                # tijele sunt simetrice: renumerotăm astfel încât ținta devine tija 0
+                idx += ((p - target) % T) * w
+                w *= T
+            total += table[idx]
+        return total
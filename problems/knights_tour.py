@@ -1,6 +1,83 @@
-from typing import Any, Iterable, Tuple, List
+from array import array
+from pathlib import Path
+from typing import Any, Dict, Iterable, Optional, Tuple, List
 from problems.base_problem import Problem
 
+TOUR_CACHE_DIR = Path(__file__).resolve().parents[1] / "cache" / "knights_tours"
+
+_tour_library: Dict[Tuple[int, int, int], List[tuple]] = {}
+
+
+class _Step:
+    """One square appended to a path; the chain of parents leads back to the initial path."""
+    __slots__ = ("parent", "square", "depth")
+
+    def __init__(self, parent: Optional["_Step"], square: int, depth: int):
+        self.parent = parent
+        self.square = square
+        self.depth = depth
+
+
+class _Board:
+    """
+    Visited flags and unvisited-neighbor counts of the squares r * n + c, shared by every
+    path grown from the same initial path. The arrays describe one path at a time
+    (`current`); focus() moves them to another one by unmarking the squares up to the
+    common ancestor and marking the ones down to the target, O(8) per step, so a parent
+    and its children (what the searches mostly alternate between) are a few steps apart.
+    """
+    __slots__ = ("neighbors", "visited", "degree", "current")
+
+    def __init__(self, neighbors: List[tuple], squares: Iterable[int]):
+        self.neighbors = neighbors
+        self.visited = bytearray(len(neighbors))
+        self.degree = bytearray(len(nb) for nb in neighbors)
+        for sq in squares:
+            self._mark(sq)
+        self.current: Optional[_Step] = None
+
+    def _mark(self, sq: int):
+        self.visited[sq] = 1
+        degree = self.degree
+        for t in self.neighbors[sq]:
+            degree[t] -= 1
+
+    def _unmark(self, sq: int):
+        self.visited[sq] = 0
+        degree = self.degree
+        for t in self.neighbors[sq]:
+            degree[t] += 1
+
+    def focus(self, step: _Step):
+        a = self.current
+        if a is step:
+            return
+        redo = []
+        b = step
+        while a is not b:
+            if a.depth >= b.depth:
+                self._unmark(a.square)
+                a = a.parent
+            else:
+                redo.append(b.square)
+                b = b.parent
+        for sq in reversed(redo):
+            self._mark(sq)
+        self.current = step
+
+
+class TourPath(list):
+    """
+    Knight's Tour path (list of (r, c)) that also knows its last step and the shared board
+    with the visited squares and the remaining degrees; board() moves the board to this path.
+    """
+    __slots__ = ("step", "_board")
+
+    def board(self) -> _Board:
+        self._board.focus(self.step)
+        return self._board
+
+
 class KnightsTourProblem(Problem):
     MOVES = [(2,1),(1,2),(-1,2),(-2,1),(-2,-1),(-1,-2),(1,-2),(2,-1)]
 
@@ -9,9 +86,16 @@ class KnightsTourProblem(Problem):
         self.start = start
         self.total = n * n
         self.prefilled = None
+        self.coords = [(r, c) for r in range(n) for c in range(n)]
+        self.neighbors = [
+            tuple((r + dr) * n + (c + dc) for dr, dc in self.MOVES if self.in_bounds(r + dr, c + dc))
+            for r, c in self.coords
+        ]
 
     def initial_state(self):
-        return [self.start]  
+        if self.prefilled:
+            return self._as_tour(self.prefilled)
+        return self._as_tour([self.start])
 
     def is_goal(self, state: List[tuple]) -> bool:
         return len(state) == self.total
@@ -19,44 +103,52 @@ class KnightsTourProblem(Problem):
     def in_bounds(self, r:int, c:int) -> bool:
         return 0 <= r < self.n and 0 <= c < self.n
 
+    def _as_tour(self, state: List[tuple]) -> TourPath:
+        if isinstance(state, TourPath):
+            return state
+        path = TourPath(tuple(p) for p in state)
+        # drumul inițial e rădăcina lanțului de pași; tabla pornește fixată pe el
+        path.step = _Step(None, -1, len(path))
+        path._board = _Board(self.neighbors, (r * self.n + c for r, c in path))
+        path._board.current = path.step
+        return path
+
+    def _extend(self, path: TourPath, sq: int) -> TourPath:
+        # lista trebuie copiată (starea e drumul întreg, iar căutările îi calculează oricum repr-ul),
+        # dar tabla e comună: copilul primește doar un pas nou, aplicat la prima consultare
+        child = TourPath(path)
+        child.append(self.coords[sq])
+        child.step = _Step(path.step, sq, len(child))
+        child._board = path._board
+        return child
+
     def successors(self, state: List[tuple]) -> Iterable[Tuple[List[tuple], float]]:
-        r,c = state[-1]
-        visited = set(state)
-        
-        possible_moves = []
-        for dr,dc in self.MOVES:
-            nr, nc = r+dr, c+dc
-            if self.in_bounds(nr,nc) and (nr,nc) not in visited:
-                onward_moves = 0
-                for dr2, dc2 in self.MOVES:
-                    nr2, nc2 = nr + dr2, nc + dc2
-                    if self.in_bounds(nr2, nc2) and (nr2, nc2) not in visited:
-                        onward_moves += 1
-                possible_moves.append((onward_moves, (nr, nc)))
-        
-        possible_moves.sort(key=lambda x: x[0])
-        
-        for _, (nr, nc) in possible_moves:
-            yield state + [(nr,nc)], 1.0
+        path = self._as_tour(state)
+        r, c = path[-1]
+        board = path.board()
+        visited = board.visited
+
+        # Warnsdorff: mutările spre pătrate cu mai puține continuări întâi
+        candidates = [t for t in self.neighbors[r * self.n + c] if not visited[t]]
+        candidates.sort(key=board.degree.__getitem__)
+
+        for t in candidates:
+            yield self._extend(path, t), 1.0
 
     def heuristic(self, state: List[tuple]) -> float:
         
         if len(state) == self.total:
             return 0.0  
         
-        r, c = state[-1]
-        visited = set(state)
+        path = self._as_tour(state)
+        r, c = path[-1]
+        board = path.board()
+        visited = board.visited
+        degree = board.degree
         accessibility_sum = 0
-        
-        for dr, dc in self.MOVES:
-            nr, nc = r + dr, c + dc
-            if self.in_bounds(nr, nc) and (nr, nc) not in visited:
-                onward_moves = 0
-                for dr2, dc2 in self.MOVES:
-                    nr2, nc2 = nr + dr2, nc + dc2
-                    if self.in_bounds(nr2, nc2) and (nr2, nc2) not in visited and (nr2, nc2) != (r, c):
-                        onward_moves += 1
-                accessibility_sum += onward_moves
+        for t in self.neighbors[r * self.n + c]:
+            if not visited[t]:
+                accessibility_sum += degree[t]
         
         return -accessibility_sum
 
@@ -69,11 +161,47 @@ class KnightsTourProblem(Problem):
             return
         self.prefilled = path
 
+    def library_tour(self, cache_dir: Optional[Path] = None) -> Optional[List[tuple]]:
+        """
+        A complete tour from self.start, generated once per (n, start) with Warnsdorff and
+        stored in the cache directory as raw uint32 square indices.
+        """
+        r0, c0 = int(self.start[0]), int(self.start[1])
+        key = (self.n, r0, c0)
+        if key in _tour_library:
+            return _tour_library[key]
+
+        directory = Path(cache_dir) if cache_dir is not None else TOUR_CACHE_DIR
+        path = directory / f"tour_n{self.n}_{r0}_{c0}.bin"
+        squares = array('I')
+        if path.exists():
+            squares.frombytes(path.read_bytes())
+        if len(squares) != self.total:
+            from algorithms.warnsdorff import warnsdorff
+            tour = warnsdorff(KnightsTourProblem(self.n, start=(r0, c0)))
+            if tour is None:
+                return None
+            squares = array('I', (r * self.n + c for r, c in tour))
+            try:
+                directory.mkdir(parents=True, exist_ok=True)
+                path.write_bytes(squares.tobytes())
+            except OSError:
+                pass
+
+        tour = [self.coords[sq] for sq in squares]
+        _tour_library[key] = tour
+        return tour
+
     def prefill_level(self, level: float) -> None:
         if level <= 0.0:
             self.prefilled = None
             return
         k = max(1, round(self.total * level))
+        # prefixul unui tur complet se poate mereu continua, spre deosebire de o plimbare greedy
+        tour = self.library_tour()
+        if tour is not None:
+            self.prefilled = tour[:k]
+            return
         path = [tuple(self.start)]
         for _ in range(k - 1):
             r, c = path[-1]
@@ -0,0 +1,177 @@
+from typing import List, Optional, Sequence, Tuple, Union
+
+import numpy as np
+
+Node = Union[int, list]
+
+
+def _leaf_dtype(leaf_min: int, leaf_max: int):
+    info = np.iinfo(np.int32)
+    return np.int32 if info.min <= leaf_min and leaf_max <= info.max else np.int64
+
+
+class FlatMinimaxTree:
+    """
+    Minimax tree with every leaf on the last level, stored in level order: nodes are numbered
+    from 0 (the root) level by level, internal node k has child_count[k] children starting at
+    node child_offset[k], and the leaves are the last nodes, node first_leaf + t holding
+    leaf_values[t]. Levels alternate MAX (the root) and MIN. Only internal nodes have an
+    offset and a count, so a large tree costs a few bytes per leaf instead of a Python int
+    inside a list.
+    """
+
+    def __init__(self, child_offset: np.ndarray, child_count: np.ndarray, leaf_values: np.ndarray):
+        self.child_offset = np.asarray(child_offset, dtype=np.int64)
+        self.child_count = np.asarray(child_count, dtype=np.int32)
+        self.leaf_values = np.asarray(leaf_values)
+        self.first_leaf = len(self.child_count)
+        if len(self.child_offset) != self.first_leaf or (self.first_leaf and (
+                self.child_offset[0] != 1 or self.child_count.min() < 1
+                or np.any(self.child_offset[1:] != self.child_offset[:-1] + self.child_count[:-1]))):
+            raise ValueError("Copiii nodurilor nu sunt consecutivi în ordinea nivelurilor")
+
+        # level_start[l] = primul nod de pe nivelul l; ultimul element e numărul total de noduri
+        starts = [0, 1]
+        while starts[-2] < self.first_leaf:
+            if starts[-1] > self.first_leaf:
+                raise ValueError("Frunzele trebuie să fie toate pe ultimul nivel")
+            last = starts[-1] - 1
+            starts.append(int(self.child_offset[last] + self.child_count[last]))
+        if starts[-2] != self.first_leaf or starts[-1] != self.first_leaf + len(self.leaf_values):
+            raise ValueError("Frunzele trebuie să fie toate pe ultimul nivel")
+        self.level_start = np.array(starts, dtype=np.int64)
+        self.depth = len(starts) - 1
+
+    @classmethod
+    def random(cls, branching: int, depth: int, leaf_min: int, leaf_max: int,
+               seed: Optional[int] = None) -> "FlatMinimaxTree":
+        """
+        Same distribution as MinimaxTreeProblem: `depth` levels, every internal node with 2 to
+        `branching` children, leaves uniform in [leaf_min, leaf_max]; generated level by level.
+        """
+        rng = np.random.default_rng(seed)
+        counts = []
+        width = 1
+        for _ in range(depth - 1):
+            level = rng.integers(min(2, branching), branching + 1, size=width, dtype=np.int32)
+            counts.append(level)
+            width = int(level.sum(dtype=np.int64))
+        child_count = np.concatenate(counts) if counts else np.empty(0, dtype=np.int32)
+        child_offset = np.ones(len(child_count), dtype=np.int64)
+        np.cumsum(child_count[:-1], out=child_offset[1:])
+        child_offset[1:] += 1
+        leaf_values = rng.integers(leaf_min, leaf_max + 1, size=width, dtype=_leaf_dtype(leaf_min, leaf_max))
+        return cls(child_offset, child_count, leaf_values)
+
+    @classmethod
+    def from_nested(cls, root: Node) -> "FlatMinimaxTree":
+        """Level-order arrays of a tree given as nested lists with int leaves."""
+        counts: List[int] = []
+        leaves: List[int] = []
+        level = [root]
+        while level:
+            if all(isinstance(node, int) for node in level):
+                leaves = level
+                break
+            if any(isinstance(node, int) for node in level):
+                raise ValueError("Frunzele trebuie să fie toate pe ultimul nivel")
+            counts.extend(len(node) for node in level)
+            level = [child for node in level for child in node]
+        child_count = np.array(counts, dtype=np.int32)
+        child_offset = np.ones(len(counts), dtype=np.int64)
+        np.cumsum(child_count[:-1], out=child_offset[1:])
+        child_offset[1:] += 1
+        return cls(child_offset, child_count, np.array(leaves, dtype=_leaf_dtype(min(leaves), max(leaves))))
+
+    def node_at(self, path: Sequence[int]) -> int:
+        """Index of the node reached from the root through children path[0], path[1], ..."""
+        node = 0
+        for k in path:
+            if node >= self.first_leaf or not 0 <= k < self.child_count[node]:
+                raise ValueError(f"Nodul nu are copilul {k}: {list(path)}")
+            node = int(self.child_offset[node]) + k
+        return node
+
+    def subtree(self, path: Sequence[int] = ()) -> Node:
+        """The subtree at `path` as nested lists, without building the rest of the tree."""
+        return self._build(self.node_at(path))
+
+    def _build(self, node: int) -> Node:
+        if node >= self.first_leaf:
+            return int(self.leaf_values[node - self.first_leaf])
+        start = int(self.child_offset[node])
+        return [self._build(start + k) for k in range(int(self.child_count[node]))]
+
+    def to_nested(self) -> Node:
+        """The tree as nested lists (for display); built bottom-up, level by level."""
+        nodes: List[Node] = self.leaf_values.tolist()
+        for level in range(self.depth - 2, -1, -1):
+            lo, hi = int(self.level_start[level]), int(self.level_start[level + 1])
+            nodes = [nodes[o - hi:o - hi + c]
+                     for o, c in zip(self.child_offset[lo:hi].tolist(), self.child_count[lo:hi].tolist())]
+        return nodes[0]
+
+    def total_leaves(self) -> int:
+        return len(self.leaf_values)
+
+    def minimax(self) -> int:
+        """Root value without pruning: one vectorized max/min reduction per level, from the leaves up."""
+        values = self.leaf_values
+        for level in range(self.depth - 2, -1, -1):
+            lo, hi = self.level_start[level], self.level_start[level + 1]
+            reduce = np.maximum if level % 2 == 0 else np.minimum
+            values = reduce.reduceat(values, self.child_offset[lo:hi] - hi)
+        return int(values[0])
+
+    def alphabeta(self) -> Tuple[int, int]:
+        """
+        Root value and number of leaves evaluated by alpha-beta, visiting children left to right
+        exactly like MinimaxTreeProblem.run_minimax_alphabeta, with an explicit stack instead of
+        recursion. Parents of leaves scan their slice of leaf_values in place.
+        """
+        offsets, counts, leaf_values, first_leaf = self.child_offset, self.child_count, self.leaf_values, self.first_leaf
+        if first_leaf == 0:
+            return int(leaf_values[0]), 1
+        evaluated = 0
+
+        def open_node(node, alpha, beta, maximizing):
+            # nodul cu frunze se rezolvă direct; altfel i se pune un cadru pe stivă
+            nonlocal evaluated
+            start = int(offsets[node])
+            end = start + int(counts[node])
+            if start < first_leaf:
+                stack.append([start, end, alpha, beta, float('-inf') if maximizing else float('inf'), maximizing])
+                return None
+            best = float('-inf') if maximizing else float('inf')
+            for value in leaf_values[start - first_leaf:end - first_leaf].tolist():
+                evaluated += 1
+                if maximizing:
+                    best = max(best, value)
+                    alpha = max(alpha, value)
+                else:
+                    best = min(best, value)
+                    beta = min(beta, value)
+                if beta <= alpha:
+                    break
+            return best
+
+        # cadru: [următorul copil, sfârșitul copiilor, alpha, beta, cea mai bună valoare, MAX?]
+        stack: List[list] = []
+        result = open_node(0, float('-inf'), float('inf'), True)
+        while stack:
+            frame = stack[-1]
+            if result is not None:
+                if frame[5]:
+                    frame[4] = max(frame[4], result)
+                    frame[2] = max(frame[2], result)
+                else:
+                    frame[4] = min(frame[4], result)
+                    frame[3] = min(frame[3], result)
+                if frame[3] <= frame[2] or frame[0] == frame[1]:
+                    result = frame[4]
+                    stack.pop()
+                    continue
+            child = frame[0]
+            frame[0] += 1
+            result = open_node(child, frame[2], frame[3], not frame[5])
+        return int(result), evaluated
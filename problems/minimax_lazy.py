@@ -0,0 +1,165 @@
+from typing import Iterator, List, Optional, Sequence, Tuple, Union
+
+import numpy as np
+
+Node = Union[int, list]
+
+MASK = (1 << 64) - 1
+GOLDEN = 0x9E3779B97F4A7C15
+_M1 = 0xBF58476D1CE4E5B9
+_M2 = 0x94D049BB133111EB
+# câte chei de noduri se expandează odată la numărarea vectorizată a frunzelor
+COUNT_BLOCK = 1 << 16
+
+
+def mix(z: int) -> int:
+    """SplitMix64 finalizer: a bijective 64-bit hash, the counter-based RNG of the lazy trees."""
+    z = ((z ^ (z >> 30)) * _M1) & MASK
+    z = ((z ^ (z >> 27)) * _M2) & MASK
+    return z ^ (z >> 31)
+
+
+def _mix_array(z: np.ndarray) -> np.ndarray:
+    # aceeași funcție pe uint64; înmulțirile pe tablouri se reduc modulo 2^64 fără avertismente
+    z = (z ^ (z >> np.uint64(30))) * np.uint64(_M1)
+    z = (z ^ (z >> np.uint64(27))) * np.uint64(_M2)
+    return z ^ (z >> np.uint64(31))
+
+
+class LazyMinimaxTree:
+    """
+    Minimax tree that is never stored: every node has a 64-bit key, the root's derived from
+    `seed` and the k-th child's from its parent's, mix(parent + (k + 1) * GOLDEN). One draw
+    mix(key) gives an internal node's number of children (2..branching) or a leaf's value,
+    so any node is reproducible from the seed and its path, and alpha-beta only hashes the
+    nodes it visits. Same shape and distribution as MinimaxTreeProblem: `depth` levels, all
+    leaves on the last, MAX at the root.
+    """
+
+    def __init__(self, branching: int, depth: int, leaf_min: int, leaf_max: int, seed: int):
+        self.branching = branching
+        self.depth = depth
+        self.leaf_min = leaf_min
+        self.leaf_max = leaf_max
+        self.seed = seed
+        self.root_key = mix(seed & MASK)
+        self._min_children = min(2, branching)
+        self._child_span = branching - self._min_children + 1
+        self._leaf_span = leaf_max - leaf_min + 1
+        self._total_leaves: Optional[int] = None
+
+    @staticmethod
+    def child_key(key: int, k: int) -> int:
+        return mix((key + (k + 1) * GOLDEN) & MASK)
+
+    def num_children(self, key: int) -> int:
+        return self._min_children + mix(key) % self._child_span
+
+    def leaf_value(self, key: int) -> int:
+        return self.leaf_min + mix(key) % self._leaf_span
+
+    def node_key(self, path: Sequence[int]) -> int:
+        """Key of the node reached from the root through children path[0], path[1], ..."""
+        if len(path) >= self.depth:
+            raise ValueError(f"Drum mai lung decât adâncimea arborelui: {list(path)}")
+        key = self.root_key
+        for k in path:
+            if not 0 <= k < self.num_children(key):
+                raise ValueError(f"Nodul nu are copilul {k}: {list(path)}")
+            key = self.child_key(key, k)
+        return key
+
+    def node_info(self, path: Sequence[int] = ()) -> Tuple[bool, int]:
+        """(True, value) for the leaf or (False, number of children) for the internal node at `path`."""
+        key = self.node_key(path)
+        if len(path) == self.depth - 1:
+            return True, self.leaf_value(key)
+        return False, self.num_children(key)
+
+    def subtree(self, path: Sequence[int] = ()) -> Node:
+        """The subtree at `path` as nested lists, e.g. to render one branch of a huge tree."""
+        return self._build(self.node_key(path), self.depth - 1 - len(path))
+
+    def _build(self, key: int, height: int) -> Node:
+        if height == 0:
+            return self.leaf_value(key)
+        return [self._build(self.child_key(key, k), height - 1) for k in range(self.num_children(key))]
+
+    def total_leaves(self) -> int:
+        """
+        Number of leaves: only the internal nodes' child counts are drawn, vectorized level by
+        level in blocks of COUNT_BLOCK keys (memory bounded by depth * COUNT_BLOCK * branching).
+        Cached after the first call.
+        """
+        if self._total_leaves is None:
+            if self.depth == 1:
+                self._total_leaves = 1
+            else:
+                self._total_leaves = sum(self._count_leaves(np.array([self.root_key], dtype=np.uint64), 0))
+        return self._total_leaves
+
+    def _count_leaves(self, keys: np.ndarray, level: int) -> Iterator[int]:
+        counts = self._min_children + (_mix_array(keys) % np.uint64(self._child_span)).astype(np.int64)
+        if level == self.depth - 2:
+            yield int(counts.sum())
+            return
+        block = max(1, COUNT_BLOCK // self.branching)
+        for lo in range(0, len(keys), block):
+            block_counts = counts[lo:lo + block]
+            parents = np.repeat(keys[lo:lo + block], block_counts)
+            starts = np.cumsum(block_counts) - block_counts
+            k = np.arange(len(parents), dtype=np.uint64) - np.repeat(starts, block_counts).astype(np.uint64)
+            yield from self._count_leaves(_mix_array(parents + (k + np.uint64(1)) * np.uint64(GOLDEN)), level + 1)
+
+    def alphabeta(self) -> Tuple[int, int]:
+        """
+        Root value and number of leaves evaluated by alpha-beta, in the same order as
+        MinimaxTreeProblem.run_minimax_alphabeta, with an explicit stack; a node's children are
+        derived only when the search reaches them.
+        """
+        if self.depth == 1:
+            return self.leaf_value(self.root_key), 1
+        evaluated = 0
+        leaf_parent = self.depth - 2
+
+        def open_node(key, level, alpha, beta, maximizing):
+            nonlocal evaluated
+            count = self.num_children(key)
+            if level < leaf_parent:
+                stack.append([key, 0, count, level, alpha, beta,
+                              float('-inf') if maximizing else float('inf'), maximizing])
+                return None
+            best = float('-inf') if maximizing else float('inf')
+            for k in range(count):
+                value = self.leaf_value(self.child_key(key, k))
+                evaluated += 1
+                if maximizing:
+                    best = max(best, value)
+                    alpha = max(alpha, value)
+                else:
+                    best = min(best, value)
+                    beta = min(beta, value)
+                if beta <= alpha:
+                    break
+            return best
+
+        # cadru: [cheie, următorul copil, număr de copii, nivel, alpha, beta, cea mai bună valoare, MAX?]
+        stack: List[list] = []
+        result = open_node(self.root_key, 0, float('-inf'), float('inf'), True)
+        while stack:
+            frame = stack[-1]
+            if result is not None:
+                if frame[7]:
+                    frame[6] = max(frame[6], result)
+                    frame[4] = max(frame[4], result)
+                else:
+                    frame[6] = min(frame[6], result)
+                    frame[5] = min(frame[5], result)
+                if frame[5] <= frame[4] or frame[1] == frame[2]:
+                    result = frame[6]
+                    stack.pop()
+                    continue
+            child = self.child_key(frame[0], frame[1])
+            frame[1] += 1
+            result = open_node(child, frame[3] + 1, frame[4], frame[5], not frame[7])
+        return int(result), evaluated
@@ -1,3 +1,5 @@
+from typing import Optional
+
 from problems.minimax_tree import MinimaxTreeProblem
 from utils.display import print_minimax_tree, print_minimax_results
 
@@ -9,6 +11,8 @@ def run_minimax_quiz():
 
     print("\nArborele generat:")
     print_minimax_tree(prob)
+    if not prob.is_nested:
+        _explore_tree(prob)
     print("\nÎntrebare:")
     print("Pentru arborele dat, care este valoarea de la rădăcină și câte noduri frunză vor fi evaluate aplicând MinMax cu Alpha-Beta?")
     print("Introduceți răspunsul sub formă de două numere întregi.")
@@ -35,12 +39,31 @@ def _generate_random_tree() -> MinimaxTreeProblem:
     depth = int(input("Adâncime/nivele (default 3): ") or "3")
     low = int(input("Valoare frunză minimă (default -10): ") or "-10")
     high = int(input("Valoare frunză maximă (default 10): ") or "10")
+    # cu seed arborele e generat leneș și se poate reproduce exact din aceiași parametri
+    seed = input("Seed pentru un arbore reproductibil (gol = aleator): ").strip()
 
-    return MinimaxTreeProblem(
+    prob = MinimaxTreeProblem(
         branching=max_leaves,
         depth=depth,
-        leaf_min=low, leaf_max=high
+        leaf_min=low, leaf_max=high,
+        lazy=bool(seed), seed=int(seed) if seed else None
     )
+    if prob.lazy is not None:
+        print(f"Seed arbore: {prob.seed}")
+    return prob
+
+
+def _explore_tree(prob: MinimaxTreeProblem):
+    # arborele mare e afișat doar parțial; utilizatorul poate deschide orice nod după drumul lui
+    while True:
+        text = input("Drumul unui nod de afișat (ex: '0 2 1', gol = continuă): ").strip()
+        if not text:
+            return
+        try:
+            path = tuple(int(k) for k in text.split())
+            print_minimax_tree(prob, path)
+        except ValueError as e:
+            print(f"Drum invalid: {e}")
 
 
 def _get_user_answers() -> tuple:
@@ -59,7 +82,7 @@ def _get_user_answers() -> tuple:
 
 
 def _calculate_minimax_score(user_root: int, user_leaves: int, correct_root: int, 
-                            correct_visited: int, total_leaves: int, 
+                            correct_visited: int, total_leaves: Optional[int], 
                             leaf_min: int, leaf_max: int) -> tuple:
    
     if user_root == correct_root and user_leaves == correct_visited:
@@ -1,8 +1,16 @@
 import random
-from typing import Tuple, Union
+from typing import Optional, Sequence, Tuple, Union
+
+from problems.minimax_flat import FlatMinimaxTree
+from problems.minimax_lazy import LazyMinimaxTree
 
 Node = Union[int, list]  
 
+# peste atâtea frunze posibile (branching ** (depth - 1)) arborele se generează direct în tablouri NumPy
+FLAT_LEAF_THRESHOLD = 100_000
+# arborii lazy își numără frunzele doar sub atâtea frunze posibile; peste, numărul e raportat indisponibil
+LAZY_COUNT_THRESHOLD = 1_000_000
+
 
 class MinimaxTreeProblem:
     def __init__(
@@ -11,12 +19,67 @@ class MinimaxTreeProblem:
         depth: int = 3,
         leaf_min: int = -10,
         leaf_max: int = 10,
+        flat: Optional[bool] = None,
+        lazy: bool = False,
+        seed: Optional[int] = None,
     ):
         self.branching = max(1, int(branching))
         self.depth = max(1, int(depth))
         self.leaf_min = int(leaf_min)
         self.leaf_max = int(leaf_max)
-        self.root = self._generate_node(self.depth)
+        if flat is None:
+            flat = not lazy and self.branching ** (self.depth - 1) > FLAT_LEAF_THRESHOLD
+        # arborii mari stau în FlatMinimaxTree sau nu se stochează deloc (lazy, reproductibil din seed);
+        # self.root (liste imbricate) se construiește doar la afișare
+        self.flat = None
+        self.lazy = None
+        self._root = None
+        self.seed = seed
+        if lazy:
+            if self.seed is None:
+                self.seed = random.getrandbits(64)
+            self.lazy = LazyMinimaxTree(self.branching, self.depth, self.leaf_min, self.leaf_max, self.seed)
+        elif flat:
+            self.flat = FlatMinimaxTree.random(self.branching, self.depth, self.leaf_min, self.leaf_max,
+                                               seed=random.getrandbits(64))
+        else:
+            self._root = self._generate_node(self.depth)
+
+    @property
+    def root(self) -> Node:
+        if self._root is None:
+            self._root = self.lazy.subtree() if self.lazy is not None else self.flat.to_nested()
+        return self._root
+
+    @property
+    def is_nested(self) -> bool:
+        """True when the tree is held as nested lists; flat and lazy trees are only shown partially."""
+        return self.flat is None and self.lazy is None
+
+    def subtree(self, path: Sequence[int] = ()) -> Node:
+        """The subtree reached through children path[0], path[1], ...; flat and lazy trees build only that branch."""
+        if self.lazy is not None:
+            return self.lazy.subtree(path)
+        if self.flat is not None:
+            return self.flat.subtree(path)
+        node = self.root
+        for k in path:
+            if isinstance(node, int) or not 0 <= k < len(node):
+                raise ValueError(f"Nodul nu are copilul {k}: {list(path)}")
+            node = node[k]
+        return node
+
+    def node_info(self, path: Sequence[int] = ()) -> Tuple[bool, int]:
+        """(True, value) for a leaf or (False, number of children) for an internal node; only `path` is visited."""
+        if self.lazy is not None:
+            return self.lazy.node_info(path)
+        if self.flat is not None:
+            node = self.flat.node_at(path)
+            if node >= self.flat.first_leaf:
+                return True, int(self.flat.leaf_values[node - self.flat.first_leaf])
+            return False, int(self.flat.child_count[node])
+        node = self.subtree(path)
+        return (True, node) if isinstance(node, int) else (False, len(node))
 
     def _generate_node(self, depth: int) -> Node:
         if depth == 1:
@@ -26,6 +89,10 @@ class MinimaxTreeProblem:
         return [self._generate_node(depth - 1) for _ in range(num_children)]
 
     def run_minimax_alphabeta(self) -> Tuple[int, int]:
+        if self.lazy is not None:
+            return self.lazy.alphabeta()
+        if self.flat is not None:
+            return self.flat.alphabeta()
         leaves_evaluated = [0]
         
         def evaluate(node):
@@ -64,7 +131,18 @@ class MinimaxTreeProblem:
         root_val = alpha_beta_pruning(self.root, float('-inf'), float('inf'), True)
         return root_val, leaves_evaluated[0]
 
-    def total_leaves(self) -> int:
+    def total_leaves(self) -> Optional[int]:
+        """
+        Number of leaves, or None for a lazy tree that could hold more than LAZY_COUNT_THRESHOLD:
+        counting them would derive every internal node of a tree that is never stored.
+        """
+        if self.lazy is not None:
+            if self.branching ** (self.depth - 1) > LAZY_COUNT_THRESHOLD:
+                return None
+            return self.lazy.total_leaves()
+        if self.flat is not None:
+            return self.flat.total_leaves()
+
         def rec(node):
             if isinstance(node, int):
                 return 1
@@ -0,0 +1,5 @@
+import sys
+from pathlib import Path
+
+# testele importă modulele proiectului ca din rădăcina lui
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
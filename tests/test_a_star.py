@@ -0,0 +1,94 @@
+import heapq
+import random
+
+import pytest
+
+import algorithms.informed as informed
+from problems.base_problem import Problem
+from problems.graph_coloring import GraphColoringProblem
+from problems.graph_csr import planted_coloring_graph
+from problems.hanoi import GeneralizedHanoi
+from problems.n_queens import NQueensProblem
+
+
+class WeightedGrid(Problem):
+    """Grid with random step costs; the state carries the cost so far, so the returned goal shows it."""
+
+    def __init__(self, size, seed):
+        rng = random.Random(seed)
+        self.size = size
+        self.cost = {(r, c): rng.randint(1, 9) for r in range(size) for c in range(size)}
+
+    def initial_state(self):
+        return (0, 0, 0)
+
+    def is_goal(self, state):
+        return state[:2] == (self.size - 1, self.size - 1)
+
+    def successors(self, state):
+        r, c, g = state
+        for nr, nc in ((r + 1, c), (r, c + 1), (r - 1, c), (r, c - 1)):
+            if 0 <= nr < self.size and 0 <= nc < self.size:
+                yield (nr, nc, g + self.cost[(nr, nc)]), float(self.cost[(nr, nc)])
+
+    def heuristic(self, state):
+        # admisibil: fiecare pas costă cel puțin 1
+        return float(2 * (self.size - 1) - state[0] - state[1])
+
+    def dijkstra(self):
+        dist = {(0, 0): 0}
+        pq = [(0, 0, 0)]
+        while pq:
+            g, r, c = heapq.heappop(pq)
+            if g > dist[(r, c)]:
+                continue
+            for (nr, nc, ng), _ in self.successors((r, c, g)):
+                if ng < dist.get((nr, nc), float('inf')):
+                    dist[(nr, nc)] = ng
+                    heapq.heappush(pq, (ng, nr, nc))
+        return dist[(self.size - 1, self.size - 1)]
+
+
+class Counter(Problem):
+    """Unbounded state space without a goal."""
+
+    def __init__(self):
+        self.expanded = 0
+
+    def initial_state(self):
+        return 0
+
+    def is_goal(self, state):
+        return False
+
+    def successors(self, state):
+        self.expanded += 1
+        yield state + 1, 1.0
+        yield state + 2, 1.0
+
+
+@pytest.mark.parametrize("seed", range(5))
+def test_tie_break_keeps_a_star_optimal(seed):
+    problem = WeightedGrid(4, seed)
+    # stările diferă prin cost, deci A* vede fiecare drum; departajarea după h nu trebuie să schimbe optimul
+    assert informed.a_star(problem)[2] == problem.dijkstra()
+
+
+def test_max_nodes_bounds_the_expansions():
+    problem = Counter()
+    assert informed.a_star(problem, max_nodes=100) is None
+    assert problem.expanded <= 100
+
+
+@pytest.mark.parametrize("problem", [NQueensProblem(n) for n in range(4, 9)]
+                         + [GeneralizedHanoi(t, d) for t, d in ((3, 3), (3, 6), (4, 5), (4, 7))])
+def test_runner_budget_still_solves_other_problems(problem):
+    # bugetul de noduri al benchmark-ului pentru aceste probleme
+    assert problem.validate_solution(informed.a_star(problem, max_nodes=10000))[0]
+
+
+def test_a_star_colors_a_planted_graph():
+    graph, _ = planted_coloring_graph(60, 120, 3, seed=1)
+    problem = GraphColoringProblem(graph, 3)
+    result = informed.a_star(problem)
+    assert len(result) == 60 and problem.validate_solution(result)[0]
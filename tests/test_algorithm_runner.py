@@ -0,0 +1,15 @@
+import algorithms.uninformed as uninformed
+import algorithms.warnsdorff as warnsdorff
+from problems.knights_tour import KnightsTourProblem
+from problems.n_queens import NQueensProblem
+from utils.algorithm_runner import applicable_algorithms, run_benchmark_all_algorithms
+
+ALGOS = {"BFS": uninformed.bfs, "Warnsdorff": warnsdorff.warnsdorff}
+
+
+def test_specialized_algorithms_run_only_on_their_problem():
+    assert list(applicable_algorithms(NQueensProblem(6), ALGOS)) == ["BFS"]
+    assert list(applicable_algorithms(KnightsTourProblem(5), ALGOS)) == ["BFS", "Warnsdorff"]
+
+    times, validity = run_benchmark_all_algorithms(NQueensProblem(6), ALGOS)
+    assert set(times) == set(validity) == {"BFS"}
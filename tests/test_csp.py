@@ -0,0 +1,57 @@
+import random
+from collections import Counter
+
+from problems.csp import (ac3, backtrack, forward_checking, generate_solvable_csp_with_partial, is_consistent,
+                         map_operator, select_unassigned_variable)
+
+VARIABLES = ["A", "B", "C"]
+DOMAINS = {"A": [1, 2, 3], "B": [1, 2], "C": [1, 2, 3]}
+CONSTRAINTS = {"A": ["B"], "B": ["A", "C"], "C": ["B"]}
+TYPES = {("A", "B"): "<", ("B", "A"): ">", ("B", "C"): "!=", ("C", "B"): "!="}
+
+
+def test_select_unassigned_variable():
+    assert select_unassigned_variable(VARIABLES, {}, DOMAINS) == "A"
+    assert select_unassigned_variable(VARIABLES, {}, DOMAINS, "MRV") == "B"
+    assert select_unassigned_variable(VARIABLES, {"A": 1, "B": 2, "C": 1}, DOMAINS) is None
+
+
+def test_forward_checking_filters_free_neighbors_only():
+    assert forward_checking("B", 2, DOMAINS, CONSTRAINTS, TYPES, {"A": 1}) == {"A": [1, 2, 3], "B": [1, 2], "C": [1, 3]}
+    assert forward_checking("A", 3, DOMAINS, CONSTRAINTS, TYPES, {}) is None
+    assert DOMAINS["C"] == [1, 2, 3]
+
+
+def test_is_consistent():
+    assert is_consistent("B", 2, {"A": 1, "C": 1}, CONSTRAINTS, TYPES)
+    assert not is_consistent("B", 1, {"A": 1}, CONSTRAINTS, TYPES)
+    assert map_operator("=") == "=="
+
+
+def test_ac3_standalone_prunes_in_place_and_counts_revisions():
+    domains = {v: list(vals) for v, vals in DOMAINS.items()}
+    stats, trail = {}, []
+    assert ac3(domains, CONSTRAINTS, TYPES, trail=trail, stats=stats)
+    assert domains == {"A": [1], "B": [2], "C": [1, 3]}
+    assert stats["revisions"] > 0
+    for var, values in reversed(trail):
+        domains[var] = values
+    assert domains == DOMAINS
+
+
+def test_ac3_detects_a_wipe_out():
+    domains = {"A": [2, 3], "B": [1, 2], "C": [1]}
+    assert not ac3(domains, CONSTRAINTS, TYPES)
+
+
+def test_planted_csp_is_solvable_with_a_balanced_operator_mix():
+    random.seed(3)
+    ops = Counter()
+    for _ in range(200):
+        # max_attempts rămâne acceptat pentru apelurile vechi
+        variables, domains, constraints, types, partial = generate_solvable_csp_with_partial(
+            num_vars=10, num_constraints=20, max_attempts=5)
+        assert backtrack(dict(partial), variables, domains, constraints, types) is not None
+        ops.update(op for (x, y), op in types.items() if x < y)
+    total = sum(ops.values())
+    assert ops['='] / total > 0.15 and ops['!='] / total > 0.15
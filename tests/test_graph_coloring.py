@@ -0,0 +1,45 @@
+import random
+
+import pytest
+
+import algorithms.informed as informed
+from problems.graph_coloring import GraphColoringProblem
+from problems.graph_csr import planted_coloring_graph
+
+SEEDS = range(10)
+
+
+def _solved(algorithm, mode, seed):
+    graph, _ = planted_coloring_graph(30, 50, 3, seed=seed)
+    problem = GraphColoringProblem(graph.to_dict(), 3, mode=mode)
+    random.seed(seed)
+    result = algorithm(problem)
+    return result is not None and len(result) == 30 and problem.validate_solution(result)[0]
+
+
+@pytest.mark.parametrize("mode", ["path", "local"])
+@pytest.mark.parametrize("algorithm", [informed.hill_climbing, informed.simulated_annealing])
+def test_local_search_colors_planted_graphs(algorithm, mode):
+    # heuristic e un scor de maximizat: o căutare locală care îl vede scăzând la fiecare pas renunță imediat
+    assert sum(_solved(algorithm, mode, seed) for seed in SEEDS) >= 6
+
+
+def test_heuristic_and_cost_to_go_agree():
+    graph, _ = planted_coloring_graph(30, 50, 3, seed=0)
+    for mode in ("path", "local"):
+        problem = GraphColoringProblem(graph.to_dict(), 3, mode=mode)
+        state = problem.initial_state()
+        for _ in range(5):
+            assert problem.heuristic(state) == -problem.cost_to_go(state)
+            state = next(iter(problem.successors(state)))[0]
+
+
+def test_prefill_extends():
+    # drum 0-1-2: cu 2 culori capetele trebuie să aibă aceeași culoare
+    problem = GraphColoringProblem({0: {1}, 1: {0, 2}, 2: {1}}, 2)
+    problem.prefill({0: 0, 2: 1})
+    assert problem.prefill_extends() is False
+    problem.prefill({0: 1, 2: 1})
+    assert problem.prefill_extends() is True
+    problem.prefill(None)
+    assert problem.prefill_extends() is True
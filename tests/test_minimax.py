@@ -0,0 +1,17 @@
+from problems.minimax_tree import LAZY_COUNT_THRESHOLD, MinimaxTreeProblem
+
+
+def test_lazy_tree_counts_leaves_only_below_threshold():
+    small = MinimaxTreeProblem(branching=3, depth=5, lazy=True, seed=7)
+
+    def count(node):
+        return 1 if isinstance(node, int) else sum(count(c) for c in node)
+
+    assert small.total_leaves() == count(small.subtree())
+
+    big = MinimaxTreeProblem(branching=10, depth=9, lazy=True, seed=7)
+    assert 10 ** 8 > LAZY_COUNT_THRESHOLD
+    assert big.total_leaves() is None
+    assert big.lazy._total_leaves is None
+    root, visited = big.run_minimax_alphabeta()
+    assert big.leaf_min <= root <= big.leaf_max and visited > 0
@@ -0,0 +1,40 @@
+import pytest
+
+import algorithms.uninformed as uninformed
+from problems.hanoi import GeneralizedHanoi, frame_stewart_table
+from problems.n_queens import NQueensProblem
+
+
+def _is_path(problem, path):
+    return (path[0] == problem.initial_state() and problem.is_goal(path[-1])
+            and all(b in [s for s, _ in problem.successors(a)] for a, b in zip(path, path[1:])))
+
+
+def test_structures_for_four_peg_hanoi():
+    problem = GeneralizedHanoi(4, 12)
+    # 4^12 stări: bitset-ul are 2 MB oricare ar fi bugetul căutării
+    assert isinstance(uninformed.visited_set(problem), uninformed.BitsetVisited)
+    assert isinstance(uninformed.parent_table(problem, 10_000), uninformed.ReprParentTable)
+    assert isinstance(uninformed.parent_table(GeneralizedHanoi(4, 5), 10_000), uninformed.DenseParentTable)
+
+
+def test_index_state_inverts_state_index():
+    problem = GeneralizedHanoi(4, 5)
+    assert all(problem.state_index(problem.index_state(i)) == i for i in range(problem.num_states()))
+
+
+@pytest.mark.parametrize("towers, disks", [(3, 4), (4, 5), (3, 6)])
+@pytest.mark.parametrize("algorithm", [uninformed.bfs, uninformed.uniform_cost])
+def test_shortest_paths_on_hanoi(algorithm, towers, disks):
+    problem = GeneralizedHanoi(towers, disks)
+    path = algorithm(problem, max_nodes=100_000, return_path=True)
+    assert _is_path(problem, path)
+    assert len(path) - 1 == frame_stewart_table(towers, disks)[0][towers][disks]
+    assert algorithm(problem, max_nodes=100_000) == path[-1]
+
+
+@pytest.mark.parametrize("algorithm", [uninformed.bfs, uninformed.dfs, uninformed.uniform_cost])
+def test_paths_without_a_state_index(algorithm):
+    problem = NQueensProblem(6)
+    path = algorithm(problem, return_path=True)
+    assert _is_path(problem, path) and problem.validate_solution(path[-1])[0]
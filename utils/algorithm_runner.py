@@ -2,6 +2,19 @@ import time
 import inspect
 from utils.timing import time_function
 from utils.validation import validate_algo_result
+from algorithms.decomposition import by_components
+
+# peste această dimensiune a tablei doar algoritmii dedicați turului calului mai termină
+KNIGHTS_GENERIC_MAX_N = 30
+# algoritmii dedicați rulează doar pe problema lor; pentru celelalte nu apar în benchmark
+SPECIALIZED_ALGOS = {"Warnsdorff": "KnightsTourProblem"}
+
+
+def applicable_algorithms(problem, algo_funcs: dict) -> dict:
+    """The entries of algo_funcs that apply to problem: specialized ones only on their own problem class."""
+    problem_class = problem.__class__.__name__
+    return {name: func for name, func in algo_funcs.items()
+            if SPECIALIZED_ALGOS.get(name, problem_class) == problem_class}
 
 
 def run_benchmark_all_algorithms(problem, algo_funcs: dict):
@@ -22,15 +35,27 @@ def run_benchmark_all_algorithms(problem, algo_funcs: dict):
         step_cap = 5000
     
     local_search_algos = {"Hill Climbing", "Simulated Annealing", "Beam Search"}
-    
-    for name, func in algo_funcs.items():
+
+    if problem_class == 'GeneralizedHanoi':
+        print(f"Referință (Frame–Stewart): {problem.solution_length()} mutări")
+
+    for name, func in applicable_algorithms(problem, algo_funcs).items():
         try:
             if func is None:
                 results[name] = float('inf')
                 validity[name] = False
                 continue
+            if (problem_class == 'KnightsTourProblem' and problem.n > KNIGHTS_GENERIC_MAX_N
+                    and name not in SPECIALIZED_ALGOS):
+                print(f"{name} skipped: board {problem.n}x{problem.n} too large for generic search")
+                results[name] = float('inf')
+                validity[name] = False
+                continue
             
             algo_problem = _prepare_problem_for_algo(problem, name, local_search_algos)
+            if problem_class == 'GraphColoringProblem':
+                # componentele conexe se rezolvă independent
+                func = by_components(func)
             result = _execute_algorithm(func, algo_problem, name, node_cap, step_cap, per_algo_timeout)
             
             results[name] = result['time']
@@ -59,15 +84,17 @@ def _prepare_problem_for_algo(problem, algo_name: str, local_search_algos: set):
     if problem.__class__.__name__ != 'GraphColoringProblem':
         return problem
     
+    # păstrăm reprezentarea CSR, dacă instanța o are
+    graph = problem.csr if getattr(problem, 'csr', None) is not None else problem.graph
     if algo_name in local_search_algos:
         from problems.graph_coloring import GraphColoringProblem
-        algo_problem = GraphColoringProblem(problem.graph, problem.colors, mode='local')
+        algo_problem = GraphColoringProblem(graph, problem.colors, mode='local')
         if hasattr(problem, 'prefilled') and problem.prefilled is not None:
             algo_problem.prefill(problem.prefilled)
     else:
         if hasattr(problem, 'mode') and problem.mode != 'path':
             from problems.graph_coloring import GraphColoringProblem
-            algo_problem = GraphColoringProblem(problem.graph, problem.colors, mode='path')
+            algo_problem = GraphColoringProblem(graph, problem.colors, mode='path')
             if hasattr(problem, 'prefilled') and problem.prefilled is not None:
                 algo_problem.prefill(problem.prefilled)
         else:
@@ -91,7 +118,8 @@ def _execute_algorithm(func, problem, algo_name: str, node_cap: int, step_cap: i
         except TypeError:
             res = func(problem)
         elapsed = time.perf_counter() - t0
-        return {'time': elapsed, 'result': res, 'valid': True}
+        is_valid, _ = validate_algo_result(problem, res)
+        return {'time': elapsed, 'result': res, 'valid': is_valid}
     
     if sig and 'max_steps' in sig.parameters:
         t0 = time.perf_counter()
@@ -100,7 +128,8 @@ def _execute_algorithm(func, problem, algo_name: str, node_cap: int, step_cap: i
         except TypeError:
             res = func(problem)
         elapsed = time.perf_counter() - t0
-        return {'time': elapsed, 'result': res, 'valid': True}
+        is_valid, _ = validate_algo_result(problem, res)
+        return {'time': elapsed, 'result': res, 'valid': is_valid}
     
    
     res, t = time_function(func, problem, timeout=timeout)
@@ -0,0 +1,252 @@
+"""
+Headless batch solving of CSP instances given as JSONL, one instance per line:
+
+    {"id": "a", "variables": ["X0", "X1"], "domains": {"X0": [1, 2], "X1": [1, 2]},
+     "constraints": [["X0", "<", "X1"]], "partial": {"X0": 1},
+     "globals": [{"type": "alldifferent", "variables": ["X0", "X1"]}]}
+
+"partial" and "globals" are optional; a global is an alldifferent, a sum
+({"type": "sum", "variables", "coefficients", "op", "rhs"}) or a table
+({"type": "table", "variables", "tuples"}). Every line gets one result line:
+
+    {"id": "a", "line": 1, "solution": {"X0": 1, "X1": 2}, "nodes": 2, "seconds": 0.0001}
+
+with "solution": null for an unsolvable instance and "error" instead of the solution
+for a line that is not a valid instance.
+
+    python -m utils.csp_batch instances.jsonl -o results.jsonl --optimization AC-3 --workers 4
+    python -m utils.csp_batch --generate 1000 | python -m utils.csp_batch --unordered
+"""
+import argparse
+import json
+import os
+import random
+import sys
+import time
+from collections import deque
+from concurrent.futures import FIRST_COMPLETED, ProcessPoolExecutor, wait
+from itertools import islice
+from typing import Dict, Iterable, Iterator, Optional, TextIO
+
+from problems.csp import (OPERATORS, OPTIMIZATION_OPTIONS, backtrack, generate_solvable_csp_with_partial,
+                          generate_solvable_puzzle_csp)
+from problems.csp_globals import AllDifferent, LinearSum, Table
+
+REVERSED = {'<': '>', '>': '<', '<=': '>=', '>=': '<='}
+# sarcini trimise și încă nepreluate, per worker: ține pool-ul ocupat fără a citi tot fișierul
+TASKS_PER_WORKER = 4
+
+
+def _check_ints(values, what: str):
+    if not all(isinstance(x, int) and not isinstance(x, bool) for x in values):
+        raise ValueError(f"{what} trebuie să conțină doar numere întregi")
+
+
+def _parse_global(spec: dict, domains: dict):
+    kind = spec["type"]
+    if any(v not in domains for v in spec["variables"]):
+        raise ValueError(f"Constrângerea globală {kind} folosește variabile necunoscute")
+    if kind == "alldifferent":
+        return AllDifferent(spec["variables"])
+    if kind == "sum":
+        _check_ints([*spec["coefficients"], spec["rhs"]], "Suma")
+        return LinearSum(spec["variables"], spec["coefficients"], spec["op"], spec["rhs"])
+    if kind == "table":
+        for row in spec["tuples"]:
+            if len(row) != len(spec["variables"]):
+                raise ValueError("Tuplul din tabel nu are câte o valoare pentru fiecare variabilă")
+            _check_ints(row, "Tabelul")
+        return Table(spec["variables"], spec["tuples"])
+    raise ValueError(f"Constrângere globală necunoscută: {kind}")
+
+
+def _partial_consistent(constraint_types: dict, global_constraints, partial: dict) -> bool:
+    """
+    Constraints among the preassigned variables alone. The search only checks a constraint
+    when one of its variables is assigned, so a violation inside the partial assignment would
+    otherwise go unnoticed by some optimizations and be caught (by the pinned domains) by others.
+    """
+    for (x, y), op in constraint_types.items():
+        if x in partial and y in partial and not OPERATORS[op](partial[x], partial[y]):
+            return False
+    for c in global_constraints:
+        given = [v for v in c.variables if v in partial]
+        if len(given) == len(c.variables):
+            if not c.satisfied(partial):
+                return False
+        elif isinstance(c, AllDifferent) and len({partial[v] for v in given}) != len(given):
+            return False
+        elif isinstance(c, Table) and not any(all(row[k] == partial[v] for k, v in enumerate(c.variables)
+                                                  if v in partial) for row in c.tuples):
+            return False
+    return True
+
+
+def parse_instance(record: dict):
+    """
+    (variables, domains, constraints, constraint_types, global_constraints, partial_assignment)
+    of a decoded JSONL record, in the shapes problems.csp uses.
+    """
+    variables = list(record["variables"])
+    domains = {v: list(record["domains"][v]) for v in variables}
+    for v, dom in domains.items():
+        _check_ints(dom, f"Domeniul lui {v}")
+    constraints = {v: [] for v in variables}
+    constraint_types = {}
+    for x, op, y in record.get("constraints", ()):
+        if op not in OPERATORS or x not in domains or y not in domains:
+            raise ValueError(f"Constrângere invalidă: {x} {op} {y}")
+        op = '=' if op == '==' else op
+        if (x, y) not in constraint_types:
+            constraints[x].append(y)
+            constraints[y].append(x)
+        constraint_types[(x, y)] = op
+        constraint_types[(y, x)] = REVERSED.get(op, op)
+    global_constraints = [_parse_global(spec, domains) for spec in record.get("globals", ())]
+    partial = dict(record.get("partial", {}))
+    for v, x in partial.items():
+        if v not in domains:
+            raise ValueError(f"Asignarea parțială conține variabila necunoscută {v}")
+        _check_ints([x], "Asignarea parțială")
+        if x not in domains[v]:
+            raise ValueError(f"Valoarea {x} a lui {v} nu este în domeniul său")
+    return variables, domains, constraints, constraint_types, global_constraints, partial
+
+
+def instance_record(variables, domains, constraints, constraint_types, partial_assignment,
+                    global_constraints=(), instance_id=None) -> dict:
+    """The JSONL record of a CSP, the inverse of parse_instance."""
+    record = {"id": instance_id, "variables": list(variables), "domains": {v: list(domains[v]) for v in variables}}
+    record["constraints"] = [[x, constraint_types[(x, y)], y] for x in variables for y in constraints.get(x, ())
+                             if str(x) < str(y)]
+    record["partial"] = dict(partial_assignment)
+    specs = []
+    for c in global_constraints:
+        if isinstance(c, AllDifferent):
+            specs.append({"type": "alldifferent", "variables": list(c.variables)})
+        elif isinstance(c, LinearSum):
+            specs.append({"type": "sum", "variables": list(c.variables), "coefficients": list(c.coefficients),
+                          "op": c.op, "rhs": c.rhs})
+        else:
+            specs.append({"type": "table", "variables": list(c.variables), "tuples": [list(t) for t in c.tuples]})
+    if specs:
+        record["globals"] = specs
+    return record
+
+
+def solve_line(line_no: int, line: str, options: dict) -> dict:
+    """Result record of one input line; runs in the worker processes."""
+    result: Dict = {"id": None, "line": line_no}
+    try:
+        record = json.loads(line)
+        result["id"] = record.get("id")
+        variables, domains, constraints, constraint_types, global_constraints, partial = parse_instance(record)
+    except (ValueError, KeyError, TypeError, AttributeError) as e:
+        result["error"] = f"{type(e).__name__}: {e}"
+        return result
+    stats = {}
+    t0 = time.perf_counter()
+    try:
+        solution = None
+        if _partial_consistent(constraint_types, global_constraints, partial):
+            solution = backtrack(partial, variables, domains, constraints, constraint_types, stats=stats,
+                                 global_constraints=global_constraints, **options)
+    except Exception as e:
+        # o instanță care strică rezolvarea devine o linie de eroare, nu oprește fluxul
+        result["error"] = f"{type(e).__name__}: {e}"
+        return result
+    result["solution"] = solution
+    result["nodes"] = stats.get("nodes", 0)
+    for key in ("revisions", "restarts"):
+        if stats.get(key):
+            result[key] = stats[key]
+    result["seconds"] = round(time.perf_counter() - t0, 6)
+    return result
+
+
+def solve_stream(lines: Iterable[str], optimization: str = "FC", workers: Optional[int] = None,
+                 ordered: bool = True, in_flight: Optional[int] = None) -> Iterator[dict]:
+    """
+    Solve the JSONL instances of `lines` on a process pool with one of OPTIMIZATION_OPTIONS and
+    yield their result records, in input order or (ordered=False) as they finish. Lines are
+    read lazily and at most `in_flight` (default TASKS_PER_WORKER per worker) are submitted
+    and not yet yielded at any time, so memory does not grow with the input: in input order
+    a slow instance holds back the others, as completion order would not.
+    """
+    options = OPTIMIZATION_OPTIONS[optimization]
+    numbered = ((n, line) for n, line in enumerate(lines, 1) if line.strip())
+    workers = workers or os.cpu_count() or 1
+    in_flight = in_flight or TASKS_PER_WORKER * workers
+    with ProcessPoolExecutor(workers) as pool:
+
+        def submit(count):
+            return [pool.submit(solve_line, n, line, options) for n, line in islice(numbered, count)]
+
+        if ordered:
+            queue = deque(submit(in_flight))
+            while queue:
+                result = queue.popleft().result()
+                queue.extend(submit(1))
+                yield result
+        else:
+            running = set(submit(in_flight))
+            while running:
+                done, running = wait(running, return_when=FIRST_COMPLETED)
+                running |= set(submit(len(done)))
+                for future in done:
+                    yield future.result()
+
+
+def generate_instances(count: int, seed: Optional[int] = None, puzzles: bool = False) -> Iterator[dict]:
+    """`count` random solvable instances as JSONL records (planted CSPs or Latin-square puzzles)."""
+    rng_state = random.getstate()
+    random.seed(seed)
+    try:
+        for k in range(count):
+            if puzzles:
+                variables, domains, constraints, constraint_types, globals_, partial = generate_solvable_puzzle_csp()
+            else:
+                variables, domains, constraints, constraint_types, partial = generate_solvable_csp_with_partial(
+                    num_vars=random.randint(4, 12), num_constraints=random.randint(3, 15))
+                globals_ = ()
+            yield instance_record(variables, domains, constraints, constraint_types, partial, globals_, k)
+    finally:
+        random.setstate(rng_state)
+
+
+def _write_jsonl(records: Iterable[dict], out: TextIO):
+    for record in records:
+        out.write(json.dumps(record, ensure_ascii=False) + "\n")
+        out.flush()
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Rezolvă în lot instanțe CSP date ca JSONL.")
+    parser.add_argument("input", nargs="?", default="-", help="fișier JSONL, implicit stdin")
+    parser.add_argument("-o", "--output", default="-", help="fișier pentru rezultate, implicit stdout")
+    parser.add_argument("--optimization", default="FC", choices=list(OPTIMIZATION_OPTIONS))
+    parser.add_argument("--workers", type=int, default=None, help="procese, implicit câte CPU-uri")
+    parser.add_argument("--unordered", action="store_true", help="rezultatele în ordinea terminării")
+    parser.add_argument("--generate", type=int, metavar="N", help="scrie N instanțe aleatoare în loc să rezolve")
+    parser.add_argument("--puzzles", action="store_true", help="cu --generate: puzzle-uri cu AllDifferent")
+    parser.add_argument("--seed", type=int, default=None)
+    args = parser.parse_args(argv)
+
+    out = sys.stdout if args.output == "-" else open(args.output, "w", encoding="utf-8")
+    try:
+        if args.generate is not None:
+            _write_jsonl(generate_instances(args.generate, args.seed, args.puzzles), out)
+            return
+        src = sys.stdin if args.input == "-" else open(args.input, "r", encoding="utf-8")
+        try:
+            _write_jsonl(solve_stream(src, args.optimization, args.workers, not args.unordered), out)
+        finally:
+            if src is not sys.stdin:
+                src.close()
+    finally:
+        if out is not sys.stdout:
+            out.close()
+
+
+if __name__ == "__main__":
+    main()
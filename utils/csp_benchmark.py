@@ -0,0 +1,119 @@
+import random
+import time
+
+from problems.csp import (OPTIMIZATION_OPTIONS, backtrack, backtrack_all_solutions, decompose_alldifferent,
+                         generate_csp_random, generate_solvable_csp_with_partial, generate_solvable_puzzle_csp)
+
+# aceleași dimensiuni ca în modul "BKT cu optimizari" din interfață
+SIZES = {"Small (4)": 4, "Medium (6)": 6, "Large (8)": 8}
+
+# instanțe mai mari, unde căutarea cronologică se împotmolește: (tip, variabile, constrângeri)
+BACKJUMPING_INSTANCES = [("plantat", 12, 18), ("plantat", 16, 24), ("plantat", 20, 30),
+                         ("aleator", 15, 25), ("aleator", 20, 30)]
+BACKJUMPING_MODES = {"Simplu": {}, "FC": dict(use_fc=True), "AC-3": dict(use_ac3=True),
+                     "CBJ": dict(cbj=True), "FC-CBJ": dict(use_fc=True, cbj=True)}
+
+# (latura grilei, mod); FC cu != pe perechi depășește câteva minute de la latura 10
+PUZZLE_RUNS = [(6, "FC"), (6, "AC-3"), (8, "FC"), (8, "AC-3"), (10, "AC-3")]
+PUZZLE_MODES = {"FC": dict(use_fc=True, mrv="MRV"), "AC-3": dict(use_ac3=True, mrv="MRV")}
+
+
+def run_csp_benchmark(instances: int = 20, seed: int = 0):
+    """
+    Time the CSP engine on random solvable instances for every UI size and optimization:
+    first solution and full enumeration (the work the quiz does). Returns rows of
+    (size, optimization, first-solution seconds, first-solution nodes, all-solutions seconds,
+    solutions found, AC revisions during enumeration). Restarts only apply to the first solution.
+    """
+    rows = []
+    for size_name, num_vars in SIZES.items():
+        random.seed(seed)
+        csps = [generate_solvable_csp_with_partial(num_vars=num_vars) for _ in range(instances)]
+        for opt_name, opts in OPTIMIZATION_OPTIONS.items():
+            t0 = time.perf_counter()
+            first_stats = {}
+            for variables, domains, constraints, constraint_types, _ in csps:
+                backtrack({}, variables, domains, constraints, constraint_types, stats=first_stats, **opts)
+            first = time.perf_counter() - t0
+
+            opts = {k: v for k, v in opts.items() if k != "restarts"}
+
+            t0 = time.perf_counter()
+            found = 0
+            stats = {}
+            for variables, domains, constraints, constraint_types, _ in csps:
+                found += len(backtrack_all_solutions({}, variables, domains, constraints, constraint_types,
+                                                     stats=stats, **opts))
+            rows.append((size_name, opt_name, first, first_stats.get("nodes", 0), time.perf_counter() - t0, found,
+                         stats.get("revisions", 0)))
+    return rows
+
+
+def run_backjumping_benchmark(instances: int = 10, seed: int = 0):
+    """
+    First solution (or proof that there is none) with chronological backtracking, FC, AC-3,
+    CBJ and FC-CBJ on larger generated CSPs: planted solvable ones without a partial
+    assignment, and unrestricted random ones, which are mostly unsolvable. Returns rows of
+    (instance kind, variables, constraints, mode, instances solved, nodes, seconds).
+    """
+    rows = []
+    for kind, num_vars, num_constraints in BACKJUMPING_INSTANCES:
+        random.seed(seed)
+        if kind == "plantat":
+            csps = [generate_solvable_csp_with_partial(num_vars=num_vars, num_constraints=num_constraints,
+                                                       max_partial_vars=0)[:4] for _ in range(instances)]
+        else:
+            csps = [generate_csp_random(num_vars=num_vars, num_constraints=num_constraints)[:4]
+                    for _ in range(instances)]
+        for mode_name, opts in BACKJUMPING_MODES.items():
+            stats = {}
+            solved = 0
+            t0 = time.perf_counter()
+            for variables, domains, constraints, constraint_types in csps:
+                if backtrack({}, variables, domains, constraints, constraint_types, stats=stats, **opts) is not None:
+                    solved += 1
+            rows.append((kind, num_vars, num_constraints, mode_name, solved, stats.get("nodes", 0),
+                         time.perf_counter() - t0))
+    return rows
+
+
+def run_global_constraints_benchmark(instances: int = 5, seed: int = 0):
+    """
+    First solution of planted Latin-square puzzles (AllDifferent on rows and columns, plus
+    sums and tables, a quarter of the cells given), with the AllDifferent constraints as
+    globals (Régin under AC-3) and decomposed into pairwise '!='. Returns rows of
+    (grid size, mode, encoding, nodes, seconds).
+    """
+    rows = []
+    for size, mode_name in PUZZLE_RUNS:
+        random.seed(seed)
+        puzzles = [generate_solvable_puzzle_csp(size=size, max_partial_vars=size * size // 4)
+                   for _ in range(instances)]
+        for encoding in ("globală", "perechi"):
+            stats = {}
+            t0 = time.perf_counter()
+            for variables, domains, constraints, constraint_types, global_constraints, partial in puzzles:
+                if encoding == "perechi":
+                    constraints, constraint_types, global_constraints = decompose_alldifferent(
+                        constraints, constraint_types, global_constraints)
+                backtrack(dict(partial), variables, domains, constraints, constraint_types, stats=stats,
+                          global_constraints=global_constraints, **PUZZLE_MODES[mode_name])
+            rows.append((size, mode_name, encoding, stats.get("nodes", 0), time.perf_counter() - t0))
+    return rows
+
+
+if __name__ == "__main__":
+    print(f"{'Dimensiune':<12}{'Optimizare':<12}{'Prima (s)':>12}{'Noduri':>10}{'Toate (s)':>12}{'Soluții':>10}"
+          f"{'Revizii AC':>12}")
+    for size_name, opt_name, first, nodes, total, found, revisions in run_csp_benchmark():
+        print(f"{size_name:<12}{opt_name:<12}{first:>12.4f}{nodes:>10}{total:>12.4f}{found:>10}{revisions:>12}")
+
+    print()
+    print(f"{'Instanțe':<10}{'Var.':>6}{'Constr.':>9}  {'Mod':<10}{'Rezolvate':>10}{'Noduri':>12}{'Timp (s)':>10}")
+    for kind, num_vars, num_constraints, mode_name, solved, nodes, seconds in run_backjumping_benchmark():
+        print(f"{kind:<10}{num_vars:>6}{num_constraints:>9}  {mode_name:<10}{solved:>10}{nodes:>12}{seconds:>10.3f}")
+
+    print()
+    print(f"{'Grilă':<8}{'Mod':<8}{'AllDifferent':<14}{'Noduri':>10}{'Timp (s)':>10}")
+    for size, mode_name, encoding, nodes, seconds in run_global_constraints_benchmark():
+        print(f"{f'{size}x{size}':<8}{mode_name:<8}{encoding:<14}{nodes:>10}{seconds:>10.3f}")
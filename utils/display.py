@@ -1,3 +1,6 @@
+from typing import Optional
+
+
 def print_header(title: str):
     print("=" * 60)
     print(title.center(60))
@@ -79,10 +82,11 @@ def print_benchmark_results(times: dict, validity: dict, user_choice: str, user_
 
 
 def print_minimax_results(user_root: int, user_leaves: int, correct_root: int, 
-                         correct_visited: int, total_leaves: int, score: float, reason: str):
+                         correct_visited: int, total_leaves: Optional[int], score: float, reason: str):
     print("\nRăspuns corect:")
     print(f" - Valoarea rădăcinii = {correct_root}")
-    print(f" - Noduri frunză vizitate (Alpha-Beta) = {correct_visited} (total frunze în arbore = {total_leaves})")
+    total_text = total_leaves if total_leaves is not None else "nedisponibil pentru arborele lazy"
+    print(f" - Noduri frunză vizitate (Alpha-Beta) = {correct_visited} (total frunze în arbore = {total_text})")
     print(f"\nScorul tău: {score:.2f}%")
     print("Motiv:", reason)
 
@@ -112,39 +116,69 @@ def print_instance_generated():
     print("\nInstanță generată. Rulez benchmark pentru toți algoritmii (atenție: poate dura).")
 
 
-def print_minimax_tree(tree):
-    print("\n" + "=" * 70)
-    print("ARBORELE MINIMAX - STRUCTURĂ PE NIVELURI")
-    print("=" * 70 + "\n")
-    
-    def rec(node, level=0, is_max=True, prefix=""):
-        if isinstance(node, int):
-           
-            print(f"{prefix}FRUNZĂ: {node}")
+# arborii mari (în tablouri sau generați leneș) se afișează doar pe atâtea niveluri sub nodul ales
+# și cu atâția copii pe nod; restul apare restrâns, cu drumul care îl deschide
+MINIMAX_RENDER_LEVELS = 3
+MINIMAX_RENDER_CHILDREN = 10
+
+
+def minimax_tree_lines(tree, path=(), max_levels=None, max_children=None) -> list:
+    """
+    Lines of the drawing of `tree` (a MinimaxTreeProblem) from the node at `path` down. Nodes
+    are read through tree.node_info, so only the drawn ones are visited. Trees that are not
+    nested lists are limited by default to MINIMAX_RENDER_LEVELS levels and
+    MINIMAX_RENDER_CHILDREN children per node.
+    """
+    path = tuple(path)
+    if not tree.is_nested:
+        max_levels = MINIMAX_RENDER_LEVELS if max_levels is None else max_levels
+        max_children = MINIMAX_RENDER_CHILDREN if max_children is None else max_children
+    lines = []
+
+    def rec(node_path, level, is_max, prefix):
+        is_leaf, value = tree.node_info(node_path)
+        if is_leaf:
+            lines.append(f"{prefix}FRUNZĂ: {value}")
+            return
+        node_type = "MAX" if is_max else "MIN"
+        collapsed = max_levels is not None and level >= max_levels
+        more = f" ... (drum: {' '.join(map(str, node_path))})" if collapsed else ""
+        if level == 0:
+            if node_path:
+                lines.append(f"NOD {' '.join(map(str, node_path))} ({node_type}, cu {value} copii)")
+            else:
+                lines.append(f"RĂDĂCINĂ ({node_type})")
+            new_prefix = ""
         else:
-            node_type = "MAX" if is_max else "MIN"
-            child_count = len(node)
-            
+            lines.append(f"{prefix}{node_type} (cu {value} copii){more}")
+            new_prefix = prefix
+        if collapsed:
+            return
+
+        shown = value if max_children is None else min(value, max_children)
+        for i in range(shown):
+            is_last = (i == value - 1)
+            connector = "└─ " if is_last else "├─ "
             if level == 0:
-                print(f"RĂDĂCINĂ ({node_type})")
-                new_prefix = ""
+                child_prefix = connector
             else:
-                print(f"{prefix}{node_type} (cu {child_count} copii)")
-                new_prefix = prefix
-            
-            next_is_max = not is_max
-            for i, child in enumerate(node):
-                is_last = (i == len(node) - 1)
-               
-                if level == 0:
-                    connector = "└─ " if is_last else "├─ "
-                    child_prefix = connector
-                else:
-                    indent = "   " if is_last else "│  "
-                    connector = "└─ " if is_last else "├─ "
-                    child_prefix = new_prefix + indent + connector
-                
-                rec(child, level + 1, next_is_max, child_prefix)
-    
-    rec(tree.root, 0, True, "")
+                indent = "   " if is_last else "│  "
+                child_prefix = new_prefix + indent + connector
+            rec(node_path + (i,), level + 1, not is_max, child_prefix)
+        if shown < value:
+            indent = "" if level == 0 else new_prefix + "   "
+            lines.append(f"{indent}└─ ... încă {value - shown} copii "
+                         f"(drumuri: {' '.join(map(str, node_path + (shown,)))} ...)")
+
+    rec(path, 0, len(path) % 2 == 0, "")
+    return lines
+
+
+def print_minimax_tree(tree, path=(), max_levels=None):
+    lines = minimax_tree_lines(tree, path, max_levels)
+    print("\n" + "=" * 70)
+    print("ARBORELE MINIMAX - STRUCTURĂ PE NIVELURI")
+    print("=" * 70 + "\n")
+    for line in lines:
+        print(line)
     print("\n" + "=" * 70 + "\n")
@@ -2,9 +2,11 @@ import json
 import random
 from pathlib import Path
 
+from problems.csp import OPTIMIZATION_OPTIONS
+
 TEMPLATES = Path(__file__).resolve().parents[1] / "templates" / "question_templates.json"
 PROBLEMS = ["N-Queens", "Generalized Hanoi", "Graph Coloring", "Knight's Tour"]
-OPTIMIZATIONS = ["FC", "MRV", "AC-3"]
+OPTIMIZATIONS = list(OPTIMIZATION_OPTIONS)
 
 
 def load_templates():
@@ -1,7 +1,7 @@
-import random
 from problems.n_queens import NQueensProblem
 from problems.hanoi import GeneralizedHanoi
 from problems.graph_coloring import GraphColoringProblem
+from problems.graph_csr import load_graph, planted_coloring_graph
 from problems.knights_tour import KnightsTourProblem
 
 
@@ -17,30 +17,25 @@ def create_problem_instance(problem_name: str, prefill: bool = False, prefill_le
         prob = GeneralizedHanoi(pegs, discs, target)
     
     elif problem_name == "Graph Coloring":
-        nodes = int(input("Număr de noduri: "))
-        edges = int(input("Număr de muchii: "))
-        colors = int(input("Număr de culori disponibile: "))
-        
-       
-        graph = {i: set() for i in range(nodes)}
-        color_classes = [[] for _ in range(colors)]
-        for node in range(nodes):
-            color_classes[node % colors].append(node)
-        
-        attempts = 0
-        max_attempts = edges * 10
-        while attempts < edges and attempts < max_attempts:
-            c1, c2 = random.sample(range(colors), 2)
-            if color_classes[c1] and color_classes[c2]:
-                n1 = random.choice(color_classes[c1])
-                n2 = random.choice(color_classes[c2])
-                if n2 not in graph[n1]:
-                    graph[n1].add(n2)
-                    graph[n2].add(n1)
-                    attempts += 1
-        
-        print(f"Generated {attempts} edges (requested {edges})")
+        path = input("Fișier graf .col/.csr (gol = graf aleator): ").strip()
+        if path:
+            graph = load_graph(path)
+            print(f"Loaded {graph.num_nodes} nodes and {graph.num_edges} edges")
+            colors = int(input("Număr de culori disponibile: "))
+        else:
+            nodes = int(input("Număr de noduri: "))
+            edges = int(input("Număr de muchii: "))
+            colors = int(input("Număr de culori disponibile: "))
+
+            graph, attempts = planted_coloring_graph(nodes, edges, colors)
+            print(f"Generated {attempts} edges (requested {edges})")
         prob = GraphColoringProblem(graph, colors)
+        if path:
+            # doar un graf încărcat poate cere mai multe culori; cel generat are o colorare plantată
+            lower, upper, _ = prob.chromatic_number()
+            print(f"Chromatic number: {lower}" if lower == upper else f"Chromatic number between {lower} and {upper}")
+            if lower > colors:
+                print(f"Atenție: graful are nevoie de cel puțin {lower} culori, cu {colors} nu există soluție.")
     
     elif problem_name == "Knight's Tour":
         size = int(input("Dimensiune tablă (n): "))
@@ -56,5 +51,7 @@ def create_problem_instance(problem_name: str, prefill: bool = False, prefill_le
             prob.prefill_level(prefill_level)
         except Exception as e:
             print(f"Eroare la aplicare prefill: {e}")
+        if isinstance(prob, GraphColoringProblem) and prob.prefilled and prob.prefill_extends() is False:
+            print(f"Atenție: culorile din prefill nu se pot completa la o colorare cu {prob.colors} culori.")
     
     return prob